@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from brotli_asgi import BrotliMiddleware
+from cachetools import TTLCache, cached
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ..core.config import get_settings
 from ..core.logging import get_api_logger, setup_logging
-from ..storage.csv_repository import CsvRepository
+from ..models.concept import ScrapingStatus
+from ..scrapers.async_dian_scraper import create_http_client
+from ..storage.factory import create_repository
+from .conditional import conditional_get
 from .routes import admin, concepts
 
 
@@ -25,13 +31,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = get_api_logger()
     logger.info("Starting TaxBot API server")
     
-    # Initialize repository
-    app.state.repository = CsvRepository()
+    # Initialize repository and shared HTTP pool before serving requests
+    app.state.repository = create_repository()
+    app.state.http_client = create_http_client(get_settings())
+    
+    # Start background scraping workers
+    app.state.scrape_lock = asyncio.Lock()
+    app.state.scrape_status = ScrapingStatus(is_running=False)
+    app.state.scrape_queue = asyncio.Queue(maxsize=admin.SCRAPE_QUEUE_SIZE)
+    app.state.scrape_workers = admin.start_scrape_workers(
+        app.state.scrape_queue, app.state.scrape_status, app.state.http_client
+    )
     
     yield
     
     # Shutdown
     logger.info("Shutting down TaxBot API server")
+    for worker in app.state.scrape_workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.scrape_workers, return_exceptions=True)
+    await app.state.http_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -45,6 +64,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
     
@@ -57,27 +77,37 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Brotli at low quality is much cheaper than gzip for large JSON
+    # payloads; clients without "br" support still get gzip.
+    app.add_middleware(
+        BrotliMiddleware, quality=4, minimum_size=1000, gzip_fallback=True
+    )
+    
+    # Let clients revalidate concept reads with ETag/Last-Modified
+    app.middleware("http")(conditional_get)
     
     # Add request logging middleware
+    request_logger = get_api_logger()
+    
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log HTTP requests."""
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         # Process request
         response = await call_next(request)
         
-        # Calculate processing time
-        process_time = time.time() - start_time
+        # Calculate processing time (monotonic loop clock)
+        process_time = loop.time() - start_time
         
-        # Log request
-        logger = get_api_logger()
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
-        )
+        # Log request, skipping the formatting when INFO is filtered out
+        if request_logger.isEnabledFor(logging.INFO):
+            request_logger.info(
+                f"{request.method} {request.url.path} - "
+                f"Status: {response.status_code} - "
+                f"Time: {process_time:.3f}s"
+            )
         
         # Add timing header
         response.headers["X-Process-Time"] = str(process_time)
@@ -91,7 +121,7 @@ def create_app() -> FastAPI:
         logger = get_api_logger()
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
@@ -104,14 +134,22 @@ def create_app() -> FastAPI:
     app.include_router(concepts.router, prefix="/api/v1", tags=["concepts"])
     app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
     
+    # Probes hit these often; re-reading the CSV once per TTL is enough
+    @cached(TTLCache(maxsize=1, ttl=5))
+    def _cached_concept_count() -> int:
+        return app.state.repository.get_concept_count()
+    
+    @cached(TTLCache(maxsize=1, ttl=5))
+    def _cached_themes() -> list:
+        return app.state.repository.get_themes()
+    
     # Health check endpoint
     @app.get("/health", tags=["health"])
     async def health_check():
         """Health check endpoint."""
         try:
             # Check repository
-            repo = app.state.repository
-            concept_count = repo.get_concept_count()
+            concept_count = _cached_concept_count()
             
             return {
                 "status": "healthy",
@@ -126,7 +164,7 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger = get_api_logger()
             logger.error(f"Health check failed: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "status": "unhealthy",
@@ -140,9 +178,8 @@ def create_app() -> FastAPI:
     async def metrics():
         """Basic metrics endpoint."""
         try:
-            repo = app.state.repository
-            concept_count = repo.get_concept_count()
-            themes = repo.get_themes()
+            concept_count = _cached_concept_count()
+            themes = _cached_themes()
             
             return {
                 "concepts": {
@@ -157,7 +194,7 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger = get_api_logger()
             logger.error(f"Metrics collection failed: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"error": "Failed to collect metrics"}
             )
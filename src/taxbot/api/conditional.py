@@ -0,0 +1,69 @@
+"""Conditional GET support for the concept endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Set
+
+from fastapi import Request, Response
+
+# Only concept reads are derived purely from the stored data
+CONDITIONAL_PATH_PREFIX = "/api/v1/concepts"
+
+
+async def conditional_get(request: Request, call_next):
+    """Answer unchanged concept reads with 304 Not Modified."""
+    if request.method != "GET" or not request.url.path.startswith(
+        CONDITIONAL_PATH_PREFIX
+    ):
+        return await call_next(request)
+
+    tag, last_modified = request.app.state.repository.get_version()
+    # Weak tag: the compression middleware re-encodes the body
+    etag = f'W/"{tag}"'
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if _is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    # "*" matches only an existing representation, so the route decides
+    if "*" in _if_none_match(request):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since."""
+    if "if-none-match" in request.headers:
+        return etag in _if_none_match(request)
+
+    since = _parse_http_date(request.headers.get("if-modified-since"))
+    if since is None or last_modified is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _if_none_match(request: Request) -> Set[str]:
+    """Return the entity tags listed in If-None-Match."""
+    header = request.headers.get("if-none-match", "")
+    return {value.strip() for value in header.split(",") if value.strip()}
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an HTTP date header, ignoring malformed values."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
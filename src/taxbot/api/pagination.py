@@ -0,0 +1,31 @@
+"""Opaque keyset cursors for paginated concept listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Tuple
+
+from ..models.concept import Concept
+
+
+def encode_cursor(concept: Concept) -> str:
+    """Encode the ``(date, link)`` key of the last concept on a page."""
+    key = [concept.date.date().isoformat(), concept.link]
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(value: str) -> Tuple[str, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises ValueError for anything that is not a well-formed cursor.
+    """
+    try:
+        date, link = json.loads(base64.urlsafe_b64decode(value.encode("ascii")))
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {value}") from e
+
+    if not isinstance(date, str) or not isinstance(link, str):
+        raise ValueError(f"Invalid cursor: {value}")
+    return date, link
@@ -3,28 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import hmac
 from datetime import datetime
 from typing import List
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from ...core.config import get_settings
 from ...core.logging import get_api_logger
 from ...models.concept import ScrapingStatus
-from ...scrapers.dian_scraper import DianScraper
+from ...scrapers.async_dian_scraper import AsyncDianScraper
 from ...storage.repository import Repository
 
 router = APIRouter()
 logger = get_api_logger()
 
-# Global scraping status
-_scraping_status = ScrapingStatus(
-    is_running=False,
-    last_run=None,
-    total_concepts=0,
-    new_concepts=0,
-    errors=[]
-)
+# Background scraping worker pool
+SCRAPE_WORKERS = 4
+SCRAPE_QUEUE_SIZE = 16
 
 
 def get_repository(request: Request) -> Repository:
@@ -42,10 +40,10 @@ def verify_api_key(request: Request) -> bool:
         )
     
     # In production, use proper JWT validation
-    from ...core.config import get_settings
-    settings = get_settings()
-    
-    if api_key != settings.api_key:
+    # Constant-time comparison so response timing does not leak the key;
+    # bytes, because compare_digest rejects non-ASCII str
+    expected = get_settings().api_key.encode("utf-8")
+    if not hmac.compare_digest(api_key.encode("utf-8"), expected):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
@@ -61,35 +59,38 @@ async def trigger_scraping(
     _: bool = Depends(verify_api_key),
 ):
     """Trigger manual scraping."""
-    global _scraping_status
-    
-    if _scraping_status.is_running:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Scraping is already running"
-        )
-    
-    # Start scraping in background
-    asyncio.create_task(_run_scraping(repo))
+    state = request.app.state
     
-    _scraping_status.is_running = True
-    _scraping_status.errors = []
+    # Test-and-set under the lock so concurrent triggers cannot both start
+    async with state.scrape_lock:
+        if state.scrape_status.is_running:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Scraping is already running"
+            )
+        
+        state.scrape_status.is_running = True
+        state.scrape_status.errors = []
+        
+        # Hand the job to the worker pool started in the app lifespan
+        await state.scrape_queue.put(repo)
     
     logger.info("Manual scraping triggered")
-    return _scraping_status
+    return state.scrape_status
 
 
 @router.get("/status", response_model=ScrapingStatus)
 async def get_scraping_status(
-    request: Request = None,
+    request: Request,
     repo: Repository = Depends(get_repository),
 ):
     """Get current scraping status."""
     try:
         # Update status with current data
-        _scraping_status.total_concepts = repo.get_concept_count()
+        scraping_status = request.app.state.scrape_status
+        scraping_status.total_concepts = repo.get_concept_count()
         
-        return _scraping_status
+        return scraping_status
         
     except Exception as e:
         logger.error(f"Error getting scraping status: {e}")
@@ -109,13 +110,13 @@ async def reprocess_concepts(
         concepts_to_process = [c for c in concepts if not c.has_ai_content()]
         
         if not concepts_to_process:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"message": "No concepts need reprocessing"}
             )
         
         # Process with AI (this would need to be implemented)
         # For now, just return a message
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": f"Reprocessing {len(concepts_to_process)} concepts",
                 "concepts_to_process": len(concepts_to_process)
@@ -141,7 +142,7 @@ async def delete_concept(
             raise HTTPException(status_code=404, detail="Concept not found")
         
         logger.info(f"Deleted concept: {concept_id}")
-        return JSONResponse(content={"message": "Concept deleted successfully"})
+        return ORJSONResponse(content={"message": "Concept deleted successfully"})
         
     except HTTPException:
         raise
@@ -161,7 +162,7 @@ async def create_backup(
         backup_path = repo.backup()
         
         logger.info(f"Created backup: {backup_path}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": "Backup created successfully",
                 "backup_path": backup_path
@@ -173,51 +174,78 @@ async def create_backup(
         raise HTTPException(status_code=500, detail="Failed to create backup")
 
 
-async def _run_scraping(repo: Repository):
+def start_scrape_workers(
+    queue: asyncio.Queue,
+    scraping_status: ScrapingStatus,
+    http_client: httpx.AsyncClient,
+) -> List[asyncio.Task]:
+    """Start the fixed pool of scraping workers consuming ``queue``."""
+    return [
+        asyncio.create_task(_scrape_worker(queue, scraping_status, http_client))
+        for _ in range(SCRAPE_WORKERS)
+    ]
+
+
+async def _scrape_worker(
+    queue: asyncio.Queue,
+    scraping_status: ScrapingStatus,
+    http_client: httpx.AsyncClient,
+):
+    """Run queued scraping jobs one at a time."""
+    while True:
+        repo = await queue.get()
+        try:
+            await _run_scraping(repo, scraping_status, http_client)
+        finally:
+            queue.task_done()
+
+
+async def _run_scraping(
+    repo: Repository,
+    scraping_status: ScrapingStatus,
+    http_client: httpx.AsyncClient,
+):
     """Run scraping process in background."""
-    global _scraping_status
-    
     try:
         logger.info("Starting scraping process")
         
         # Initialize scraper
-        scraper = DianScraper()
+        scraper = AsyncDianScraper()
         
-        # Scrape concepts
-        concepts = scraper.scrape_concepts()
+        # Scrape concepts over the app's shared connection pool
+        concepts = await scraper.ascrape_concepts(http_client)
         
         if not concepts:
             logger.warning("No concepts found during scraping")
-            _scraping_status.errors.append("No concepts found")
+            scraping_status.errors.append("No concepts found")
             return
         
         # Filter new concepts
         existing_links = set()
         try:
-            existing_concepts = repo.get_concepts(limit=10000)  # Get all for comparison
-            existing_links = {c.link for c in existing_concepts}
+            existing_links = repo.get_existing_links([c.link for c in concepts])
         except Exception as e:
-            logger.warning(f"Error getting existing concepts: {e}")
+            logger.warning(f"Error getting existing links: {e}")
         
         new_concepts = [c for c in concepts if c.link not in existing_links]
         
         # Save new concepts
         if new_concepts:
             repo.save_concepts(new_concepts)
-            _scraping_status.new_concepts = len(new_concepts)
+            scraping_status.new_concepts = len(new_concepts)
             logger.info(f"Saved {len(new_concepts)} new concepts")
         else:
             logger.info("No new concepts to save")
         
         # Update status
-        _scraping_status.last_run = datetime.utcnow()
-        _scraping_status.total_concepts = repo.get_concept_count()
+        scraping_status.last_run = datetime.utcnow()
+        scraping_status.total_concepts = repo.get_concept_count()
         
         logger.info("Scraping process completed successfully")
         
     except Exception as e:
         logger.error(f"Scraping process failed: {e}")
-        _scraping_status.errors.append(str(e))
+        scraping_status.errors.append(str(e))
         
     finally:
-        _scraping_status.is_running = False
+        scraping_status.is_running = False
@@ -4,66 +4,88 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from ...core.cache import cached_concepts, cached_listing
 from ...core.logging import get_api_logger
 from ...models.concept import Concept, ConceptSearchRequest, ConceptSearchResponse
 from ...storage.repository import Repository
+from ..pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 logger = get_api_logger()
 
 
-def get_repository(request) -> Repository:
+def get_repository(request: Request) -> Repository:
     """Get repository from request state."""
     return request.app.state.repository
 
 
+def _cache_key(repo: Repository, *parts) -> tuple:
+    """Key a cached read to the data version it was loaded from.
+
+    Other processes (CLI scrapes, other workers) write without clearing
+    this process's caches; a new version makes their entries miss.
+    """
+    return (repo.get_version()[0], *parts)
+
+
 @router.get("/concepts", response_model=List[Concept])
 async def list_concepts(
     limit: int = Query(default=10, ge=1, le=100, description="Maximum results"),
     offset: int = Query(default=0, ge=0, description="Results offset"),
     theme: Optional[str] = Query(default=None, description="Filter by theme"),
+    after: Optional[str] = Query(
+        default=None,
+        description=(
+            "Keyset cursor from the X-Next-Cursor header; pass an empty "
+            "value to start from the newest concept. Replaces offset."
+        ),
+    ),
     request: Request = None,
+    response: Response = None,
     repo: Repository = Depends(get_repository),
 ):
     """List concepts with pagination and filtering."""
     try:
-        concepts = repo.get_concepts(
-            limit=limit,
-            offset=offset,
-            theme=theme,
-        )
+        if after is not None:
+            concepts = _list_concepts_page(repo, after, limit, theme, response)
+        else:
+            concepts = cached_listing(
+                _cache_key(repo, "concepts", limit, offset, theme),
+                lambda: repo.get_concepts(limit=limit, offset=offset, theme=theme),
+            )
         
         logger.info(f"Retrieved {len(concepts)} concepts")
         return concepts
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing concepts: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve concepts")
 
 
-@router.get("/concepts/{concept_id}", response_model=Concept)
-async def get_concept(
-    concept_id: str,
-    request: Request = None,
-    repo: Repository = Depends(get_repository),
-):
-    """Get a specific concept by ID."""
+def _list_concepts_page(
+    repo: Repository,
+    after: str,
+    limit: int,
+    theme: Optional[str],
+    response: Response,
+) -> List[Concept]:
+    """Fetch one keyset page and expose the cursor for the next one."""
     try:
-        concept = repo.get_concept_by_id(concept_id)
-        if not concept:
-            raise HTTPException(status_code=404, detail="Concept not found")
-        
-        logger.info(f"Retrieved concept: {concept_id}")
-        return concept
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting concept {concept_id}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve concept")
+        cursor = decode_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    concepts = cached_listing(
+        _cache_key(repo, "concepts_after", cursor, limit, theme),
+        lambda: repo.get_concepts_after(cursor, limit=limit, theme=theme),
+    )
+    if len(concepts) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(concepts[-1])
+    return concepts
 
 
 @router.post("/concepts/search", response_model=ConceptSearchResponse)
@@ -90,7 +112,7 @@ async def get_themes(
 ):
     """Get list of unique themes."""
     try:
-        themes = repo.get_themes()
+        themes = cached_concepts(_cache_key(repo, "themes"), repo.get_themes)
         
         logger.info(f"Retrieved {len(themes)} themes")
         return themes
@@ -108,7 +130,9 @@ async def get_latest_concepts(
 ):
     """Get latest concepts by date."""
     try:
-        concepts = repo.get_latest_concepts(limit=limit)
+        concepts = cached_concepts(
+            _cache_key(repo, "latest", limit), lambda: repo.get_latest_concepts(limit=limit)
+        )
         
         logger.info(f"Retrieved {len(concepts)} latest concepts")
         return concepts
@@ -116,3 +140,26 @@ async def get_latest_concepts(
     except Exception as e:
         logger.error(f"Error getting latest concepts: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve latest concepts")
+
+
+# Registered last so fixed paths like /concepts/themes take precedence
+@router.get("/concepts/{concept_id}", response_model=Concept)
+async def get_concept(
+    concept_id: str,
+    request: Request = None,
+    repo: Repository = Depends(get_repository),
+):
+    """Get a specific concept by ID."""
+    try:
+        concept = repo.get_concept_by_id(concept_id)
+        if not concept:
+            raise HTTPException(status_code=404, detail="Concept not found")
+        
+        logger.info(f"Retrieved concept: {concept_id}")
+        return concept
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting concept {concept_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve concept")
@@ -1,23 +1,18 @@
-"""CLI commands for TaxBot.
+"""Typer application for TaxBot.
 
-This module maintains backwards compatibility by registering all commands
-from the modular command files.
-
-For new commands, create a new file in cli/commands/ directory.
+Registers the commands from the modular command files. For new commands,
+create a new file in the cli/commands/ directory.
 """
 
 from __future__ import annotations
 
 import typer
 
-from .commands import (
-    list_concepts,
-    scrape,
-    serve,
-    status,
-    test_email,
-    test_ollama,
-)
+from .commands.list_cmd import list_concepts
+from .commands.scrape_cmd import scrape
+from .commands.server_cmd import serve
+from .commands.status_cmd import status
+from .commands.test_cmd import test_email, test_ollama
 
 app = typer.Typer(
     name="taxbot",
@@ -1,10 +1,22 @@
-"""CLI command modules."""
+"""CLI command modules.
 
-from .list_cmd import list_concepts
-from .scrape_cmd import scrape
-from .server_cmd import serve
-from .status_cmd import status
-from .test_cmd import test_email, test_ollama
+Command functions are resolved on first access so that importing one
+command (or ``--help``) does not load the dependencies of all the others.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "list_concepts": ".list_cmd",
+    "scrape": ".scrape_cmd",
+    "serve": ".server_cmd",
+    "status": ".status_cmd",
+    "test_email": ".test_cmd",
+    "test_ollama": ".test_cmd",
+    # Backwards compatible with the old ``taxbot.cli.commands:app`` entry point
+    "app": "..app",
+}
 
 __all__ = [
     "list_concepts",
@@ -14,3 +26,12 @@ __all__ = [
     "test_email",
     "test_ollama",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module providing ``name`` on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
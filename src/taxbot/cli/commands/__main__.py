@@ -0,0 +1,5 @@
+"""Allow ``python -m taxbot.cli.commands``."""
+
+from ..app import main
+
+main()
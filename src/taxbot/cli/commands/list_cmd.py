@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from ...core.logging import setup_logging
-from ...storage.csv_repository import CsvRepository
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 console = Console()
 
+RICH_TABLE_MAX_ROWS = 50
+
 
 def list_concepts(
     limit: int = typer.Option(
@@ -23,45 +29,54 @@ def list_concepts(
 
     console.print("Listing concepts...", style="bold blue")
 
+    # pandas and the storage backends are only needed once listing starts
+    from ...storage.factory import create_repository
+
     try:
-        repository = CsvRepository()
-        concepts = repository.get_concepts(limit=limit, theme=theme)
+        repository = create_repository()
+        df = repository.get_concepts_frame(limit=limit, theme=theme)
 
-        if not concepts:
+        if df.empty:
             console.print("No concepts found", style="yellow")
             return
 
-        _display_concepts_table(concepts)
-        console.print(f"\nShowing {len(concepts)} concepts", style="dim")
+        _display_concepts_table(df)
+        console.print(f"\nShowing {len(df)} concepts", style="dim")
 
     except Exception as e:
         console.print(f"Failed to list concepts: {e}", style="bold red")
 
 
-def _display_concepts_table(concepts) -> None:
+def _display_concepts_table(df: pd.DataFrame) -> None:
     """Display concepts in a formatted table."""
+    import pandas as pd
+
+    # Format whole columns at once instead of per row
+    rows = pd.DataFrame({
+        "Date": df["date"].dt.strftime("%Y-%m-%d").fillna(""),
+        "Theme": df["theme"].fillna("").astype(str),
+        "Title": _truncate_column(df["title"], 50),
+        "Link": _truncate_column(df["link"], 30),
+    })
+
+    # Rich styling costs grow per cell; large listings get a plain dump
+    if len(rows) > RICH_TABLE_MAX_ROWS:
+        console.out(rows.to_string(index=False), highlight=False)
+        return
+
     table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Date", style="cyan")
-    table.add_column("Theme", style="green")
-    table.add_column("Title", style="white")
-    table.add_column("Link", style="blue")
-
-    for concept in concepts:
-        title = _truncate_text(concept.title, 50)
-        link = _truncate_text(concept.link, 30)
-
-        table.add_row(
-            concept.date.strftime("%Y-%m-%d"),
-            concept.theme,
-            title,
-            link,
-        )
+    for column, style in zip(rows.columns, ("cyan", "green", "white", "blue")):
+        table.add_column(column, style=style)
+    for row in rows.itertuples(index=False, name=None):
+        table.add_row(*row)
 
     console.print(table)
 
 
-def _truncate_text(text: str, max_length: int) -> str:
-    """Truncate text with ellipsis if too long."""
-    if len(text) > max_length:
-        return text[:max_length] + "..."
-    return text
+def _truncate_column(values: pd.Series, max_length: int) -> pd.Series:
+    """Truncate text values with ellipsis if too long."""
+    values = values.fillna("").astype(str)
+    return values.where(
+        values.str.len() <= max_length,
+        values.str.slice(0, max_length) + "...",
+    )
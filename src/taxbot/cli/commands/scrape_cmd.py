@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List
 
 import typer
 from rich.console import Console
 
+from ...core.config import get_settings
 from ...core.logging import setup_logging, get_scraper_logger
-from ...notifications.email_service import EmailService
-from ...processors.ollama_processor import OllamaProcessor
-from ...scrapers.dian_scraper import DianScraper
-from ...storage.csv_repository import CsvRepository
+
+if TYPE_CHECKING:
+    from ...notifications.email_service import EmailService
+    from ...processors.ollama_processor import OllamaProcessor
+    from ...scrapers.async_dian_scraper import AsyncDianScraper
+    from ...storage.link_filter import LinkBloomFilter
+    from ...storage.repository import Repository
 
 console = Console()
 
+# Concepts are filtered, processed and saved in batches of this size
+SCRAPE_BATCH_SIZE = 32
+
+# Persisted Bloom filter of stored links, kept in the data directory
+LINK_FILTER_FILE = "concept_links.bloom"
+
 
 def scrape(
     dry_run: bool = typer.Option(
@@ -32,27 +45,8 @@ def scrape(
     logger = get_scraper_logger()
 
     try:
-        console.print(
-            "Starting DIAN concepts scraping...", style="bold blue"
-        )
-
-        concepts = _scrape_concepts()
-        if not concepts:
-            return
-
-        if dry_run:
-            _show_dry_run_results(concepts)
-            return
-
-        new_concepts = _filter_new_concepts(concepts, logger)
-        if not new_concepts:
-            return
-
-        new_concepts = _process_with_ai(new_concepts, process_ai)
-        _save_concepts(new_concepts)
-        _send_notifications(new_concepts, notify)
-
-        console.print("Scraping completed successfully!", style="bold green")
+        _install_uvloop()
+        asyncio.run(_scrape_async(dry_run, notify, process_ai, logger))
 
     except KeyboardInterrupt:
         console.print("\nScraping interrupted by user", style="yellow")
@@ -63,10 +57,100 @@ def scrape(
         sys.exit(1)
 
 
-def _scrape_concepts():
+def _install_uvloop() -> None:
+    """Use uvloop's libuv event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return  # Optional speedup; unavailable on Windows
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def _scrape_async(
+    dry_run: bool, notify: bool, process_ai: bool, logger
+) -> None:
+    """Run the scrape pipeline on one event loop."""
+    # Heavy dependencies load only when a scrape actually runs
+    from ...notifications.email_service import EmailService
+    from ...processors.ollama_processor import OllamaProcessor
+    from ...scrapers.async_dian_scraper import AsyncDianScraper
+    from ...storage.factory import create_repository
+
+    console.print(
+        "Starting DIAN concepts scraping...", style="bold blue"
+    )
+
+    scraper = AsyncDianScraper()
+    if dry_run:
+        concepts = await _scrape_concepts(scraper)
+        if concepts:
+            _show_dry_run_results(concepts)
+        return
+
+    # One instance of each service is shared by every pipeline step
+    repository = create_repository()
+    ai_processor = OllamaProcessor()
+    email_service = EmailService()
+
+    new_concepts = await _scrape_in_batches(
+        scraper, repository, ai_processor, process_ai, logger
+    )
+    if not new_concepts:
+        return
+
+    _send_notifications(new_concepts, notify, repository, email_service)
+
+    console.print("Scraping completed successfully!", style="bold green")
+
+
+async def _scrape_in_batches(
+    scraper: AsyncDianScraper,
+    repository: Repository,
+    ai_processor: OllamaProcessor,
+    process_ai: bool,
+    logger,
+) -> List:
+    """Filter, process and save concepts batch by batch as months arrive."""
+    from ...storage.link_filter import load_link_filter
+
+    filter_path = get_settings().data_dir / LINK_FILTER_FILE
+    link_filter = load_link_filter(repository, filter_path)
+    found = 0
+    saved = []
+    async for month_concepts in scraper.aiter_concepts():
+        found += len(month_concepts)
+        for batch in _batched(month_concepts, SCRAPE_BATCH_SIZE):
+            new_concepts = _filter_new_concepts(
+                batch, repository, link_filter, logger
+            )
+            if not new_concepts:
+                continue
+            new_concepts = await _process_with_ai(
+                new_concepts, process_ai, ai_processor
+            )
+            _save_batch(new_concepts, repository, link_filter)
+            saved.extend(new_concepts)
+
+    link_filter.save(filter_path)
+
+    if not found:
+        console.print("No concepts found", style="bold red")
+    elif not saved:
+        console.print("No new concepts to process", style="blue")
+    return saved
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Split items into lists of at most ``size`` elements."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _scrape_concepts(scraper: AsyncDianScraper):
     """Execute the scraping process."""
-    scraper = DianScraper()
-    concepts = scraper.scrape_concepts()
+    concepts = await scraper.ascrape_concepts()
 
     if not concepts:
         console.print("No concepts found", style="bold red")
@@ -83,21 +167,23 @@ def _show_dry_run_results(concepts) -> None:
         console.print(f"  - {concept.title} ({concept.theme})")
 
 
-def _filter_new_concepts(concepts, logger):
+def _filter_new_concepts(
+    concepts, repository: Repository, link_filter: LinkBloomFilter, logger
+):
     """Filter out existing concepts."""
-    repository = CsvRepository()
     existing_links = set()
 
+    # Filter misses are certainly new; only hits need the repository
+    maybe_existing = [c.link for c in concepts if c.link in link_filter]
     try:
-        existing_concepts = repository.get_concepts(limit=10000)
-        existing_links = {c.link for c in existing_concepts}
+        if maybe_existing:
+            existing_links = repository.get_existing_links(maybe_existing)
     except Exception as e:
-        logger.warning(f"Error getting existing concepts: {e}")
+        logger.warning(f"Error getting existing links: {e}")
 
     new_concepts = [c for c in concepts if c.link not in existing_links]
 
     if not new_concepts:
-        console.print("No new concepts to process", style="blue")
         return None
 
     console.print(
@@ -106,16 +192,17 @@ def _filter_new_concepts(concepts, logger):
     return new_concepts
 
 
-def _process_with_ai(concepts, process_ai: bool):
+async def _process_with_ai(
+    concepts, process_ai: bool, ai_processor: OllamaProcessor
+):
     """Process concepts with AI if enabled."""
     if not process_ai:
         return concepts
 
     console.print("Processing with AI analysis...", style="bold blue")
-    ai_processor = OllamaProcessor()
 
     if ai_processor.is_available():
-        concepts = ai_processor.process_concepts_batch(concepts)
+        concepts = await ai_processor.aprocess_concepts_batch(concepts)
         console.print("AI processing completed", style="bold green")
     else:
         console.print(
@@ -125,22 +212,40 @@ def _process_with_ai(concepts, process_ai: bool):
     return concepts
 
 
-def _save_concepts(concepts) -> None:
+def _save_concepts(concepts, repository: Repository) -> None:
     """Save concepts to repository."""
-    repository = CsvRepository()
     repository.save_concepts(concepts)
     console.print(
         f"Saved {len(concepts)} concepts to database", style="bold green"
     )
 
 
-def _send_notifications(concepts, notify: bool) -> None:
+def _save_batch(
+    concepts, repository: Repository, link_filter: LinkBloomFilter
+) -> None:
+    """Save a batch and add its links to the link filter.
+
+    The filter keeps its data version only while this process is the sole
+    writer; a write from elsewhere leaves it stale so the next run rebuilds it.
+    """
+    synced = link_filter.version == repository.get_version()[0]
+    _save_concepts(concepts, repository)
+    link_filter.update(c.link for c in concepts)
+    if synced:
+        link_filter.version = repository.get_version()[0]
+
+
+def _send_notifications(
+    concepts,
+    notify: bool,
+    repository: Repository,
+    email_service: EmailService,
+) -> None:
     """Send email notifications if enabled."""
     if not notify or not concepts:
         return
 
     console.print("Sending email notifications...", style="bold blue")
-    email_service = EmailService()
 
     if not email_service.is_configured():
         console.print(
@@ -148,9 +253,8 @@ def _send_notifications(concepts, notify: bool) -> None:
         )
         return
 
-    repository = CsvRepository()
     success = email_service.send_concept_notification(
-        concepts, repository.csv_path
+        concepts, getattr(repository, "csv_path", None)
     )
 
     if success:
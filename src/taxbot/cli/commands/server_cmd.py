@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import sys
+from typing import Optional
 
 import typer
-import uvicorn
 from rich.console import Console
 
+from ...core.config import get_settings
 from ...core.logging import setup_logging
 
 console = Console()
@@ -16,8 +17,14 @@ console = Console()
 def serve(
     host: str = typer.Option("0.0.0.0", "--host", help="Host to bind to"),
     port: int = typer.Option(8000, "--port", help="Port to bind to"),
-    workers: int = typer.Option(
-        1, "--workers", help="Number of worker processes"
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        help=(
+            "Number of worker processes (default: API_WORKERS, 1). Scrape "
+            "status and locking are per process, so keep one worker while "
+            "admin scrapes are used"
+        ),
     ),
     reload: bool = typer.Option(
         False, "--reload", help="Enable auto-reload for development"
@@ -30,12 +37,19 @@ def serve(
         f"Starting TaxBot API server on {host}:{port}", style="bold blue"
     )
 
+    if reload:
+        workers = 1
+    elif workers is None:
+        workers = get_settings().api_workers
+
+    import uvicorn
+
     try:
         uvicorn.run(
             "taxbot.api.app:app",
             host=host,
             port=port,
-            workers=workers if not reload else 1,
+            workers=workers,
             reload=reload,
             log_level="info",
         )
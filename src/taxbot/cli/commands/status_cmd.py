@@ -7,9 +7,6 @@ from rich.table import Table
 
 from ...core.config import get_settings
 from ...core.logging import setup_logging
-from ...notifications.email_service import EmailService
-from ...processors.ollama_processor import OllamaProcessor
-from ...storage.csv_repository import CsvRepository
 
 console = Console()
 
@@ -49,10 +46,12 @@ def _show_configuration() -> None:
 
 def _show_database_status() -> None:
     """Display database status."""
+    from ...storage.factory import create_repository
+
     console.print("\nDatabase Status:", style="bold")
 
     try:
-        repository = CsvRepository()
+        repository = create_repository()
         concept_count = repository.get_concept_count()
         themes = repository.get_themes()
 
@@ -62,7 +61,7 @@ def _show_database_status() -> None:
 
         db_table.add_row("Total Concepts", str(concept_count))
         db_table.add_row("Unique Themes", str(len(themes)))
-        db_table.add_row("Database File", str(repository.csv_path))
+        db_table.add_row("Database File", str(getattr(repository, "csv_path", None) or repository.db_path))
 
         console.print(db_table)
 
@@ -72,6 +71,8 @@ def _show_database_status() -> None:
 
 def _show_ollama_status() -> None:
     """Display Ollama status."""
+    from ...processors.ollama_processor import OllamaProcessor
+
     console.print("\nOllama Status:", style="bold")
 
     try:
@@ -93,6 +94,8 @@ def _show_ollama_status() -> None:
 
 def _show_email_status() -> None:
     """Display email status."""
+    from ...notifications.email_service import EmailService
+
     console.print("\nEmail Status:", style="bold")
 
     try:
@@ -5,14 +5,14 @@ from __future__ import annotations
 from rich.console import Console
 
 from ...core.logging import setup_logging
-from ...notifications.email_service import EmailService
-from ...processors.ollama_processor import OllamaProcessor
 
 console = Console()
 
 
 def test_email() -> None:
     """Test email configuration."""
+    from ...notifications.email_service import EmailService
+
     setup_logging()
 
     console.print("Testing email configuration...", style="bold blue")
@@ -37,6 +37,8 @@ def test_email() -> None:
 
 def test_ollama() -> None:
     """Test Ollama connection."""
+    from ...processors.ollama_processor import OllamaProcessor
+
     setup_logging()
 
     console.print("Testing Ollama connection...", style="bold blue")
@@ -0,0 +1,41 @@
+"""In-process TTL caches for concept read endpoints."""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable, TypeVar
+
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+# Themes and latest concepts only change when concepts are saved
+_concepts_cache: TTLCache = TTLCache(maxsize=64, ttl=300)
+
+# Paginated listings are more varied, so they expire sooner
+_listing_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+
+
+def cached_concepts(key: Hashable, loader: Callable[[], T]) -> T:
+    """Return a cached theme/latest result, loading it on a miss."""
+    return _get_or_load(_concepts_cache, key, loader)
+
+
+def cached_listing(key: Hashable, loader: Callable[[], T]) -> T:
+    """Return a cached concept listing, loading it on a miss."""
+    return _get_or_load(_listing_cache, key, loader)
+
+
+def invalidate_concepts_cache() -> None:
+    """Drop every cached concept result after the stored data changes."""
+    _concepts_cache.clear()
+    _listing_cache.clear()
+
+
+def _get_or_load(cache: TTLCache, key: Hashable, loader: Callable[[], T]) -> T:
+    """Look up ``key`` in ``cache`` and fill it from ``loader`` if missing."""
+    try:
+        return cache[key]
+    except KeyError:
+        value = loader()
+        cache[key] = value
+        return value
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
+from email.utils import getaddresses
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Optional, Tuple
 
 from pydantic import BaseSettings, EmailStr, Field, validator
 
@@ -30,11 +31,13 @@ class Settings(BaseSettings):
     ollama_model: str = Field(default="llama3", env="OLLAMA_MODEL")
     ollama_base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
     ollama_timeout: int = Field(default=300, env="OLLAMA_TIMEOUT")
+    ollama_max_concurrency: int = Field(default=8, env="OLLAMA_MAX_CONCURRENCY")
+    ollama_batch_size: int = Field(default=4, env="OLLAMA_BATCH_SIZE")
 
     # Email Configuration
     email_sender: Optional[EmailStr] = Field(default=None, env="DIAN_EMAIL_SENDER")
     email_password: Optional[str] = Field(default=None, env="DIAN_EMAIL_PASSWORD")
-    email_recipients: List[EmailStr] = Field(default_factory=list, env="DIAN_EMAIL_RECIPIENTS")
+    email_recipients: Tuple[str, ...] = Field(default=(), env="DIAN_EMAIL_RECIPIENTS")
     email_smtp_host: str = Field(default="smtp.gmail.com", env="EMAIL_SMTP_HOST")
     email_smtp_port: int = Field(default=465, env="EMAIL_SMTP_PORT")
     email_smtp_use_tls: bool = Field(default=True, env="EMAIL_SMTP_USE_TLS")
@@ -42,6 +45,8 @@ class Settings(BaseSettings):
     # Scraping Configuration
     scraper_delay: float = Field(default=1.0, env="SCRAPER_DELAY")
     scraper_timeout: int = Field(default=30, env="SCRAPER_TIMEOUT")
+    scraper_max_connections: int = Field(default=16, env="SCRAPER_MAX_CONNECTIONS")
+    scraper_async: bool = Field(default=True, env="SCRAPER_ASYNC")
     scraper_retry_attempts: int = Field(default=3, env="SCRAPER_RETRY_ATTEMPTS")
     scraper_retry_delay: float = Field(default=5.0, env="SCRAPER_RETRY_DELAY")
     scraper_max_text_length: int = Field(default=12000, env="SCRAPER_MAX_TEXT_LENGTH")
@@ -49,6 +54,7 @@ class Settings(BaseSettings):
     # Data Storage
     data_dir: Path = Field(default=Path("./data"), env="DATA_DIR")
     csv_backup_count: int = Field(default=5, env="CSV_BACKUP_COUNT")
+    storage_backend: str = Field(default="csv", env="STORAGE_BACKEND")
 
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -59,10 +65,13 @@ class Settings(BaseSettings):
 
     @validator("email_recipients", pre=True)
     def parse_email_recipients(cls, v):
-        """Parse comma-separated email recipients."""
-        if isinstance(v, str):
-            return [email.strip() for email in v.split(",") if email.strip()]
-        return v
+        """Parse comma-separated email recipients in one getaddresses sweep."""
+        entries = [v] if isinstance(v, str) else [str(entry) for entry in v]
+        recipients = tuple(addr for _, addr in getaddresses(entries) if addr)
+        for addr in recipients:
+            if "@" not in addr:
+                raise ValueError(f"Invalid email recipient: {addr}")
+        return recipients
 
     @validator("data_dir", pre=True)
     def resolve_data_dir(cls, v):
@@ -87,6 +96,14 @@ class Settings(BaseSettings):
             raise ValueError("Log format must be 'text' or 'json'")
         return v.lower()
 
+    @validator("storage_backend")
+    def validate_storage_backend(cls, v):
+        """Validate storage backend."""
+        valid_backends = ["csv", "sqlite"]
+        if v.lower() not in valid_backends:
+            raise ValueError("Storage backend must be 'csv' or 'sqlite'")
+        return v.lower()
+
     class Config:
         """Pydantic configuration."""
 
@@ -94,13 +111,27 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+        @classmethod
+        def parse_env_var(cls, field_name: str, raw_val: str) -> Any:
+            """Leave recipients as text so the comma-separated form parses."""
+            if field_name == "email_recipients":
+                return raw_val
+            return cls.json_loads(raw_val)
+        # Read-only after load; reload_settings() builds a new instance.
+        # (frozen=True would also add a __hash__ that fails on list fields.)
+        allow_mutation = False
 
-# Global settings instance
-settings = Settings()
+
+# Global settings instance, built on first use so importing taxbot does not
+# parse the environment (tests may assign it directly to override it)
+settings: Optional[Settings] = None
 
 
 def get_settings() -> Settings:
     """Get application settings."""
+    global settings
+    if settings is None:
+        settings = Settings()
     return settings
 
 
@@ -0,0 +1,133 @@
+"""Queue-backed, buffered file handlers used by setup_logging."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import TextIO
+
+# Bounded so a stalled disk slows producers instead of growing memory
+LOG_QUEUE_SIZE = 10000
+LOG_FILES = ("taxbot.log", "scraper.log", "api.log")
+
+# Write buffer of each log file; flushed when the queue drains
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class FileQueueHandler(logging.handlers.QueueHandler):
+    """Queue formatted records for one log file written by the listener."""
+
+    def __init__(self, log_queue: queue.Queue, log_file: str):
+        """Initialize handler feeding ``log_file`` through ``log_queue``."""
+        super().__init__(log_queue)
+        self.log_file = log_file
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Format in the caller thread and tag the destination file."""
+        record = super().prepare(record)
+        record.stack_info = None  # Already part of the formatted message
+        record.log_file = self.log_file
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Block when the queue is full rather than dropping the record."""
+        self.queue.put(record)
+
+
+class LogFileFilter(logging.Filter):
+    """Pass only the records queued for one log file."""
+
+    def __init__(self, log_file: str):
+        """Initialize filter for ``log_file``."""
+        super().__init__()
+        self.log_file = log_file
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check the destination tag set by FileQueueHandler."""
+        return getattr(record, "log_file", None) == self.log_file
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that writes into a buffer instead of flushing.
+
+    The stock handler stats the path, formats twice, seeks, tells and
+    flushes for every record. This one formats once, tracks the file size
+    in memory and only flushes for WARNING and above; the listener
+    flushes the rest whenever the queue runs dry.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize handler and record the current file size."""
+        super().__init__(*args, **kwargs)
+        self._size = self.stream.tell() if self.stream else 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one record, rotating first if it would exceed maxBytes."""
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is in bytes; non-ASCII text encodes to more than len()
+            size = len(msg.encode(self.encoding or "utf-8"))
+            # Never rotate an empty file, even for an oversized record
+            if 0 < self.maxBytes <= self._size + size and self._size:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:  # noqa: N802 - overrides logging API
+        """Rotate the files and restart the size count."""
+        super().doRollover()
+        self._size = 0
+
+    def _open(self) -> TextIO:
+        """Open the log file with a larger write buffer."""
+        return self._builtin_open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers once the queue is empty.
+
+    Bursts of records are written with one flush at the end, while a
+    lone record still reaches the disk right away.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle a record, then flush if nothing else is waiting."""
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def start_file_listener(log_queue: queue.Queue, log_dir: Path) -> None:
+    """Write queued records to the rotating log files on a background thread."""
+    handlers = []
+    for log_file in LOG_FILES:
+        handler = BufferedRotatingFileHandler(
+            log_dir / log_file,
+            maxBytes=10485760,  # 10MB
+            backupCount=5,
+            encoding="utf-8",
+        )
+        handler.addFilter(LogFileFilter(log_file))
+        handlers.append(handler)
+
+    listener = FlushingQueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
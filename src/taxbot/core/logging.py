@@ -5,16 +5,111 @@ from __future__ import annotations
 import json
 import logging
 import logging.config
+import queue
 import sys
+import time
+from datetime import date
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from .config import get_settings
+from .log_handlers import LOG_QUEUE_SIZE, FileQueueHandler, start_file_listener
+
+# Set once handlers are installed so repeated calls are no-ops
+_configured = False
+
+
+# LogRecord attributes that are not user-supplied "extra" fields
+_RESERVED = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "message",
+        "asctime",
+    }
+)
+
+
+# Extra values both serializers already encode the same way
+_JSON_NATIVE = (str, int, float, type(None), list, dict)
+
+
+def _to_native(value: Any) -> Any:
+    """Convert an extra field value to a JSON-native type up front.
+
+    orjson and the json fallback disagree on non-native values (e.g. the
+    datetime format), so normalize them before either one sees them.
+    """
+    if isinstance(value, _JSON_NATIVE):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return _to_native(value.value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    if isinstance(value, BaseException):
+        return repr(value)
+    return str(value)
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry; ``default`` only catches nested exotic values."""
+    try:
+        import orjson  # Deferred: only the JSON log format needs it
+    except ImportError:  # pragma: no cover - orjson is a core dependency
+        return json.dumps(log_entry, default=str)
+    return orjson.dumps(
+        log_entry, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted date and time) of the last record
+        self._second_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(  # noqa: N802 - overrides logging.Formatter
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Format the record time, reusing the date part within a second."""
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached = self._second_cache
+        if cached[0] != second:
+            formatted = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            cached = self._second_cache = (second, formatted)
+        return self.default_msec_format % (cached[1], record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
@@ -33,42 +128,28 @@ class JSONFormatter(logging.Formatter):
 
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-            }:
-                log_entry[key] = value
+            if key not in _RESERVED:
+                log_entry[key] = _to_native(value)
 
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
 
 
 def setup_logging() -> None:
-    """Configure application logging."""
+    """Configure application logging (only the first call has an effect)."""
+    global _configured
+    if _configured:
+        return
+
     settings = get_settings()
 
     # Create logs directory
     log_dir = settings.data_dir / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # File handlers only enqueue; a listener thread does the disk I/O
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    start_file_listener(log_queue, log_dir)
+
     # Configure logging
     log_config: Dict[str, Any] = {
         "version": 1,
@@ -90,28 +171,25 @@ def setup_logging() -> None:
                 "stream": sys.stdout,
             },
             "file": {
-                "class": "logging.handlers.RotatingFileHandler",
+                "()": FileQueueHandler,
                 "level": settings.log_level,
                 "formatter": settings.log_format,
-                "filename": log_dir / "taxbot.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
+                "log_queue": log_queue,
+                "log_file": "taxbot.log",
             },
             "scraper": {
-                "class": "logging.handlers.RotatingFileHandler",
+                "()": FileQueueHandler,
                 "level": settings.log_level,
                 "formatter": settings.log_format,
-                "filename": log_dir / "scraper.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
+                "log_queue": log_queue,
+                "log_file": "scraper.log",
             },
             "api": {
-                "class": "logging.handlers.RotatingFileHandler",
+                "()": FileQueueHandler,
                 "level": settings.log_level,
                 "formatter": settings.log_format,
-                "filename": log_dir / "api.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
+                "log_queue": log_queue,
+                "log_file": "api.log",
             },
         },
         "loggers": {
@@ -143,8 +221,10 @@ def setup_logging() -> None:
     }
 
     logging.config.dictConfig(log_config)
+    _configured = True
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get logger for the given name."""
     return logging.getLogger(f"taxbot.{name}")
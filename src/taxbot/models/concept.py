@@ -8,6 +8,17 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, validator
 
+# Basic URL validation, compiled once for every concept validated
+_URL_RE = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
+    r"localhost|"  # localhost...
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+
 
 class Concept(BaseModel):
     """DIAN concept domain model."""
@@ -21,67 +32,41 @@ class Concept(BaseModel):
     summary: Optional[str] = Field(default=None, description="AI-generated summary")
     analysis: Optional[str] = Field(default=None, description="AI-generated analysis")
 
+    # Strings arrive already stripped (Config.anystr_strip_whitespace)
+
     @validator("title")
     def validate_title(cls, v: str) -> str:
-        """Validate and clean title."""
-        if not v or not v.strip():
+        """Validate title."""
+        if not v:
             raise ValueError("Title cannot be empty")
-        return v.strip()
+        return v
 
     @validator("theme")
     def validate_theme(cls, v: str) -> str:
-        """Validate and clean theme."""
-        if not v or not v.strip():
-            return "Sin tema"
-        return v.strip()
-
-    @validator("descriptor")
-    def validate_descriptor(cls, v: str) -> str:
-        """Validate and clean descriptor."""
-        return v.strip() if v else ""
+        """Default an empty theme."""
+        return v or "Sin tema"
 
     @validator("link")
     def validate_link(cls, v: str) -> str:
         """Validate URL format."""
-        if not v or not v.strip():
+        if not v:
             raise ValueError("Link cannot be empty")
-        
-        # Basic URL validation
-        url_pattern = re.compile(
-            r"^https?://"  # http:// or https://
-            r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
-            r"localhost|"  # localhost...
-            r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-            r"(?::\d+)?"  # optional port
-            r"(?:/?|[/?]\S+)$",
-            re.IGNORECASE,
-        )
-        
-        if not url_pattern.match(v):
-            raise ValueError("Invalid URL format")
-        
-        return v.strip()
 
-    @validator("full_text")
-    def validate_full_text(cls, v: str) -> str:
-        """Validate and clean full text."""
-        return v.strip() if v else ""
+        if not _URL_RE.match(v):
+            raise ValueError("Invalid URL format")
 
-    @validator("summary")
-    def validate_summary(cls, v: Optional[str]) -> Optional[str]:
-        """Validate and clean summary."""
-        return v.strip() if v else None
+        return v
 
-    @validator("analysis")
-    def validate_analysis(cls, v: Optional[str]) -> Optional[str]:
-        """Validate and clean analysis."""
-        return v.strip() if v else None
+    @validator("summary", "analysis")
+    def validate_ai_text(cls, v: Optional[str]) -> Optional[str]:
+        """Store empty AI output as None."""
+        return v or None
 
     def to_record(self) -> dict[str, str]:
         """Convert to dictionary for CSV storage."""
         return {
             "title": self.title,
-            "date": self.date.strftime("%Y-%m-%d"),
+            "date": self.date.date().isoformat(),
             "theme": self.theme,
             "descriptor": self.descriptor,
             "link": self.link,
@@ -91,15 +76,30 @@ class Concept(BaseModel):
 
     @classmethod
     def from_record(cls, record: dict[str, str]) -> Concept:
-        """Create from dictionary record."""
+        """Create from dictionary record.
+
+        Accepts raw CSV strings as well as dataframe rows, where dates
+        are already parsed and empty cells are NaN.
+        """
+        def text(key: str, default: str = "") -> str:
+            value = record.get(key)
+            return value if isinstance(value, str) else default
+
+        date = record.get("date")
+        # Empty cells arrive as NaN or NaT; only those differ from themselves
+        if not date or date != date:
+            date = "1900-01-01"
+        if not isinstance(date, datetime):
+            date = datetime.fromisoformat(date)
+
         return cls(
-            title=record.get("title", ""),
-            date=datetime.strptime(record.get("date", "1900-01-01"), "%Y-%m-%d"),
-            theme=record.get("theme", "Sin tema"),
-            descriptor=record.get("descriptor", ""),
-            link=record.get("link", ""),
-            summary=record.get("summary") or None,
-            analysis=record.get("analysis") or None,
+            title=text("title"),
+            date=date,
+            theme=text("theme", "Sin tema"),
+            descriptor=text("descriptor"),
+            link=text("link"),
+            summary=text("summary") or None,
+            analysis=text("analysis") or None,
         )
 
     def has_ai_content(self) -> bool:
@@ -120,6 +120,8 @@ class Concept(BaseModel):
     class Config:
         """Pydantic configuration."""
 
+        # Strip every str field in the compiled validator, not in Python
+        anystr_strip_whitespace = True
         json_encoders = {
             datetime: lambda v: v.strftime("%Y-%m-%d %H:%M:%S"),
         }
@@ -2,25 +2,51 @@
 
 from __future__ import annotations
 
-import smtplib
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import io
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from ..core.config import get_settings
 from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
 
+if TYPE_CHECKING:
+    from email.message import EmailMessage
+
+    from .smtp_connection import SmtpConnection
+
+
+# Provider-specific SMTP settings: (host, port, use_tls)
+_PROVIDER_SETTINGS = MappingProxyType({
+    "gmail.com": ("smtp.gmail.com", 587, True),
+    "outlook.com": ("smtp-mail.outlook.com", 587, True),
+    "hotmail.com": ("smtp-mail.outlook.com", 587, True),
+    "yahoo.com": ("smtp.mail.yahoo.com", 587, True),
+    "live.com": ("smtp-mail.outlook.com", 587, True),
+})
+_DEFAULT_SMTP_SETTINGS = ("smtp.gmail.com", 587, True)
+
+
+@lru_cache(maxsize=1)
+def _retry_decorator() -> Callable:
+    """Build the SMTP retry policy; tenacity loads only when mail is sent."""
+    import smtplib
+
+    from tenacity import (
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_exponential,
+    )
+
+    return retry(
+        retry=retry_if_exception_type((smtplib.SMTPException, ConnectionError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+    )
+
 
 class EmailService:
     """Email service with multi-provider support and retry logic."""
@@ -30,25 +56,40 @@ class EmailService:
         self.settings = get_settings()
         self.logger = get_scraper_logger()
 
+        # Settings are immutable, so per-message values are read once
+        self._sender = self.settings.email_sender
+        self._recipients = self.settings.email_recipients
+        self._recipients_joined = ", ".join(self._recipients)
+        self._smtp_settings = self._get_smtp_settings() if self._sender else None
+        self._connection: Optional[SmtpConnection] = None
+
     def is_configured(self) -> bool:
         """Check if email is properly configured."""
         return bool(
-            self.settings.email_sender and
+            self._sender and
             self.settings.email_password and
-            self.settings.email_recipients
+            self._recipients
         )
 
-    @retry(
-        retry=retry_if_exception_type((smtplib.SMTPException, ConnectionError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
     def send_concept_notification(
         self,
         concepts: List[Concept],
         csv_path: Optional[Path] = None
     ) -> bool:
-        """Send notification about new concepts."""
+        """Send notification about new concepts, retrying SMTP failures."""
+        send = _retry_decorator()(self._send_concept_notification)
+        return send(concepts, csv_path)
+
+    def send_notification(self, concepts: List[Concept], **kwargs) -> bool:
+        """NotificationProvider entry point; accepts an optional ``csv_path``."""
+        return self.send_concept_notification(concepts, kwargs.get("csv_path"))
+
+    def _send_concept_notification(
+        self,
+        concepts: List[Concept],
+        csv_path: Optional[Path] = None
+    ) -> bool:
+        """Send notification about new concepts (single attempt)."""
         if not concepts:
             self.logger.info("No concepts to notify about")
             return True
@@ -64,20 +105,27 @@ class EmailService:
             # Send email
             self._send_message(msg)
             
-            self.logger.info(f"Sent notification for {len(concepts)} concepts")
+            self.logger.info("Sent notification for %d concepts", len(concepts))
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to send email notification: {e}")
+            self.logger.error("Failed to send email notification: %s", e)
             raise
 
-    def _create_message(self, concepts: List[Concept], csv_path: Optional[Path] = None) -> MIMEMultipart:
-        """Create email message."""
-        msg = MIMEMultipart()
-        msg["From"] = self.settings.email_sender
-        msg["To"] = ", ".join(self.settings.email_recipients)
-        msg["Subject"] = f"Conceptos DIAN actualizados - {len(concepts)} nuevos conceptos"
+    def _new_message(self, subject: str, body: str) -> EmailMessage:
+        """Create a plain-text message from the sender to all recipients."""
+        from email.message import EmailMessage
 
+        msg = EmailMessage()
+        msg["From"] = self._sender
+        msg["To"] = self._recipients_joined
+        msg["Subject"] = subject
+        # Quoted-printable keeps accented text safe on servers without 8BITMIME
+        msg.set_content(body, cte="quoted-printable")
+        return msg
+
+    def _create_message(self, concepts: List[Concept], csv_path: Optional[Path] = None) -> EmailMessage:
+        """Create email message."""
         # Create email body
         body_lines = [
             f"Se han encontrado {len(concepts)} nuevos conceptos DIAN:",
@@ -97,14 +145,16 @@ class EmailService:
 
         body_lines.extend([
             "",
-            "Se adjunta archivo CSV con detalles completos, resúmenes y análisis.",
+            "Se adjunta archivo CSV (comprimido .gz) con detalles completos, resúmenes y análisis.",
             "",
             "---",
             "TaxBot Enterprise - Sistema automatizado de monitoreo DIAN",
         ])
 
-        # Attach text body
-        msg.attach(MIMEText("\n".join(body_lines), "plain", "utf-8"))
+        msg = self._new_message(
+            f"Conceptos DIAN actualizados - {len(concepts)} nuevos conceptos",
+            "\n".join(body_lines),
+        )
 
         # Attach CSV file if provided
         if csv_path and csv_path.exists():
@@ -112,57 +162,53 @@ class EmailService:
 
         return msg
 
-    def _attach_csv_file(self, msg: MIMEMultipart, csv_path: Path) -> None:
-        """Attach CSV file to message."""
+    def _attach_csv_file(self, msg: EmailMessage, csv_path: Path) -> None:
+        """Attach CSV file to message, gzip-compressed."""
+        import gzip
+        import shutil
+
         try:
-            with open(csv_path, "rb") as file:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(file.read())
-                encoders.encode_base64(part)
-                part.add_header(
-                    "Content-Disposition",
-                    f"attachment; filename={csv_path.name}"
-                )
-                msg.attach(part)
+            # Compress in chunks so only the (much smaller) .gz is in memory
+            buffer = io.BytesIO()
+            with open(csv_path, "rb") as source, gzip.GzipFile(
+                filename=csv_path.name, mode="wb", fileobj=buffer
+            ) as target:
+                shutil.copyfileobj(source, target)
+
+            msg.add_attachment(
+                buffer.getvalue(),
+                maintype="application",
+                subtype="gzip",
+                filename=f"{csv_path.name}.gz",
+            )
         except Exception as e:
-            self.logger.warning(f"Failed to attach CSV file: {e}")
+            self.logger.warning("Failed to attach CSV file: %s", e)
 
-    def _send_message(self, msg: MIMEMultipart) -> None:
-        """Send email message."""
-        # Determine SMTP settings based on provider
-        smtp_host, smtp_port, use_tls = self._get_smtp_settings()
-        
-        # Create SMTP connection
-        if use_tls:
-            server = smtplib.SMTP_SSL(smtp_host, smtp_port)
-        else:
-            server = smtplib.SMTP(smtp_host, smtp_port)
-            server.starttls()
+    def _send_message(self, msg: EmailMessage) -> None:
+        """Send email message over the shared SMTP session."""
+        if self._connection is None:
+            from .smtp_connection import SmtpConnection
 
-        try:
-            # Login and send
-            server.login(self.settings.email_sender, self.settings.email_password)
-            server.sendmail(
-                self.settings.email_sender,
-                self.settings.email_recipients,
-                msg.as_string()
+            # SMTP settings were resolved from the provider at init
+            smtp_host, smtp_port, use_tls = self._smtp_settings
+            self._connection = SmtpConnection(
+                smtp_host,
+                smtp_port,
+                use_tls,
+                self._sender,
+                self.settings.email_password,
+                self.logger,
             )
-        finally:
-            server.quit()
+
+        self._connection.send(msg, self._sender, self._recipients)
+
+    def close(self) -> None:
+        """Close the SMTP session, if one was opened."""
+        if self._connection is not None:
+            self._connection.close()
 
     def _get_smtp_settings(self) -> tuple[str, int, bool]:
-        """Get SMTP settings based on email provider."""
-        email_domain = self.settings.email_sender.split("@")[-1].lower()
-        
-        # Provider-specific settings
-        provider_settings = {
-            "gmail.com": ("smtp.gmail.com", 587, True),
-            "outlook.com": ("smtp-mail.outlook.com", 587, True),
-            "hotmail.com": ("smtp-mail.outlook.com", 587, True),
-            "yahoo.com": ("smtp.mail.yahoo.com", 587, True),
-            "live.com": ("smtp-mail.outlook.com", 587, True),
-        }
-        
+        """Get SMTP settings based on email provider (resolved once in init)."""
         # Use custom settings if provided
         if (self.settings.email_smtp_host != "smtp.gmail.com" or 
             self.settings.email_smtp_port != 465):
@@ -173,7 +219,8 @@ class EmailService:
             )
         
         # Use provider-specific settings
-        return provider_settings.get(email_domain, ("smtp.gmail.com", 587, True))
+        email_domain = self._sender.split("@")[-1].lower()
+        return _PROVIDER_SETTINGS.get(email_domain, _DEFAULT_SMTP_SETTINGS)
 
     def send_test_email(self) -> bool:
         """Send test email to verify configuration."""
@@ -182,11 +229,6 @@ class EmailService:
             return False
 
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.settings.email_sender
-            msg["To"] = ", ".join(self.settings.email_recipients)
-            msg["Subject"] = "TaxBot - Test Email"
-
             body = """
             This is a test email from TaxBot Enterprise.
             
@@ -196,14 +238,13 @@ class EmailService:
             TaxBot Enterprise - Sistema automatizado de monitoreo DIAN
             """
             
-            msg.attach(MIMEText(body, "plain", "utf-8"))
-            self._send_message(msg)
+            self._send_message(self._new_message("TaxBot - Test Email", body))
             
             self.logger.info("Test email sent successfully")
             return True
             
-        except Exception as e:
-            self.logger.error(f"Failed to send test email: {e}")
+        except Exception:
+            self.logger.exception("Failed to send test email")
             return False
 
     def send_error_notification(self, error_message: str) -> bool:
@@ -212,11 +253,6 @@ class EmailService:
             return False
 
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.settings.email_sender
-            msg["To"] = ", ".join(self.settings.email_recipients)
-            msg["Subject"] = "TaxBot - Error Notification"
-
             body = f"""
             TaxBot encountered an error:
             
@@ -228,12 +264,11 @@ class EmailService:
             TaxBot Enterprise - Sistema automatizado de monitoreo DIAN
             """
             
-            msg.attach(MIMEText(body, "plain", "utf-8"))
-            self._send_message(msg)
+            self._send_message(self._new_message("TaxBot - Error Notification", body))
             
             self.logger.info("Error notification sent")
             return True
             
-        except Exception as e:
-            self.logger.error(f"Failed to send error notification: {e}")
+        except Exception:
+            self.logger.exception("Failed to send error notification")
             return False
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Protocol
 
+from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
 
+# Upper bound on providers notified at the same time
+MAX_NOTIFICATION_WORKERS = 4
+
 
 class NotificationProvider(Protocol):
     """Protocol for notification providers."""
@@ -40,3 +45,28 @@ class NotificationFactory:
     def get_available_providers() -> list[str]:
         """Get list of available notification providers."""
         return ["email"]  # Add more as they're implemented
+
+    @staticmethod
+    def send_all(concepts: list[Concept], **kwargs) -> Dict[str, bool]:
+        """Notify every available provider concurrently.
+
+        Returns provider name -> success. A provider that fails (after its
+        own retries) is logged and does not affect the others.
+        """
+        providers = NotificationFactory.get_available_providers()
+        workers = min(MAX_NOTIFICATION_WORKERS, len(providers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda name: _send_with(name, concepts, **kwargs), providers
+            )
+            return dict(zip(providers, results))
+
+
+def _send_with(name: str, concepts: list[Concept], **kwargs) -> bool:
+    """Create provider ``name`` and send, reporting failure as False."""
+    try:
+        provider = getattr(NotificationFactory, f"create_{name}_provider")()
+        return provider.send_notification(concepts, **kwargs)
+    except Exception:
+        get_scraper_logger().exception("Notification via %s failed", name)
+        return False
@@ -0,0 +1,97 @@
+"""Reusable SMTP session shared by the notifications of one service."""
+
+from __future__ import annotations
+
+import atexit
+import smtplib
+import threading
+from email.message import Message
+from typing import Optional, Sequence
+
+from ..core.logging import get_scraper_logger
+
+
+class SmtpConnection:
+    """Logged-in SMTP connection kept open between messages.
+
+    The TLS handshake and AUTH happen once; later sends check the session
+    with a NOOP and reconnect only if the server dropped it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        use_tls: bool,
+        username: str,
+        password: Optional[str],
+        logger=None,
+    ):
+        """Initialize connection parameters; nothing is opened yet."""
+        self.host = host
+        self.port = port
+        self.use_tls = use_tls
+        self.username = username
+        self.password = password
+        self.logger = logger or get_scraper_logger()
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+
+    def send(self, msg: Message, sender: str, recipients: Sequence[str]) -> None:
+        """Send ``msg``, dropping the session if the send fails."""
+        with self._lock:
+            server = self._get_server()
+            try:
+                server.send_message(msg, sender, recipients)
+            except Exception:
+                # The next attempt (e.g. a retry) starts a fresh session
+                self._discard()
+                raise
+
+    def close(self) -> None:
+        """Log out and close the session if one is open."""
+        with self._lock:
+            server, self._server = self._server, None
+        atexit.unregister(self.close)
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Return the open session, reconnecting if it is gone."""
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.logger.debug("SMTP session expired, reconnecting")
+            self._discard()
+
+        self._server = self._connect()
+        atexit.register(self.close)
+        return self._server
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP session."""
+        if self.use_tls:
+            server = smtplib.SMTP_SSL(self.host, self.port)
+        else:
+            server = smtplib.SMTP(self.host, self.port)
+            server.starttls()
+
+        try:
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _discard(self) -> None:
+        """Forget the current session without a polite QUIT."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
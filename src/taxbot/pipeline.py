@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import fcntl
+import os
 import signal
 import sys
 from pathlib import Path
@@ -13,8 +15,8 @@ from .core.logging import setup_logging, get_scraper_logger
 from .models.concept import Concept
 from .notifications.email_service import EmailService
 from .processors.ollama_processor import OllamaProcessor
-from .scrapers.dian_scraper import DianScraper
-from .storage.csv_repository import CsvRepository
+from .scrapers.async_dian_scraper import AsyncDianScraper
+from .storage.factory import create_repository
 
 
 class TaxBotPipeline:
@@ -24,12 +26,13 @@ class TaxBotPipeline:
         """Initialize pipeline."""
         self.settings = get_settings()
         self.logger = get_scraper_logger()
-        self.lock_file: Optional[Path] = None
+        self._lock_fd: Optional[int] = None
+        self._lock_path: Optional[Path] = None
         self._shutdown_requested = False
         
         # Initialize components
-        self.scraper = DianScraper()
-        self.repository = CsvRepository()
+        self.scraper = AsyncDianScraper()
+        self.repository = create_repository()
         self.ai_processor = OllamaProcessor()
         self.email_service = EmailService()
         
@@ -46,31 +49,40 @@ class TaxBotPipeline:
         """Acquire lock file to prevent concurrent executions."""
         lock_path = self.settings.data_dir / "taxbot.lock"
         
+        fd = None
         try:
-            # Create lock file
-            self.lock_file = lock_path.open("w")
-            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            self.lock_file.write(str(Path.cwd()))
-            self.lock_file.flush()
-            
-            self.logger.info("Acquired lock file")
-            return True
-            
-        except (IOError, OSError) as e:
+            # Raw descriptor; truncate only once the lock is ours, so a
+            # failed attempt never wipes the holder's lock file
+            fd = os.open(lock_path, os.O_CREAT | os.O_WRONLY, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(Path.cwd()).encode())
+        except OSError as e:
+            if fd is not None:
+                os.close(fd)
             self.logger.error(f"Failed to acquire lock: {e}")
             return False
 
+        self._lock_fd, self._lock_path = fd, lock_path
+        self.logger.info("Acquired lock file")
+        return True
+
     def _release_lock(self) -> None:
         """Release lock file."""
-        if self.lock_file:
+        if self._lock_fd is None:
+            return
+
+        fd, self._lock_fd = self._lock_fd, None
+        try:
+            # Unlink while still locked; closing the descriptor unlocks
             try:
-                fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
-                self.lock_file.close()
-                if self.lock_file.name and Path(self.lock_file.name).exists():
-                    Path(self.lock_file.name).unlink()
-                self.logger.info("Released lock file")
-            except Exception as e:
-                self.logger.warning(f"Error releasing lock: {e}")
+                os.unlink(self._lock_path)
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+            self.logger.info("Released lock file")
+        except OSError as e:
+            self.logger.warning(f"Error releasing lock: {e}")
 
     def run(self, dry_run: bool = False, notify: bool = True, process_ai: bool = True) -> bool:
         """Run the complete pipeline."""
@@ -94,7 +106,7 @@ class TaxBotPipeline:
             concepts = self._scrape_concepts()
             
             if not concepts:
-                self.logger.warning("No concepts found during scraping")
+                self.logger.warning("No new concepts found during scraping")
                 return True
             
             self.logger.info(f"Scraped {len(concepts)} concepts")
@@ -157,6 +169,15 @@ class TaxBotPipeline:
     def _scrape_concepts(self) -> List[Concept]:
         """Scrape concepts from DIAN."""
         try:
+            # Stored concepts are dropped later, so skip their page fetches
+            self.scraper.skip_links(self.repository.iter_links())
+        except Exception as e:
+            self.logger.warning(f"Error reading stored links: {e}")
+
+        try:
+            if self.settings.scraper_async:
+                # Month and full-text pages are fetched concurrently
+                return asyncio.run(self.scraper.ascrape_concepts())
             return self.scraper.scrape_concepts()
         except Exception as e:
             self.logger.error(f"Scraping failed: {e}")
@@ -165,16 +186,26 @@ class TaxBotPipeline:
     def _filter_new_concepts(self, concepts: List[Concept]) -> List[Concept]:
         """Filter out concepts that already exist."""
         try:
-            # Get existing concepts
+            # Keep the first concept per link; pages can list one twice
+            by_link = {}
+            for concept in concepts:
+                by_link.setdefault(concept.link, concept)
+            if len(by_link) < len(concepts):
+                self.logger.info(
+                    f"Dropped {len(concepts) - len(by_link)} duplicate scraped concepts"
+                )
+
+            # Only the link column is read; no Concept objects are built
             existing_links = set()
             try:
-                existing_concepts = self.repository.get_concepts(limit=10000)
-                existing_links = {c.link for c in existing_concepts}
+                existing_links = self.repository.get_existing_links(by_link)
             except Exception as e:
-                self.logger.warning(f"Error getting existing concepts: {e}")
+                self.logger.warning(f"Error getting existing links: {e}")
             
             # Filter new concepts
-            new_concepts = [c for c in concepts if c.link not in existing_links]
+            new_concepts = [
+                c for link, c in by_link.items() if link not in existing_links
+            ]
             
             self.logger.info(f"Filtered {len(new_concepts)} new concepts from {len(concepts)} total")
             return new_concepts
@@ -217,7 +248,7 @@ class TaxBotPipeline:
                 self.logger.warning("Email not configured, skipping notifications")
                 return
             
-            csv_path = self.repository.csv_path
+            csv_path = getattr(self.repository, "csv_path", None)
             success = self.email_service.send_concept_notification(concepts, csv_path)
             
             if success:
@@ -232,7 +263,7 @@ class TaxBotPipeline:
         """Get pipeline status."""
         try:
             return {
-                "is_running": self.lock_file is not None,
+                "is_running": self._lock_fd is not None,
                 "total_concepts": self.repository.get_concept_count(),
                 "ollama_available": self.ai_processor.is_available(),
                 "email_configured": self.email_service.is_configured(),
@@ -0,0 +1,90 @@
+"""Persistent cache of AI results keyed by concept text content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..core.config import get_settings
+from ..core.logging import get_scraper_logger
+from ..models.concept import Concept
+
+
+class AiResultCache:
+    """Reuse summary/analysis for concepts whose text was already processed.
+
+    Reposts and URL changes keep the same body, so the key is a hash of
+    the model name and the whitespace-normalized full text.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize AI result cache."""
+        self.settings = get_settings()
+        self.logger = get_scraper_logger()
+        self.db_path = db_path or self.settings.data_dir / "ai_cache.sqlite"
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def apply(self, concept: Concept) -> bool:
+        """Fill in cached AI fields; return True on a cache hit."""
+        if not concept.full_text:
+            return False
+
+        try:
+            with self._lock:
+                row = self._get_connection().execute(
+                    "SELECT v FROM cache WHERE k = ?", (self._key(concept),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"AI cache lookup failed: {e}")
+            return False
+
+        if row is None:
+            return False
+
+        result = json.loads(row[0])
+        concept.summary = result["summary"]
+        concept.analysis = result["analysis"]
+        self.logger.debug(f"Reused cached AI result for concept: {concept.title}")
+        return True
+
+    def store(self, concept: Concept) -> None:
+        """Persist the AI fields of a successfully processed concept."""
+        if not concept.full_text:
+            return
+
+        value = json.dumps(
+            {"summary": concept.summary, "analysis": concept.analysis}
+        )
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache (k, v) VALUES (?, ?)",
+                    (self._key(concept), value),
+                )
+                connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"AI cache store failed: {e}")
+
+    def _key(self, concept: Concept) -> str:
+        """Hash the model name and the normalized concept text."""
+        text = " ".join(concept.full_text.split())
+        payload = f"{self.settings.ollama_model}\0{text}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.db_path, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT)"
+            )
+        return self._connection
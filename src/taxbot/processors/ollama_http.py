@@ -0,0 +1,38 @@
+"""Async HTTP transport for Ollama's chat endpoint."""
+
+from __future__ import annotations
+
+import httpx
+
+from ..core.config import Settings
+
+
+def create_async_client(settings: Settings) -> httpx.AsyncClient:
+    """Create a keep-alive HTTP client sized for the concurrency limit."""
+    limit = settings.ollama_max_concurrency
+    return httpx.AsyncClient(
+        base_url=settings.ollama_base_url,
+        limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+        timeout=settings.ollama_timeout,
+    )
+
+
+async def achat(
+    client: httpx.AsyncClient,
+    model: str,
+    prompt: str,
+    options: dict,
+    response_format: str = "",
+) -> str:
+    """Send a single-turn chat request and return the reply text."""
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "options": options,
+        "stream": False,
+    }
+    if response_format:
+        payload["format"] = response_format  # e.g. "json" for structured output
+    response = await client.post("/api/chat", json=payload)
+    response.raise_for_status()
+    return response.json()["message"]["content"].strip()
@@ -2,51 +2,57 @@
 
 from __future__ import annotations
 
-import json
-from typing import List, Optional
+import asyncio
+import itertools
+from typing import List
 
-try:
-    import ollama
-except ImportError:
-    ollama = None
+import httpx
 
 from ..core.config import get_settings
 from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
+from .ai_cache import AiResultCache
+from .ollama_http import achat, create_async_client
+from .ollama_server import OllamaServer
+from .prompts import (
+    apply_batch_reply,
+    apply_combined_reply,
+    build_analysis_prompt,
+    build_batch_prompt,
+    build_combined_prompt,
+    build_summary_prompt,
+)
+from .text_processor import TextProcessor
+
+SUMMARY_UNAVAILABLE = "Resumen no disponible: Ollama no configurado."
+SUMMARY_ERROR = "Resumen no disponible por error en Ollama."
+ANALYSIS_UNAVAILABLE = "Análisis no disponible: Ollama no configurado."
+ANALYSIS_ERROR = "Análisis no disponible por error en Ollama."
+
+# Fallback texts that must never be cached as AI results
+_FAILED_RESULTS = {
+    SUMMARY_UNAVAILABLE, SUMMARY_ERROR, ANALYSIS_UNAVAILABLE, ANALYSIS_ERROR
+}
 
 
 class OllamaProcessor:
     """Ollama AI processor for concept analysis."""
 
+    # Ollama caps output with num_predict; it ignores OpenAI's max_tokens
+    SUMMARY_OPTIONS = {"temperature": 0.3, "top_p": 0.9, "num_predict": 500}
+    ANALYSIS_OPTIONS = {"temperature": 0.4, "top_p": 0.9, "num_predict": 800}
+    COMBINED_OPTIONS = {"temperature": 0.3, "top_p": 0.9, "num_predict": 1300}
+
     def __init__(self):
         """Initialize Ollama processor."""
         self.settings = get_settings()
         self.logger = get_scraper_logger()
-        self._client = None
-
-    def _get_client(self):
-        """Get or create Ollama client."""
-        if ollama is None:
-            raise ImportError("Ollama package not available")
-        
-        if self._client is None:
-            self._client = ollama.Client(host=self.settings.ollama_base_url)
-        
-        return self._client
+        self._server = OllamaServer(self.settings, self.logger)
+        self._cache = AiResultCache()
 
     def is_available(self) -> bool:
-        """Check if Ollama is available."""
-        try:
-            if ollama is None:
-                return False
-            
-            client = self._get_client()
-            # Test connection by listing models
-            client.list()
-            return True
-        except Exception as e:
-            self.logger.warning(f"Ollama not available: {e}")
-            return False
+        """Check if Ollama is available (probe results are cached briefly)."""
+        return self._server.is_available()
 
     def summarize_concept(self, concept: Concept) -> str:
         """Generate AI summary for a concept."""
@@ -54,29 +60,18 @@ class OllamaProcessor:
             return "No hay contenido para resumir."
         
         if not self.is_available():
-            return "Resumen no disponible: Ollama no configurado."
+            return SUMMARY_UNAVAILABLE
 
-        prompt = self._build_summary_prompt(concept)
+        prompt = self._summary_prompt(concept)
         
         try:
-            client = self._get_client()
-            response = client.chat(
-                model=self.settings.ollama_model,
-                messages=[{"role": "user", "content": prompt}],
-                options={
-                    "temperature": 0.3,
-                    "top_p": 0.9,
-                    "max_tokens": 500,
-                }
-            )
-            
-            summary = response["message"]["content"].strip()
+            summary = self._chat(prompt, self.SUMMARY_OPTIONS)
             self.logger.debug(f"Generated summary for concept: {concept.title}")
             return summary
             
         except Exception as e:
             self.logger.error(f"Error generating summary: {e}")
-            return "Resumen no disponible por error en Ollama."
+            return SUMMARY_ERROR
 
     def analyze_concept(self, concept: Concept, summary: str) -> str:
         """Generate AI analysis for a concept."""
@@ -84,32 +79,39 @@ class OllamaProcessor:
             return "Análisis no disponible."
         
         if not self.is_available():
-            return "Análisis no disponible: Ollama no configurado."
+            return ANALYSIS_UNAVAILABLE
 
-        prompt = self._build_analysis_prompt(concept, summary)
+        prompt = build_analysis_prompt(concept, summary)
         
         try:
-            client = self._get_client()
-            response = client.chat(
-                model=self.settings.ollama_model,
-                messages=[{"role": "user", "content": prompt}],
-                options={
-                    "temperature": 0.4,
-                    "top_p": 0.9,
-                    "max_tokens": 800,
-                }
-            )
-            
-            analysis = response["message"]["content"].strip()
+            analysis = self._chat(prompt, self.ANALYSIS_OPTIONS)
             self.logger.debug(f"Generated analysis for concept: {concept.title}")
             return analysis
             
         except Exception as e:
             self.logger.error(f"Error generating analysis: {e}")
-            return "Análisis no disponible por error en Ollama."
+            return ANALYSIS_ERROR
 
     def process_concepts_batch(self, concepts: List[Concept]) -> List[Concept]:
-        """Process multiple concepts in batch."""
+        """Process multiple concepts in batch, concurrently when possible."""
+        if not concepts:
+            return concepts
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop in this thread, so the concurrent path can own one
+            return asyncio.run(self.aprocess_concepts_batch(concepts))
+
+        # Inside a running loop callers should await aprocess_concepts_batch
+        if not self.is_available():
+            self.logger.warning("Ollama not available, skipping AI processing")
+            return concepts
+        
+        return [self._process_concept(concept) for concept in concepts]
+
+    async def aprocess_concepts_batch(self, concepts: List[Concept]) -> List[Concept]:
+        """Process multiple concepts concurrently over one keep-alive client."""
         if not concepts:
             return concepts
         
@@ -117,117 +119,159 @@ class OllamaProcessor:
             self.logger.warning("Ollama not available, skipping AI processing")
             return concepts
         
-        processed = []
-        for concept in concepts:
-            try:
-                # Generate summary
+        limit = self.settings.ollama_max_concurrency
+        self.logger.info(
+            f"Processing {len(concepts)} concepts with up to {limit} concurrent "
+            "Ollama requests; match OLLAMA_NUM_PARALLEL (and keep "
+            "OLLAMA_MAX_LOADED_MODELS >= 1) on the server to use them"
+        )
+        semaphore = asyncio.Semaphore(limit)
+        pending = [concept for concept in concepts if self._needs_ai(concept)]
+        self.logger.info(
+            f"Sending {len(pending)} of {len(concepts)} concepts to Ollama; "
+            "the rest are empty, cached or not tax-related"
+        )
+        async with create_async_client(self.settings) as client:
+            await asyncio.gather(*(
+                self._aprocess_group(client, semaphore, group)
+                for group in self._group(pending)
+            ))
+        return concepts
+
+    def _process_concept(self, concept: Concept) -> Concept:
+        """Generate summary and analysis for a single concept."""
+        if not self._needs_ai(concept):
+            return concept
+
+        try:
+            # One JSON-mode request; separate calls only if that fails
+            if not self._apply_combined(concept):
                 concept.summary = self.summarize_concept(concept)
-                
-                # Generate analysis
                 concept.analysis = self.analyze_concept(concept, concept.summary)
-                
-                processed.append(concept)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing concept {concept.title}: {e}")
-                processed.append(concept)  # Add without AI processing
-        
-        return processed
 
-    def _build_summary_prompt(self, concept: Concept) -> str:
-        """Build prompt for concept summarization."""
-        # Truncate text if too long
-        text = concept.full_text[:self.settings.scraper_max_text_length]
+            self._store_result(concept)
+        except Exception as e:
+            self.logger.error(f"Error processing concept {concept.title}: {e}")
         
-        prompt = f"""Eres un abogado tributarista experto. Resume el siguiente concepto de la DIAN en un máximo de 6 frases, destacando:
+        return concept  # Returned even without AI processing
 
-1. Implicaciones prácticas para contribuyentes
-2. Cambios normativos relevantes
-3. Obligaciones y responsabilidades
-4. Recomendaciones para clientes
+    def _needs_ai(self, concept: Concept) -> bool:
+        """Fill placeholder or cached fields; True if the model must answer."""
+        if not concept.full_text:
+            concept.summary = "No hay contenido para resumir."
+            concept.analysis = "Análisis no disponible."
+            return False
+        if not TextProcessor.is_tax_relevant(concept.full_text):
+            # Cheap regex gate: no tokens are spent on off-topic pages
+            self.logger.debug(f"Skipping AI for non-tax concept: {concept.title}")
+            return False
+        return not self._cache.apply(concept)
 
-Información del concepto:
-- Título: {concept.title}
-- Tema: {concept.theme}
-- Descriptor: {concept.descriptor}
+    def _group(self, concepts: List[Concept]) -> List[List[Concept]]:
+        """Split concepts into batches of similar text length."""
+        size = max(1, self.settings.ollama_batch_size)
+        ordered = sorted(concepts, key=lambda concept: len(concept.full_text))
+        return [ordered[i:i + size] for i in range(0, len(ordered), size)]
 
-Texto completo:
-{text}
+    async def _aprocess_group(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        group: List[Concept],
+    ) -> None:
+        """Answer a group with one request, then retry leftovers one by one."""
+        if len(group) > 1:
+            prompt = build_batch_prompt(group, self.settings.scraper_max_text_length)
+            options = dict(self.COMBINED_OPTIONS)
+            options["num_predict"] *= len(group)
+            async with semaphore:
+                reply = await self._agenerate(client, prompt, options, "", "json")
 
-Resumen:"""
-        
-        return prompt
+            filled = apply_batch_reply(group, reply)
+            for concept in itertools.compress(group, filled):
+                self._store_result(concept)
+            group = [c for c, done in zip(group, filled) if not done]
 
-    def _build_analysis_prompt(self, concept: Concept, summary: str) -> str:
-        """Build prompt for concept analysis."""
-        prompt = f"""Actúa como consultor tributario sénior. Con base en el siguiente resumen y la información del concepto, proporciona un análisis detallado que incluya:
+        await asyncio.gather(
+            *(self._aprocess_concept(client, semaphore, c) for c in group)
+        )
 
-1. RIESGOS IDENTIFICADOS: Principales riesgos para contribuyentes
-2. OPORTUNIDADES: Beneficios o ventajas tributarias
-3. ACCIONES SUGERIDAS: Pasos específicos a seguir
-4. NORMAS RELACIONADAS: Referencias legales relevantes
-5. IMPACTO EMPRESARIAL: Efectos en diferentes tipos de empresas
+    async def _aprocess_concept(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        concept: Concept,
+    ) -> Concept:
+        """Generate summary and analysis for a single concept over HTTP."""
+        async with semaphore:
+            reply = await self._agenerate(
+                client, self._combined_prompt(concept),
+                self.COMBINED_OPTIONS, "", "json",
+            )
+            if not apply_combined_reply(concept, reply):
+                concept.summary = await self._agenerate(
+                    client, self._summary_prompt(concept),
+                    self.SUMMARY_OPTIONS, SUMMARY_ERROR,
+                )
+                concept.analysis = await self._agenerate(
+                    client, build_analysis_prompt(concept, concept.summary),
+                    self.ANALYSIS_OPTIONS, ANALYSIS_ERROR,
+                )
+        self._store_result(concept)
+        return concept
 
-Información del concepto:
-- Título: {concept.title}
-- Tema: {concept.theme}
-- Descriptor: {concept.descriptor}
-- Fecha: {concept.date.strftime('%Y-%m-%d')}
+    async def _agenerate(
+        self,
+        client: httpx.AsyncClient,
+        prompt: str,
+        options: dict,
+        fallback: str,
+        response_format: str = "",
+    ) -> str:
+        """Run one chat request, returning ``fallback`` on failure."""
+        try:
+            return await achat(
+                client, self.settings.ollama_model, prompt, options, response_format
+            )
+        except Exception as e:
+            self._server.invalidate()
+            self.logger.error(f"Error generating AI content: {e}")
+            return fallback
 
-Resumen:
-{summary}
+    def _store_result(self, concept: Concept) -> None:
+        """Cache AI fields unless either one is a failure fallback."""
+        if concept.summary not in _FAILED_RESULTS and concept.analysis not in _FAILED_RESULTS:
+            self._cache.store(concept)
 
-Análisis:"""
-        
-        return prompt
+    def _apply_combined(self, concept: Concept) -> bool:
+        """Fill summary and analysis from one JSON-mode request if possible."""
+        if not concept.full_text or not self.is_available():
+            return False
 
-    def get_model_info(self) -> dict:
-        """Get information about the current model."""
-        if not self.is_available():
-            return {"available": False, "error": "Ollama not available"}
-        
+        prompt = self._combined_prompt(concept)
         try:
-            client = self._get_client()
-            models = client.list()
-            current_model = self.settings.ollama_model
-            
-            model_info = {
-                "available": True,
-                "current_model": current_model,
-                "models": [model["name"] for model in models.get("models", [])],
-            }
-            
-            # Check if current model is available
-            model_names = [model["name"] for model in models.get("models", [])]
-            model_info["model_available"] = current_model in model_names
-            
-            return model_info
-            
+            reply = self._chat(prompt, self.COMBINED_OPTIONS, "json")
         except Exception as e:
-            return {"available": False, "error": str(e)}
+            self.logger.warning(f"Combined AI request failed: {e}")
+            return False
+        return apply_combined_reply(concept, reply)
+
+    def _combined_prompt(self, concept: Concept) -> str:
+        """Build the fused summary+analysis prompt."""
+        return build_combined_prompt(concept, self.settings.scraper_max_text_length)
+
+    def _summary_prompt(self, concept: Concept) -> str:
+        """Build the summary prompt with the configured text budget."""
+        return build_summary_prompt(concept, self.settings.scraper_max_text_length)
+
+    def _chat(self, prompt: str, options: dict, response_format: str = "") -> str:
+        """Send a single-turn chat request and return the reply text."""
+        return self._server.chat(prompt, options, response_format)
+
+    def get_model_info(self) -> dict:
+        """Get information about the current model."""
+        return self._server.model_info()
 
     def test_connection(self) -> dict:
         """Test Ollama connection and return status."""
-        try:
-            if not self.is_available():
-                return {
-                    "status": "error",
-                    "message": "Ollama not available",
-                    "details": "Ollama package not installed or service not running"
-                }
-            
-            client = self._get_client()
-            models = client.list()
-            
-            return {
-                "status": "success",
-                "message": "Ollama connection successful",
-                "details": f"Found {len(models.get('models', []))} models available"
-            }
-            
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": "Ollama connection failed",
-                "details": str(e)
-            }
+        return self._server.connection_status()
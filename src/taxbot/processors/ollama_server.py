@@ -0,0 +1,131 @@
+"""Synchronous Ollama client with a memoized availability probe."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+try:
+    import ollama
+except ImportError:
+    ollama = None
+
+from ..core.config import Settings
+
+# Checked once: the package cannot appear while the process is running
+_OLLAMA_INSTALLED = ollama is not None
+
+
+class OllamaServer:
+    """Lazily created Ollama client that remembers whether it is reachable.
+
+    Every AI call checks availability first; probing with ``client.list()``
+    each time would add one round-trip per call, so a result is trusted
+    for ``AVAILABILITY_TTL`` seconds or until a chat request fails.
+    """
+
+    AVAILABILITY_TTL = 30.0
+
+    def __init__(self, settings: Settings, logger: logging.Logger):
+        """Initialize server access; nothing is contacted yet."""
+        self.settings = settings
+        self.logger = logger
+        self._client = None
+        self._available: Optional[bool] = None
+        self._available_at = 0.0
+
+    def client(self):
+        """Get or create Ollama client."""
+        if not _OLLAMA_INSTALLED:
+            raise ImportError("Ollama package not available")
+
+        if self._client is None:
+            self._client = ollama.Client(host=self.settings.ollama_base_url)
+
+        return self._client
+
+    def is_available(self) -> bool:
+        """Check if Ollama is available, reusing a recent probe result."""
+        if not _OLLAMA_INSTALLED:
+            return False
+
+        now = time.monotonic()
+        if self._available is None or now - self._available_at >= self.AVAILABILITY_TTL:
+            self._available = self._probe()
+            self._available_at = now
+        return self._available
+
+    def invalidate(self) -> None:
+        """Forget the probe result so the next check contacts the server."""
+        self._available = None
+
+    def chat(self, prompt: str, options: dict, response_format: str = "") -> str:
+        """Send a single-turn chat request and return the reply text."""
+        try:
+            response = self.client().chat(
+                model=self.settings.ollama_model,
+                messages=[{"role": "user", "content": prompt}],
+                options=options,
+                format=response_format,
+            )
+        except Exception:
+            self.invalidate()
+            raise
+        return response["message"]["content"].strip()
+
+    def model_info(self) -> dict:
+        """Get information about the current model."""
+        if not self.is_available():
+            return {"available": False, "error": "Ollama not available"}
+
+        try:
+            client = self.client()
+            models = client.list()
+            current_model = self.settings.ollama_model
+
+            model_names = [model["name"] for model in models.get("models", [])]
+            return {
+                "available": True,
+                "current_model": current_model,
+                "models": model_names,
+                "model_available": current_model in model_names,
+            }
+
+        except Exception as e:
+            return {"available": False, "error": str(e)}
+
+    def connection_status(self) -> dict:
+        """Test Ollama connection and return status."""
+        try:
+            if not self.is_available():
+                return {
+                    "status": "error",
+                    "message": "Ollama not available",
+                    "details": "Ollama package not installed or service not running"
+                }
+
+            client = self.client()
+            models = client.list()
+
+            return {
+                "status": "success",
+                "message": "Ollama connection successful",
+                "details": f"Found {len(models.get('models', []))} models available"
+            }
+
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": "Ollama connection failed",
+                "details": str(e)
+            }
+
+    def _probe(self) -> bool:
+        """Test the connection by listing models."""
+        try:
+            self.client().list()
+            return True
+        except Exception as e:
+            self.logger.warning(f"Ollama not available: {e}")
+            return False
@@ -0,0 +1,178 @@
+"""Prompt templates for Ollama concept analysis."""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+from ..models.concept import Concept
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is a core dependency
+    from json import loads as _json_loads
+
+# Field descriptions shared by the JSON (combined and batch) prompts
+_SUMMARY_FIELD = '"summary": resumen de máximo 6 frases que destaque implicaciones prácticas para contribuyentes, cambios normativos relevantes, obligaciones y responsabilidades, y recomendaciones para clientes.'
+_ANALYSIS_FIELD = '"analysis": análisis detallado con las secciones RIESGOS IDENTIFICADOS, OPORTUNIDADES, ACCIONES SUGERIDAS, NORMAS RELACIONADAS e IMPACTO EMPRESARIAL.'
+
+
+def build_summary_prompt(concept: Concept, max_text_length: int) -> str:
+    """Build prompt for concept summarization."""
+    # Truncate text if too long
+    text = concept.full_text[:max_text_length]
+
+    prompt = f"""Eres un abogado tributarista experto. Resume el siguiente concepto de la DIAN en un máximo de 6 frases, destacando:
+
+1. Implicaciones prácticas para contribuyentes
+2. Cambios normativos relevantes
+3. Obligaciones y responsabilidades
+4. Recomendaciones para clientes
+
+Información del concepto:
+- Título: {concept.title}
+- Tema: {concept.theme}
+- Descriptor: {concept.descriptor}
+
+Texto completo:
+{text}
+
+Resumen:"""
+
+    return prompt
+
+
+def build_analysis_prompt(concept: Concept, summary: str) -> str:
+    """Build prompt for concept analysis."""
+    prompt = f"""Actúa como consultor tributario sénior. Con base en el siguiente resumen y la información del concepto, proporciona un análisis detallado que incluya:
+
+1. RIESGOS IDENTIFICADOS: Principales riesgos para contribuyentes
+2. OPORTUNIDADES: Beneficios o ventajas tributarias
+3. ACCIONES SUGERIDAS: Pasos específicos a seguir
+4. NORMAS RELACIONADAS: Referencias legales relevantes
+5. IMPACTO EMPRESARIAL: Efectos en diferentes tipos de empresas
+
+Información del concepto:
+- Título: {concept.title}
+- Tema: {concept.theme}
+- Descriptor: {concept.descriptor}
+- Fecha: {concept.date.strftime('%Y-%m-%d')}
+
+Resumen:
+{summary}
+
+Análisis:"""
+
+    return prompt
+
+
+def build_combined_prompt(concept: Concept, max_text_length: int) -> str:
+    """Build one prompt asking for summary and analysis as a JSON object."""
+    text = concept.full_text[:max_text_length]
+
+    prompt = f"""Eres un abogado tributarista experto y consultor tributario sénior. Lee el siguiente concepto de la DIAN y responde únicamente con un objeto JSON con dos campos de texto:
+
+{_SUMMARY_FIELD}
+
+{_ANALYSIS_FIELD}
+
+Información del concepto:
+- Título: {concept.title}
+- Tema: {concept.theme}
+- Descriptor: {concept.descriptor}
+- Fecha: {concept.date.strftime('%Y-%m-%d')}
+
+Texto completo:
+{text}
+
+Respuesta JSON:"""
+
+    return prompt
+
+
+def build_batch_prompt(concepts: List[Concept], max_text_length: int) -> str:
+    """Build one prompt asking for summary and analysis of several concepts."""
+    blocks = "\n\n".join(
+        f"""### CONCEPTO {index} ###
+- Título: {concept.title}
+- Tema: {concept.theme}
+- Descriptor: {concept.descriptor}
+- Fecha: {concept.date.strftime('%Y-%m-%d')}
+
+Texto completo:
+{concept.full_text[:max_text_length]}"""
+        for index, concept in enumerate(concepts, start=1)
+    )
+
+    prompt = f"""Eres un abogado tributarista experto y consultor tributario sénior. Lee los siguientes {len(concepts)} conceptos de la DIAN y responde únicamente con un objeto JSON con la clave "results": una lista con un objeto por concepto, cada uno con tres campos:
+
+"id": número del concepto (1 a {len(concepts)}).
+
+{_SUMMARY_FIELD}
+
+{_ANALYSIS_FIELD}
+
+{blocks}
+
+Respuesta JSON:"""
+
+    return prompt
+
+
+def apply_combined_reply(concept: Concept, content: str) -> bool:
+    """Set summary and analysis from a combined JSON reply.
+
+    Returns False, leaving the concept untouched, when the reply is not a
+    JSON object with two non-empty text fields.
+    """
+    pair = _text_pair(_loads(content))
+    if pair is None:
+        return False
+
+    concept.summary, concept.analysis = pair
+    return True
+
+
+def apply_batch_reply(concepts: List[Concept], content: str) -> List[bool]:
+    """Set summary and analysis from a batch JSON reply.
+
+    Answers are matched by ``id``, so a reply that skips or reorders
+    concepts still fills the ones it answered. Returns, per concept,
+    whether it was filled.
+    """
+    data = _loads(content)
+    results = data.get("results") if isinstance(data, dict) else None
+    answers = {}
+    for item in results if isinstance(results, list) else ():
+        pair = _text_pair(item)
+        if pair is not None and isinstance(item.get("id"), int):
+            answers[item["id"]] = pair
+
+    filled = []
+    for index, concept in enumerate(concepts, start=1):
+        pair = answers.get(index)
+        if pair is not None:
+            concept.summary, concept.analysis = pair
+        filled.append(pair is not None)
+    return filled
+
+
+def _loads(content: str) -> Any:
+    """Decode a JSON reply, or None if it is not valid JSON."""
+    try:
+        return _json_loads(content)
+    except ValueError:  # orjson.JSONDecodeError is a ValueError too
+        return None
+
+
+def _text_pair(data: Any) -> Optional[Tuple[str, str]]:
+    """Return stripped (summary, analysis) if both are non-empty text."""
+    if not isinstance(data, dict):
+        return None
+    summary, analysis = data.get("summary"), data.get("analysis")
+    if not isinstance(summary, str) or not isinstance(analysis, str):
+        return None
+
+    summary, analysis = summary.strip(), analysis.strip()
+    if not summary or not analysis:
+        return None
+    return summary, analysis
@@ -3,7 +3,96 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set
+
+# Patterns are compiled once at import instead of looked up per call
+_WS_RE = re.compile(r'\s+')
+_CTRL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+_WORD_RE = re.compile(r'\b[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]{3,}\b')
+_SENT_RE = re.compile(r'[.!?]+')
+
+_STOP_WORDS = frozenset({
+    'que', 'con', 'para', 'por', 'del', 'las', 'los', 'una', 'uno', 'son',
+    'como', 'más', 'pero', 'sus', 'le', 'la', 'el', 'de', 'en', 'y', 'a',
+    'es', 'se', 'no', 'te', 'lo', 'le', 'da', 'su', 'si', 'ya', 'me',
+    'mi', 'tu', 'ti', 'nos', 'os', 'ellos', 'ellas', 'nosotros', 'nosotras'
+})
+
+# Common legal/tax entities
+_ENTITY_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # Proper nouns
+    r'\b(?:DIAN|IVA|GMF|Renta|Timbre|Aduanas)\b',  # Tax terms
+    r'\b(?:Ley|Decreto|Resolución|Circular)\s+\d+',  # Legal documents
+    r'\b(?:Artículo|Art\.)\s+\d+',  # Articles
+))
+
+_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',  # DD/MM/YYYY or DD-MM-YYYY
+    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',  # YYYY/MM/DD or YYYY-MM-DD
+    r'\b\d{1,2}\s+de\s+\w+\s+de\s+\d{4}\b',  # Spanish dates
+))
+
+_AMOUNT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?',  # $1,000.00
+    r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:pesos|dólares)',  # 1,000 pesos
+    r'\d+(?:\.\d{2})?\s*(?:pesos|dólares)',  # 1000 pesos
+))
+
+_LEGAL_INDICATORS = {
+    'document': r'\b(?:concepto|oficio|resolución|decreto|ley|circular)\b',
+    'article': r'\b(?:artículo|art\.)\s*\d+',
+    'tax': r'\b(?:DIAN|impuesto|tributario|fiscal)\b',
+    'duty': r'\b(?:obligación|derecho|deber|procedimiento)\b',
+}
+
+_TAX_TOPICS = {
+    'IVA': r'\b(?:IVA|impuesto\s+sobre\s+las\s+ventas)\b',
+    'Renta': r'\b(?:impuesto\s+de\s+renta|renta)\b',
+    'GMF': r'\b(?:GMF|gravamen\s+a\s+los\s+movimientos\s+financieros)\b',
+    'Timbre': r'\b(?:impuesto\s+de\s+timbre|timbre)\b',
+    'Aduanas': r'\b(?:aduana|importación|exportación)\b',
+    'Retención': r'\b(?:retención\s+en\s+la\s+fuente|rete)\b',
+    'Facturación': r'\b(?:factura\s+electrónica|facturación)\b',
+    'Declaración': r'\b(?:declaración\s+tributaria|declaración)\b',
+}
+
+
+def _fuse(patterns: Dict[str, str]) -> re.Pattern:
+    """Join patterns into one alternation with a named group per pattern.
+
+    Only valid for pattern sets that never match overlapping text, as
+    the indicator and topic sets above: a single ``finditer`` pass then
+    finds exactly what searching each pattern separately would.
+    """
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns.items()),
+        re.IGNORECASE,
+    )
+
+
+_LEGAL_RE = _fuse(_LEGAL_INDICATORS)
+_TAX_TOPIC_RE = _fuse(_TAX_TOPICS)
+
+
+def _scan(pattern: re.Pattern, text: str, wanted: int) -> Set[str]:
+    """Collect matched group names in one pass, stopping at ``wanted``."""
+    found: Set[str] = set()
+    for match in pattern.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) >= wanted:
+            break
+    return found
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield the pieces ``_SENT_RE.split`` would return, lazily."""
+    start = 0
+    for match in _SENT_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
 
 
 class TextProcessor:
@@ -16,10 +105,10 @@ class TextProcessor:
             return ""
         
         # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         
         # Remove non-printable characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+        text = _CTRL_RE.sub('', text)
         
         return text
 
@@ -30,25 +119,15 @@ class TextProcessor:
             return []
         
         # Simple keyword extraction (can be enhanced with NLP libraries)
-        words = re.findall(r'\b[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]{3,}\b', text.lower())
-        
-        # Remove common stop words
-        stop_words = {
-            'que', 'con', 'para', 'por', 'del', 'las', 'los', 'una', 'uno', 'son',
-            'como', 'más', 'pero', 'sus', 'le', 'la', 'el', 'de', 'en', 'y', 'a',
-            'es', 'se', 'no', 'te', 'lo', 'le', 'da', 'su', 'si', 'ya', 'me',
-            'mi', 'tu', 'ti', 'nos', 'os', 'ellos', 'ellas', 'nosotros', 'nosotras'
-        }
-        
-        # Count word frequency
-        word_count = {}
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_count[word] = word_count.get(word, 0) + 1
-        
-        # Sort by frequency and return top keywords
-        sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:max_keywords]]
+        words = _WORD_RE.findall(text.lower())
+        
+        # Count word frequency, skipping common stop words
+        word_count = Counter(
+            word for word in words if word not in _STOP_WORDS and len(word) > 3
+        )
+
+        # most_common keeps first-seen order among equal counts, like sorted()
+        return [word for word, _ in word_count.most_common(max_keywords)]
 
     @staticmethod
     def extract_summary(text: str, max_sentences: int = 3) -> str:
@@ -56,37 +135,26 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Simple heuristic: return first few sentences, stopping the scan there
+        sentences = filter(None, (s.strip() for s in _iter_sentences(text)))
+        summary_sentences = list(islice(sentences, max_sentences))
         
-        if not sentences:
+        if not summary_sentences:
             return ""
         
-        # Simple heuristic: return first few sentences
-        summary_sentences = sentences[:max_sentences]
         return '. '.join(summary_sentences) + '.'
 
     @staticmethod
-    def extract_entities(text: str) -> List[str]:
-        """Extract potential entities from text."""
+    def extract_entities(text: str) -> Set[str]:
+        """Extract potential entities from text (unique, unordered)."""
         if not text:
-            return []
+            return set()
         
-        # Look for common legal/tax entities
-        entity_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # Proper nouns
-            r'\b(?:DIAN|IVA|GMF|Renta|Timbre|Aduanas)\b',  # Tax terms
-            r'\b(?:Ley|Decreto|Resolución|Circular)\s+\d+',  # Legal documents
-            r'\b(?:Artículo|Art\.)\s+\d+',  # Articles
-        ]
+        entities: Set[str] = set()
+        for pattern in _ENTITY_RES:
+            entities.update(pattern.findall(text))
         
-        entities = []
-        for pattern in entity_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities.extend(matches)
-        
-        return list(set(entities))
+        return entities
 
     @staticmethod
     def calculate_complexity_score(text: str) -> float:
@@ -94,13 +162,14 @@ class TextProcessor:
         if not text:
             return 0.0
         
-        # Simple complexity metrics
-        sentences = len(re.split(r'[.!?]+', text))
-        words = len(text.split())
-        avg_sentence_length = words / sentences if sentences > 0 else 0
-        
+        # Simple complexity metrics; N separators delimit N + 1 sentences
+        sentences = len(_SENT_RE.findall(text)) + 1
+        word_list = text.split()
+        words = len(word_list)
+        avg_sentence_length = words / sentences
+
         # Complex words (more than 3 syllables approximation)
-        complex_words = len([w for w in text.split() if len(w) > 8])
+        complex_words = len([w for w in word_list if len(w) > 8])
         complex_word_ratio = complex_words / words if words > 0 else 0
         
         # Normalize to 0-1 scale
@@ -108,44 +177,28 @@ class TextProcessor:
         return min(complexity, 1.0)
 
     @staticmethod
-    def extract_dates(text: str) -> List[str]:
-        """Extract dates from text."""
+    def extract_dates(text: str) -> Set[str]:
+        """Extract dates from text (unique, unordered)."""
         if not text:
-            return []
+            return set()
         
-        # Date patterns
-        date_patterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',  # DD/MM/YYYY or DD-MM-YYYY
-            r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',  # YYYY/MM/DD or YYYY-MM-DD
-            r'\b\d{1,2}\s+de\s+\w+\s+de\s+\d{4}\b',  # Spanish dates
-        ]
+        dates: Set[str] = set()
+        for pattern in _DATE_RES:
+            dates.update(pattern.findall(text))
         
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            dates.extend(matches)
-        
-        return list(set(dates))
+        return dates
 
     @staticmethod
-    def extract_amounts(text: str) -> List[str]:
-        """Extract monetary amounts from text."""
+    def extract_amounts(text: str) -> Set[str]:
+        """Extract monetary amounts from text (unique, unordered)."""
         if not text:
-            return []
+            return set()
         
-        # Amount patterns
-        amount_patterns = [
-            r'\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?',  # $1,000.00
-            r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:pesos|dólares)',  # 1,000 pesos
-            r'\d+(?:\.\d{2})?\s*(?:pesos|dólares)',  # 1000 pesos
-        ]
+        amounts: Set[str] = set()
+        for pattern in _AMOUNT_RES:
+            amounts.update(pattern.findall(text))
         
-        amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            amounts.extend(matches)
-        
-        return list(set(amounts))
+        return amounts
 
     @staticmethod
     def is_legal_document(text: str) -> bool:
@@ -153,17 +206,7 @@ class TextProcessor:
         if not text:
             return False
         
-        legal_indicators = [
-            r'\b(?:concepto|oficio|resolución|decreto|ley|circular)\b',
-            r'\b(?:artículo|art\.)\s*\d+',
-            r'\b(?:DIAN|impuesto|tributario|fiscal)\b',
-            r'\b(?:obligación|derecho|deber|procedimiento)\b',
-        ]
-        
-        text_lower = text.lower()
-        matches = sum(1 for pattern in legal_indicators if re.search(pattern, text_lower))
-        
-        return matches >= 2
+        return len(_scan(_LEGAL_RE, text, 2)) >= 2
 
     @staticmethod
     def extract_tax_topics(text: str) -> List[str]:
@@ -171,22 +214,12 @@ class TextProcessor:
         if not text:
             return []
         
-        tax_topics = {
-            'IVA': r'\b(?:IVA|impuesto\s+sobre\s+las\s+ventas)\b',
-            'Renta': r'\b(?:impuesto\s+de\s+renta|renta)\b',
-            'GMF': r'\b(?:GMF|gravamen\s+a\s+los\s+movimientos\s+financieros)\b',
-            'Timbre': r'\b(?:impuesto\s+de\s+timbre|timbre)\b',
-            'Aduanas': r'\b(?:aduana|importación|exportación)\b',
-            'Retención': r'\b(?:retención\s+en\s+la\s+fuente|rete)\b',
-            'Facturación': r'\b(?:factura\s+electrónica|facturación)\b',
-            'Declaración': r'\b(?:declaración\s+tributaria|declaración)\b',
-        }
-        
-        topics = []
-        text_lower = text.lower()
-        
-        for topic, pattern in tax_topics.items():
-            if re.search(pattern, text_lower):
-                topics.append(topic)
-        
-        return topics
+        found = _scan(_TAX_TOPIC_RE, text, len(_TAX_TOPICS))
+        return [topic for topic in _TAX_TOPICS if topic in found]
+
+    @staticmethod
+    def is_tax_relevant(text: str) -> bool:
+        """Check if text looks like tax/legal content worth an AI analysis."""
+        return TextProcessor.is_legal_document(text) or bool(
+            TextProcessor.extract_tax_topics(text)
+        )
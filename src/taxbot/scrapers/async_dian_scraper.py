@@ -0,0 +1,177 @@
+"""Concurrent DIAN scraper built on a shared httpx.AsyncClient."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from ..core.config import Settings
+from ..models.concept import Concept
+from .base import NetworkError, RateLimitError, ScraperError
+from .dian_scraper import HTML_PARSER, DianScraper
+from .rate_limiter import AdaptiveLimiter, retry_after_seconds
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for DIAN page fetches."""
+    return httpx.AsyncClient(
+        headers=DianScraper.HEADERS,
+        limits=httpx.Limits(max_connections=settings.scraper_max_connections),
+        timeout=settings.scraper_timeout,
+        follow_redirects=True,
+    )
+
+
+class AsyncDianScraper(DianScraper):
+    """DIAN scraper that overlaps page fetches instead of running them serially."""
+
+    def __init__(self):
+        """Initialize scraper; the fetch limiter is created per run."""
+        super().__init__()
+        self._limiter: Optional[AdaptiveLimiter] = None
+
+    async def ascrape_concepts(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> List[Concept]:
+        """Scrape DIAN concepts with concurrent month and full-text fetches.
+
+        A long-lived ``client`` can be passed in to reuse its connection
+        pool; otherwise one is created for this run.
+        """
+        if client is None:
+            async with create_http_client(self.settings) as own_client:
+                return await self.ascrape_concepts(own_client)
+
+        self.logger.info("Starting async DIAN concepts scraping")
+
+        try:
+            valid_concepts = [
+                concept
+                async for month in self.aiter_concepts(client)
+                for concept in month
+            ]
+            self.logger.info(f"Successfully scraped {len(valid_concepts)} concepts")
+            return valid_concepts
+
+        except Exception as e:
+            self.logger.error(f"Failed to scrape DIAN concepts: {e}")
+            raise ScraperError(f"Scraping failed: {e}") from e
+
+    async def aiter_concepts(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[List[Concept]]:
+        """Yield validated concepts month by month as their pages complete."""
+        if client is None:
+            async with create_http_client(self.settings) as own_client:
+                async for concepts in self.aiter_concepts(own_client):
+                    yield concepts
+            return
+
+        # Queue excess fetches here instead of in the pool, where waiting
+        # counts against the request timeout; a new loop gets a new one
+        self._limiter = AdaptiveLimiter(self.settings.scraper_max_connections)
+
+        month_links = await self._adiscover_month_links(client)
+        months = [self._ascrape_month(client, url) for url in month_links]
+        for next_month in asyncio.as_completed(months):
+            concepts = await next_month
+            if concepts:
+                yield self._clean_concepts(concepts)
+
+    async def _ascrape_month(
+        self, client: httpx.AsyncClient, url: str
+    ) -> List[Concept]:
+        """Parse a month page and fetch the full text of its concepts."""
+        concepts = await self._aparse_month(client, url)
+        texts = await asyncio.gather(
+            *(self._afetch_full_text(client, c.link) for c in concepts)
+        )
+        for concept, text in zip(concepts, texts):
+            concept.full_text = text
+        return concepts
+
+    @retry(
+        retry=retry_if_exception_type(
+            (httpx.TransportError, NetworkError, RateLimitError)
+        ),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+    )
+    async def _afetch_soup(self, client: httpx.AsyncClient, url: str) -> BeautifulSoup:
+        """Fetch and parse HTML with retry logic."""
+        try:
+            response = await self._aget(client, url)
+            response.raise_for_status()
+            # Parse off the event loop so other responses keep flowing
+            return await asyncio.to_thread(BeautifulSoup, response.text, HTML_PARSER)
+
+        except httpx.TimeoutException:
+            raise NetworkError(f"Request timeout for {url}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                raise RateLimitError(f"Rate limited: {e}")
+            raise NetworkError(f"HTTP error {e.response.status_code} for {url}")
+
+    async def _aget(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """GET ``url`` within the adaptive limit and report how it went."""
+        limiter = self._limiter
+        if limiter is None:
+            return await client.get(url)
+
+        async with limiter.slot() as started:
+            try:
+                response = await client.get(url)
+            except httpx.TimeoutException:
+                limiter.throttled(started)
+                raise
+
+        if response.status_code == 429 or response.status_code >= 500:
+            limiter.throttled(started, retry_after_seconds(response.headers))
+            self.logger.warning(
+                f"Server pushed back ({response.status_code}), "
+                f"limiting to {int(limiter.limit)} concurrent requests"
+            )
+        else:
+            limiter.success()
+        return response
+
+    async def _adiscover_month_links(self, client: httpx.AsyncClient) -> List[str]:
+        """Discover month links from the main page."""
+        try:
+            soup = await self._afetch_soup(client, self.LIST_URL)
+        except Exception as e:
+            self.logger.error(f"Failed to fetch main page: {e}")
+            return [self.LIST_URL]  # Fallback to main URL
+
+        return self._extract_month_links(soup)
+
+    async def _aparse_month(
+        self, client: httpx.AsyncClient, url: str
+    ) -> List[Concept]:
+        """Parse concepts from a month page without their full text."""
+        try:
+            soup = await self._afetch_soup(client, url)
+        except Exception as e:
+            self.logger.error(f"Failed to parse month {url}: {e}")
+            return []
+
+        return self._extract_month_concepts(soup, url, fetch_full_text=False)
+
+    async def _afetch_full_text(self, client: httpx.AsyncClient, url: str) -> str:
+        """Fetch full text content from concept URL."""
+        try:
+            soup = await self._afetch_soup(client, url)
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch full text from {url}: {e}")
+            return ""
+
+        return self._extract_full_text(soup)
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import re
-import time
 from datetime import datetime
-from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterable, List, Optional, Set
 from urllib.parse import urljoin
 
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from tenacity import (
     retry,
@@ -18,10 +17,24 @@ from tenacity import (
     wait_exponential,
 )
 
-from ..core.config import get_settings
-from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
-from .base import BaseScraper, NetworkError, ParseError, RateLimitError, ScraperError
+from .base import BaseScraper, NetworkError, RateLimitError, ScraperError
+
+try:
+    import lxml  # noqa: F401 - only probed; BeautifulSoup imports it itself
+except ImportError:  # pragma: no cover - lxml is a core dependency
+    HTML_PARSER = "html.parser"
+else:
+    # C parser, several times faster than the pure-Python html.parser
+    HTML_PARSER = "lxml"
+
+# Compiled once: soup.select() looks each selector string up on every call
+_MONTH_LINK_SEL = sv.compile("div.view-content a.btn")
+_ROW_SEL = sv.compile("table.table tbody tr")
+
+# Labels may sit anywhere in the paragraph; the text after them is the value
+_THEME_LABEL_RE = re.compile(r"tema[: ]*", re.IGNORECASE)
+_DESCRIPTOR_LABEL_RE = re.compile(r"descriptor[: ]*", re.IGNORECASE)
 
 
 class DianScraper(BaseScraper):
@@ -29,13 +42,32 @@ class DianScraper(BaseScraper):
 
     BASE_URL = "https://cijuf.org.co"
     LIST_URL = "https://cijuf.org.co/normatividad/conceptos-y-oficios-dian/2025"
+    HEADERS = {
+        "User-Agent": "TaxBot/1.0 (Enterprise DIAN Scraper)",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+    CONTENT_SELECTORS = (
+        "div.field--name-body",
+        "div.region-content",
+        "div.content",
+        "main",
+        "article",
+    )
+    _CONTENT_SELS = tuple(map(sv.compile, CONTENT_SELECTORS))
     
     def __init__(self):
         """Initialize DIAN scraper."""
         super().__init__()
-        self._session = None
         self._seen_links: Set[str] = set()
 
+    def skip_links(self, links: Iterable[str]) -> None:
+        """Treat ``links`` as already scraped; their pages are not fetched."""
+        self._seen_links.update(links)
+
     def get_source_name(self) -> str:
         """Get the name of the data source."""
         return "DIAN Concepts"
@@ -81,14 +113,7 @@ class DianScraper(BaseScraper):
         """Fetch and parse HTML with retry logic."""
         if not self._session:
             self._session = requests.Session()
-            self._session.headers.update({
-                "User-Agent": "TaxBot/1.0 (Enterprise DIAN Scraper)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            })
+            self._session.headers.update(self.HEADERS)
 
         try:
             response = self._session.get(
@@ -96,16 +121,9 @@ class DianScraper(BaseScraper):
                 timeout=self.settings.scraper_timeout,
                 allow_redirects=True,
             )
+            # A 429 surfaces as HTTPError and becomes RateLimitError below
             response.raise_for_status()
-            
-            # Check for rate limiting
-            if response.status_code == 429:
-                wait_time = int(response.headers.get("Retry-After", 60))
-                self.logger.warning(f"Rate limited, waiting {wait_time} seconds")
-                time.sleep(wait_time)
-                raise RateLimitError("Rate limited by server")
-            
-            return BeautifulSoup(response.text, "html.parser")
+            return BeautifulSoup(response.text, HTML_PARSER)
             
         except requests.Timeout:
             raise NetworkError(f"Request timeout for {url}")
@@ -124,7 +142,11 @@ class DianScraper(BaseScraper):
             self.logger.error(f"Failed to fetch main page: {e}")
             return [self.LIST_URL]  # Fallback to main URL
 
-        anchors = soup.select("div.view-content a.btn")
+        return self._extract_month_links(soup)
+
+    def _extract_month_links(self, soup: BeautifulSoup) -> List[str]:
+        """Extract month links from the main page."""
+        anchors = _MONTH_LINK_SEL.select(soup)
         if not anchors:
             self.logger.warning("No month links found, using main URL")
             return [self.LIST_URL]
@@ -147,12 +169,18 @@ class DianScraper(BaseScraper):
             self.logger.error(f"Failed to parse month {url}: {e}")
             return []
 
-        rows = soup.select("table.table tbody tr")
+        return self._extract_month_concepts(soup, url)
+
+    def _extract_month_concepts(
+        self, soup: BeautifulSoup, url: str, fetch_full_text: bool = True
+    ) -> List[Concept]:
+        """Extract unseen concepts from a parsed month page."""
+        rows = _ROW_SEL.select(soup)
         concepts = []
 
         for row in rows:
             try:
-                concept = self._parse_concept_row(row)
+                concept = self._parse_concept_row(row, fetch_full_text)
                 if concept and concept.link not in self._seen_links:
                     self._seen_links.add(concept.link)
                     concepts.append(concept)
@@ -163,7 +191,9 @@ class DianScraper(BaseScraper):
         self.logger.info(f"Parsed {len(concepts)} concepts from {url}")
         return concepts
 
-    def _parse_concept_row(self, row) -> Optional[Concept]:
+    def _parse_concept_row(
+        self, row, fetch_full_text: bool = True
+    ) -> Optional[Concept]:
         """Parse a single concept row."""
         cells = row.find_all("td")
         if len(cells) < 2:
@@ -178,18 +208,16 @@ class DianScraper(BaseScraper):
         link = urljoin(self.BASE_URL, anchor["href"])
 
         # Extract date
-        date_text = ""
         time_tag = cells[0].find("time")
-        if time_tag:
-            date_text = self._clean_text(time_tag.get_text())
-        
+        date_text = self._clean_text(time_tag.get_text()) if time_tag else ""
         date = self._parse_date(date_text) or datetime.utcnow()
 
         # Extract theme and descriptor
         theme, descriptor = self._extract_theme_descriptor(cells[1])
 
-        # Fetch full text
-        full_text = self._fetch_full_text(link)
+        # Rows dropped as already seen do not need their page fetched
+        fetch = fetch_full_text and link not in self._seen_links
+        full_text = self._fetch_full_text(link) if fetch else ""
 
         return Concept(
             title=title,
@@ -211,8 +239,7 @@ class DianScraper(BaseScraper):
         if not date_text:
             return None
 
-        formats = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y")
-        for fmt in formats:
+        for fmt in ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y"):
             try:
                 return datetime.strptime(date_text.strip(), fmt)
             except ValueError:
@@ -231,32 +258,18 @@ class DianScraper(BaseScraper):
         descriptor_parts = []
 
         for text in paragraphs:
-            lower = text.lower()
-            if "tema" in lower:
-                candidate = self._strip_label(text, "tema")
-                if candidate:
-                    theme = candidate
-            elif "descriptor" in lower:
-                candidate = self._strip_label(text, "descriptor")
-                if candidate:
-                    descriptor_parts.append(candidate)
-            else:
-                descriptor_parts.append(text)
+            # Paragraphs are already clean, so the value is a plain slice
+            match = _THEME_LABEL_RE.search(text)
+            if match:
+                theme = text[match.end():] or theme
+                continue
+
+            match = _DESCRIPTOR_LABEL_RE.search(text)
+            descriptor_parts.append(text[match.end():] if match else text)
 
         descriptor = " ".join(part for part in descriptor_parts if part).strip()
         return theme, descriptor
 
-    def _strip_label(self, text: str, label: str) -> str:
-        """Strip label from text."""
-        lower = text.lower()
-        idx = lower.find(label)
-        if idx == -1:
-            return self._clean_text(text)
-        
-        remaining = text[idx + len(label):]
-        remaining = remaining.lstrip(": ")
-        return self._clean_text(remaining)
-
     def _fetch_full_text(self, url: str) -> str:
         """Fetch full text content from concept URL."""
         try:
@@ -265,17 +278,13 @@ class DianScraper(BaseScraper):
             self.logger.warning(f"Failed to fetch full text from {url}: {e}")
             return ""
 
-        # Try multiple selectors for content
-        selectors = [
-            "div.field--name-body",
-            "div.region-content",
-            "div.content",
-            "main",
-            "article",
-        ]
+        return self._extract_full_text(soup)
 
-        for selector in selectors:
-            container = soup.select_one(selector)
+    def _extract_full_text(self, soup: BeautifulSoup) -> str:
+        """Extract the concept body from a parsed page."""
+        # Try multiple selectors for content
+        for selector in self._CONTENT_SELS:
+            container = selector.select_one(soup)
             if container:
                 text = self._clean_text(container.get_text(" ", strip=True))
                 if text and len(text) > 100:  # Ensure we have substantial content
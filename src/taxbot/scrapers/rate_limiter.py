@@ -0,0 +1,72 @@
+"""Adaptive concurrency limit for polite concurrent fetching."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Mapping, Optional
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with a shared ``Retry-After`` pause.
+
+    Starts at ``max_limit`` in-flight requests. Each success adds
+    ``1 / limit`` (about one slot per round of requests); a throttled
+    response halves the limit, at most once per round, and a
+    ``Retry-After`` delay holds back every request that has not started.
+    """
+
+    def __init__(self, max_limit: int):
+        """Initialize limiter; create it inside the event loop that uses it."""
+        self.max_limit = max(1, max_limit)
+        self.limit = float(self.max_limit)
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._last_cut = 0.0
+        self._changed = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Hold one request slot; yields the monotonic start time."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+        try:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield time.monotonic()
+        finally:
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
+    def success(self) -> None:
+        """Grow the limit additively after a good response."""
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def throttled(self, started: float, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429, 5xx or timeout for a request begun at ``started``."""
+        # Requests sent before the last cut already reflect that cut
+        if started >= self._last_cut:
+            self.limit = max(1.0, self.limit / 2)
+            self._last_cut = time.monotonic()
+        if retry_after:
+            self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Read a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
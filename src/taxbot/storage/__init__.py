@@ -4,7 +4,10 @@ from .csv_query import CsvQuery
 from .csv_reader import CsvReader
 from .csv_repository import CsvRepository
 from .csv_writer import CsvWriter
+from .factory import create_repository
+from .link_filter import LinkBloomFilter, load_link_filter
 from .repository import ConceptNotFoundError, Repository, RepositoryError
+from .sqlite_repository import SqliteRepository
 
 __all__ = [
     "CsvQuery",
@@ -12,6 +15,10 @@ __all__ = [
     "CsvRepository",
     "CsvWriter",
     "ConceptNotFoundError",
+    "LinkBloomFilter",
     "Repository",
     "RepositoryError",
+    "SqliteRepository",
+    "create_repository",
+    "load_link_filter",
 ]
@@ -0,0 +1,274 @@
+"""Read indexes kept next to the CSV file, rebuilt when it changes."""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from ..core.logging import get_scraper_logger
+from ..models.concept import Concept
+from .repository import file_version
+
+# Number of newest concepts materialized for /concepts/latest
+LATEST_TAIL_SIZE = 100
+
+
+class _LineTracker:
+    """Decode lines for csv.reader while tracking the byte offset."""
+
+    def __init__(self, handle: BinaryIO, offset: int = 0):
+        self.handle = handle
+        self.offset = offset
+
+    def __iter__(self) -> _LineTracker:
+        return self
+
+    def __next__(self) -> str:
+        line = self.handle.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+
+def scan_rows(csv_path: Path) -> Iterator[Tuple[Dict[str, str], int]]:
+    """Yield every data row as a dict together with its byte offset."""
+    if not csv_path.exists():
+        return
+
+    with open(csv_path, "rb") as handle:
+        lines = _LineTracker(handle)
+        reader = csv.reader(lines)
+        header = next(reader, [])
+        while True:
+            offset = lines.offset
+            row = next(reader, None)
+            if row is None:
+                return
+            yield dict(zip(header, row)), offset
+
+
+def read_rows_at(csv_path: Path, offsets: List[int]) -> pd.DataFrame:
+    """Read only the CSV records starting at ``offsets``, in that order."""
+    rows = []
+    with open(csv_path, "rb") as handle:
+        header = next(csv.reader(_LineTracker(handle)))
+        for offset in offsets:
+            handle.seek(offset)
+            rows.append(next(csv.reader(_LineTracker(handle, offset))))
+
+    df = pd.DataFrame(rows, columns=header)
+    df = df.replace("", pd.NA)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
+def read_versioned(csv_path: Path, path: Path, key: str, version: str = None):
+    """Load ``key`` from an index file built from ``version`` of the CSV.
+
+    Returns None when the file is missing, unreadable or stale.
+    """
+    if version is None:
+        version = file_version(csv_path)[0]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data[key] if data.get("version") == version else None
+
+
+def write_versioned(
+    csv_path: Path, path: Path, key: str, value, version: str = None
+) -> None:
+    """Atomically write an index file stamped with ``version`` of the CSV.
+
+    Rebuilds must pass the version read before scanning: a write landing
+    mid-scan then leaves the index stale instead of stamped as current.
+    ``None`` stamps the current version (callers holding the write lock).
+    """
+    if version is None:
+        version = file_version(csv_path)[0]
+    write_atomic(path, json.dumps({"version": version, key: value}))
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` via a temp file unique to this writer."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as handle:
+        handle.write(text)
+    try:
+        os.replace(handle.name, path)
+    except OSError:
+        os.unlink(handle.name)
+        raise
+
+
+class CsvThemeIndex:
+    """Sorted theme list and theme -> row byte offsets for a CSV file.
+
+    Both files record the CSV version they were built from; a mismatch
+    (any write other than an indexed append) triggers a rebuild on read.
+    """
+
+    def __init__(self, csv_path: Path, logger=None):
+        """Initialize theme index for the given CSV file."""
+        self.csv_path = csv_path
+        self.logger = logger or get_scraper_logger()
+        self.index_dir = csv_path.parent / "indexes"
+        self.themes_path = self.index_dir / "themes.json"
+        self.offsets_path = self.index_dir / "theme_offsets.json"
+
+    def get_themes(self) -> List[str]:
+        """Return the sorted unique themes."""
+        themes = self._read(self.themes_path, "themes")
+        if themes is None:
+            themes = self.rebuild()[0]
+        return themes
+
+    def get_offsets(self, theme: str) -> List[int]:
+        """Return row offsets for themes matching ``theme`` (case-insensitive)."""
+        offsets = self._read(self.offsets_path, "offsets")
+        if offsets is None:
+            offsets = self.rebuild()[1]
+
+        pattern = re.compile(theme, re.IGNORECASE)
+        return sorted(
+            offset
+            for name, theme_offsets in offsets.items()
+            if pattern.search(name)
+            for offset in theme_offsets
+        )
+
+    def load_rows(self, offsets: List[int]) -> pd.DataFrame:
+        """Read only the CSV rows starting at ``offsets``."""
+        return read_rows_at(self.csv_path, offsets)
+
+    def record_append(
+        self, previous_version: str, concepts: List[Concept], offsets: List[int]
+    ) -> None:
+        """Extend an up-to-date index with rows just appended to the CSV."""
+        themes = self._read(self.themes_path, "themes", previous_version)
+        theme_offsets = self._read(self.offsets_path, "offsets", previous_version)
+        if themes is None or theme_offsets is None:
+            return  # Stale already; the next read rebuilds it
+
+        for concept, offset in zip(concepts, offsets):
+            theme_offsets.setdefault(concept.theme, []).append(offset)
+        self._write(sorted(set(themes) | set(theme_offsets)), theme_offsets)
+
+    def rebuild(self) -> Tuple[List[str], Dict[str, List[int]]]:
+        """Scan the CSV once and rewrite both index files."""
+        version = file_version(self.csv_path)[0]
+        theme_offsets: Dict[str, List[int]] = {}
+        for theme, offset in self._scan():
+            theme_offsets.setdefault(theme, []).append(offset)
+
+        themes = sorted(theme_offsets)
+        self._write(themes, theme_offsets, version)
+        self.logger.debug(f"Rebuilt theme index for {self.csv_path}")
+        return themes, theme_offsets
+
+    def _scan(self) -> Iterator[Tuple[str, int]]:
+        """Yield (theme, byte offset) for every data row."""
+        for row, offset in scan_rows(self.csv_path):
+            if row.get("theme"):
+                yield row["theme"], offset
+
+    def _read(self, path: Path, key: str, version: str = None):
+        """Load one index file if it matches ``version`` (default: current)."""
+        return read_versioned(self.csv_path, path, key, version)
+
+    def _write(
+        self,
+        themes: List[str],
+        offsets: Dict[str, List[int]],
+        version: str = None,
+    ) -> None:
+        """Write both index files stamped with ``version`` (default: current)."""
+        if version is None:
+            version = file_version(self.csv_path)[0]
+        write_versioned(self.csv_path, self.themes_path, "themes", themes, version)
+        write_versioned(self.csv_path, self.offsets_path, "offsets", offsets, version)
+
+
+class CsvLatestTail:
+    """The ``LATEST_TAIL_SIZE`` newest records by date, as JSON lines.
+
+    The first line stamps the CSV version the tail was built from.
+    """
+
+    def __init__(self, csv_path: Path, logger=None):
+        """Initialize latest-concepts tail for the given CSV file."""
+        self.csv_path = csv_path
+        self.logger = logger or get_scraper_logger()
+        self.tail_path = csv_path.parent / "indexes" / "latest_tail.jsonl"
+
+    def get_latest(self, limit: int) -> Optional[List[Dict[str, str]]]:
+        """Return the newest ``limit`` records, or None if not covered."""
+        if limit > LATEST_TAIL_SIZE:
+            return None
+
+        records = self._read()
+        if records is None:
+            records = self.rebuild()
+        return records[:limit]
+
+    def record_append(
+        self, previous_version: str, concepts: List[Concept]
+    ) -> None:
+        """Merge just-appended concepts into an up-to-date tail."""
+        records = self._read(previous_version)
+        if records is None:
+            return  # Stale already; the next read rebuilds it
+
+        new_records = [concept.to_record() for concept in concepts]
+        self._write(self._newest(records + new_records))
+
+    def rebuild(self) -> List[Dict[str, str]]:
+        """Stream the CSV once, keeping only the newest records."""
+        version = file_version(self.csv_path)[0]
+        records: List[Dict[str, str]] = []
+        if self.csv_path.exists():
+            with open(self.csv_path, newline="", encoding="utf-8") as handle:
+                records = self._newest(csv.DictReader(handle))
+
+        self._write(records, version)
+        self.logger.debug(f"Rebuilt latest tail for {self.csv_path}")
+        return records
+
+    def _newest(self, records: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Select the newest records; ties keep file order like nlargest."""
+        return heapq.nlargest(
+            LATEST_TAIL_SIZE, records, key=lambda record: record.get("date") or ""
+        )
+
+    def _read(self, version: str = None) -> Optional[List[Dict[str, str]]]:
+        """Load the tail if it matches ``version`` (default: current)."""
+        if version is None:
+            version = file_version(self.csv_path)[0]
+        try:
+            with open(self.tail_path, encoding="utf-8") as handle:
+                header = json.loads(next(handle))
+                if header.get("version") != version:
+                    return None
+                return [json.loads(line) for line in handle]
+        except (OSError, ValueError, StopIteration):
+            return None
+
+    def _write(self, records: List[Dict[str, str]], version: str = None) -> None:
+        """Write the tail stamped with ``version`` (default: current)."""
+        if version is None:
+            version = file_version(self.csv_path)[0]
+        lines = [json.dumps({"version": version})]
+        lines.extend(json.dumps(record) for record in records)
+        write_atomic(self.tail_path, "\n".join(lines) + "\n")
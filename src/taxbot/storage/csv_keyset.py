@@ -0,0 +1,80 @@
+"""Date-ordered sidecar index for keyset pagination over the CSV file."""
+
+from __future__ import annotations
+
+import bisect
+from pathlib import Path
+from typing import Container, List, Optional, Tuple
+
+from ..core.logging import get_scraper_logger
+from ..models.concept import Concept
+from .csv_index import read_versioned, scan_rows, write_versioned
+from .repository import file_version
+
+
+class CsvDateIndex:
+    """``[date, link, offset]`` entries sorted ascending by (date, link).
+
+    Pages walk the list backwards from the cursor, so each request costs
+    a binary search plus ``limit`` steps no matter how deep it is.
+    """
+
+    def __init__(self, csv_path: Path, logger=None):
+        """Initialize date index for the given CSV file."""
+        self.csv_path = csv_path
+        self.logger = logger or get_scraper_logger()
+        self.index_path = csv_path.parent / "indexes" / "date_keys.json"
+
+    def page_offsets(
+        self,
+        cursor: Optional[Tuple[str, str]],
+        limit: int,
+        allowed: Optional[Container[int]] = None,
+    ) -> List[int]:
+        """Return offsets of the ``limit`` rows after ``cursor``, newest first."""
+        entries = self._read()
+        if entries is None:
+            entries = self.rebuild()
+
+        end = len(entries)
+        if cursor is not None:
+            end = bisect.bisect_left(entries, list(cursor))
+
+        offsets: List[int] = []
+        for index in range(end - 1, -1, -1):
+            if len(offsets) >= limit:
+                break
+            offset = entries[index][2]
+            if allowed is None or offset in allowed:
+                offsets.append(offset)
+        return offsets
+
+    def record_append(
+        self, previous_version: str, concepts: List[Concept], offsets: List[int]
+    ) -> None:
+        """Insert just-appended rows into an up-to-date index."""
+        entries = self._read(previous_version)
+        if entries is None:
+            return  # Stale already; the next read rebuilds it
+
+        for concept, offset in zip(concepts, offsets):
+            record = concept.to_record()
+            bisect.insort(entries, [record["date"], record["link"], offset])
+        write_versioned(self.csv_path, self.index_path, "entries", entries)
+
+    def rebuild(self) -> List[list]:
+        """Scan the CSV once and rewrite the sorted entries."""
+        version = file_version(self.csv_path)[0]
+        entries = sorted(
+            # Undated rows sort under the date Concept.from_record gives them,
+            # so cursors built from those concepts land back on them
+            [row.get("date") or "1900-01-01", row.get("link", ""), offset]
+            for row, offset in scan_rows(self.csv_path)
+        )
+        write_versioned(self.csv_path, self.index_path, "entries", entries, version)
+        self.logger.debug(f"Rebuilt date index for {self.csv_path}")
+        return entries
+
+    def _read(self, version: str = None) -> Optional[List[list]]:
+        """Load the entries if they match ``version`` (default: current)."""
+        return read_versioned(self.csv_path, self.index_path, "entries", version)
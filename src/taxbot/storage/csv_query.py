@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 import pandas as pd
 
@@ -11,6 +11,10 @@ from ..core.logging import get_scraper_logger
 from ..models.concept import Concept, ConceptSearchRequest, ConceptSearchResponse
 from .repository import RepositoryError
 
+_SEARCH_COLUMNS = ("title", "theme", "descriptor", "summary", "analysis")
+# Unit separator: keeps a query from matching across two fields
+_FIELD_SEP = "\x1f"
+
 
 class CsvQuery:
     """Handles query operations on CSV data."""
@@ -18,6 +22,11 @@ class CsvQuery:
     def __init__(self, logger=None):
         """Initialize CSV query handler."""
         self.logger = logger or get_scraper_logger()
+        # Last searched frame and its joined text; reused while the reader
+        # keeps returning the same cached frame
+        self._blob_cache: Tuple[Optional[pd.DataFrame], Optional[pd.Series]] = (
+            None, None
+        )
 
     def apply_date_filters(
         self,
@@ -26,11 +35,17 @@ class CsvQuery:
         date_to: Optional[datetime] = None,
     ) -> pd.DataFrame:
         """Apply date range filters to dataframe."""
-        if date_from:
-            df = df[pd.to_datetime(df["date"], errors="coerce") >= date_from]
-        if date_to:
-            df = df[pd.to_datetime(df["date"], errors="coerce") <= date_to]
-        return df
+        if not date_from and not date_to:
+            return df
+
+        # load_dataframe already parses dates; only coerce unparsed input
+        dates = df["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+
+        return df[dates.between(
+            date_from or pd.Timestamp.min, date_to or pd.Timestamp.max
+        )]
 
     def apply_theme_filter(
         self, df: pd.DataFrame, theme: Optional[str]
@@ -48,16 +63,35 @@ class CsvQuery:
 
     def dataframe_to_concepts(self, df: pd.DataFrame) -> List[Concept]:
         """Convert dataframe rows to Concept objects."""
+        # to_dict("records") converts in one pass; iterrows builds a Series per row
+        return self.records_to_concepts(df.to_dict("records"))
+
+    def records_to_concepts(self, records: Iterable[dict]) -> List[Concept]:
+        """Convert record dictionaries to Concept objects."""
         concepts = []
-        for _, row in df.iterrows():
+        for record in records:
             try:
-                concept = Concept.from_record(row.to_dict())
+                concept = Concept.from_record(record)
                 concepts.append(concept)
             except Exception as e:
                 self.logger.warning(f"Error parsing concept row: {e}")
                 continue
         return concepts
 
+    def filter_concepts(
+        self,
+        df: pd.DataFrame,
+        limit: int = 10,
+        offset: int = 0,
+        theme: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Apply theme, date and pagination filters to dataframe."""
+        df = self.apply_theme_filter(df, theme)
+        df = self.apply_date_filters(df, date_from, date_to)
+        return self.apply_pagination(df, offset, limit)
+
     def get_concepts(
         self,
         df: pd.DataFrame,
@@ -72,10 +106,9 @@ class CsvQuery:
             if df.empty:
                 return []
 
-            df = self.apply_theme_filter(df, theme)
-            df = self.apply_date_filters(df, date_from, date_to)
-            df = self.apply_pagination(df, offset, limit)
-
+            df = self.filter_concepts(
+                df, limit, offset, theme, date_from, date_to
+            )
             return self.dataframe_to_concepts(df)
 
         except Exception as e:
@@ -115,18 +148,24 @@ class CsvQuery:
             raise RepositoryError(f"Failed to search concepts: {e}") from e
 
     def _apply_text_search(self, df: pd.DataFrame, query: str) -> pd.DataFrame:
-        """Apply text search across multiple columns."""
-        search_columns = ["title", "theme", "descriptor", "summary", "analysis"]
-        query_lower = query.lower()
-
-        search_mask = pd.Series([False] * len(df))
-        for col in search_columns:
+        """Apply a case-insensitive substring search across text columns."""
+        # One literal scan of the joined fields instead of a regex per column
+        blob = self._search_blob(df)
+        return df[blob.str.contains(query.lower(), regex=False)]
+
+    def _search_blob(self, df: pd.DataFrame) -> pd.Series:
+        """Join the searchable fields of each row into one lowercase string."""
+        source, blob = self._blob_cache
+        if source is df:
+            return blob
+
+        blob = pd.Series("", index=df.index, dtype=object)
+        for col in _SEARCH_COLUMNS:
             if col in df.columns:
-                search_mask |= df[col].str.contains(
-                    query_lower, case=False, na=False
-                )
-
-        return df[search_mask]
+                blob = blob + _FIELD_SEP + df[col].fillna("").astype(str)
+        blob = blob.str.lower()
+        self._blob_cache = (df, blob)
+        return blob
 
     def _empty_search_response(
         self, request: ConceptSearchRequest
@@ -148,8 +187,8 @@ class CsvQuery:
             if df.empty:
                 return []
 
-            df_sorted = df.sort_values("date", ascending=False)
-            df_limited = df_sorted.head(limit)
+            # Partial top-k selection instead of sorting the whole frame
+            df_limited = df.nlargest(limit, "date")
 
             return self.dataframe_to_concepts(df_limited)
 
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import csv
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
-from .repository import RepositoryError
+from .repository import RepositoryError, file_version
+
+# Parsed frames by CSV path as (file version, frame), shared by all readers
+_FRAMES: Dict[Path, Tuple[str, pd.DataFrame]] = {}
+_FRAMES_LOCK = threading.Lock()
+
+# Link sets by CSV path, built from (and valid for) one cached frame
+_LINK_SETS: Dict[Path, Tuple[pd.DataFrame, FrozenSet[str]]] = {}
+
+
+def forget_dataframe(csv_path: Path) -> None:
+    """Drop the cached frame for ``csv_path`` after the file is rewritten."""
+    with _FRAMES_LOCK:
+        _FRAMES.pop(csv_path, None)
+        _LINK_SETS.pop(csv_path, None)
 
 
 class CsvReader:
@@ -28,10 +44,27 @@ class CsvReader:
         ]
 
     def load_dataframe(self) -> pd.DataFrame:
-        """Load data from CSV file."""
-        if not self.csv_path.exists():
+        """Load data from CSV file, reusing the parsed frame while it is unchanged.
+
+        The frame is shared between callers and must not be modified in place.
+        """
+        # Stat before reading: a write in between only costs a later re-read
+        version = file_version(self.csv_path)[0]
+        if version == "empty":
             return pd.DataFrame(columns=self.get_columns())
 
+        with _FRAMES_LOCK:
+            cached = _FRAMES.get(self.csv_path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        df = self._read_dataframe()
+        with _FRAMES_LOCK:
+            _FRAMES[self.csv_path] = (version, df)
+        return df
+
+    def _read_dataframe(self) -> pd.DataFrame:
+        """Read and parse the whole CSV file."""
         try:
             df = pd.read_csv(self.csv_path)
             if df.empty:
@@ -63,36 +96,81 @@ class CsvReader:
 
     def get_concept_count(self) -> int:
         """Get total number of concepts."""
+        if not self.csv_path.exists():
+            return 0
+
         try:
-            df = self.load_dataframe()
-            return len(df)
+            # Stream rows without building a dataframe; csv handles
+            # quoted multi-line summaries correctly
+            with open(self.csv_path, newline="", encoding="utf-8") as handle:
+                rows = sum(1 for row in csv.reader(handle) if row)
+            return max(rows - 1, 0)
         except Exception as e:
             self.logger.error(f"Error getting concept count: {e}")
             return 0
 
     def get_themes(self) -> List[str]:
         """Get list of unique themes."""
-        try:
-            df = self.load_dataframe()
-            if df.empty:
-                return []
+        if not self.csv_path.exists():
+            return []
 
-            themes = df["theme"].dropna().unique().tolist()
-            return sorted(themes)
+        try:
+            themes = pd.read_csv(self.csv_path, usecols=["theme"], dtype=str)
+            return sorted(themes["theme"].dropna().unique().tolist())
 
         except Exception as e:
             self.logger.error(f"Error getting themes: {e}")
             return []
 
+    def link_set(self) -> FrozenSet[str]:
+        """Return every stored link, cached alongside the parsed frame."""
+        df = self.load_dataframe()
+        with _FRAMES_LOCK:
+            cached = _LINK_SETS.get(self.csv_path)
+        if cached and cached[0] is df:
+            return cached[1]
+
+        links = frozenset()
+        if not df.empty:
+            links = frozenset(df["link"].dropna().astype(str))
+        with _FRAMES_LOCK:
+            _LINK_SETS[self.csv_path] = (df, links)
+        return links
+
     def concept_exists(self, concept_id: str) -> bool:
         """Check if concept exists."""
         try:
-            df = self.load_dataframe()
-            if df.empty:
-                return False
-
-            return concept_id in df["link"].values
+            return concept_id in self.link_set()
 
         except Exception as e:
             self.logger.error(f"Error checking concept existence: {e}")
             return False
+
+    def get_existing_links(self, links: Iterable[str]) -> Set[str]:
+        """Return the subset of ``links`` already stored in the CSV file."""
+        if not self.csv_path.exists():
+            return set()
+
+        try:
+            # Only the link column is needed for the membership test
+            stored = pd.read_csv(self.csv_path, usecols=["link"], dtype=str)["link"]
+            return set(stored[stored.isin(list(links))])
+
+        except Exception as e:
+            self.logger.error(f"Error getting existing links: {e}")
+            raise RepositoryError(f"Failed to get existing links: {e}") from e
+
+    def iter_links(self) -> Iterator[str]:
+        """Stream the link column row by row."""
+        if not self.csv_path.exists():
+            return
+
+        with open(self.csv_path, newline="", encoding="utf-8") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            if "link" not in header:
+                return
+            link_index = header.index("link")
+            for row in reader:
+                if len(row) > link_index:
+                    yield row[link_index]
@@ -4,17 +4,25 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
+from ..core.cache import invalidate_concepts_cache
 from ..core.config import get_settings
 from ..core.logging import get_scraper_logger
 from ..models.concept import Concept, ConceptSearchRequest, ConceptSearchResponse
+from .csv_index import CsvLatestTail, CsvThemeIndex
+from .csv_keyset import CsvDateIndex
 from .csv_query import CsvQuery
 from .csv_reader import CsvReader
 from .csv_writer import CsvWriter
-from .repository import ConceptNotFoundError, Repository, RepositoryError
+from .repository import (
+    ConceptNotFoundError,
+    Repository,
+    RepositoryError,
+    file_version,
+)
 
 
 class CsvRepository(Repository):
@@ -29,6 +37,9 @@ class CsvRepository(Repository):
         self._reader = CsvReader(self.csv_path, self.logger)
         self._writer = CsvWriter(self.csv_path, self.logger)
         self._query = CsvQuery(self.logger)
+        self._index = CsvThemeIndex(self.csv_path, self.logger)
+        self._tail = CsvLatestTail(self.csv_path, self.logger)
+        self._dates = CsvDateIndex(self.csv_path, self.logger)
 
     def save_concept(self, concept: Concept) -> None:
         """Save a single concept."""
@@ -41,14 +52,34 @@ class CsvRepository(Repository):
 
         self._writer.acquire_lock()
         try:
-            df = self._reader.load_dataframe()
-            combined_df = self._writer.merge_concepts(df, concepts)
-            combined_df = self._writer.prepare_dataframe_for_save(combined_df)
-            self._writer.save_dataframe(combined_df)
+            if self._can_append(concepts):
+                previous_version = file_version(self.csv_path)[0]
+                offsets = self._writer.append_concepts(concepts)
+                self._index.record_append(previous_version, concepts, offsets)
+                self._tail.record_append(previous_version, concepts)
+                self._dates.record_append(previous_version, concepts, offsets)
+            else:
+                df = self._reader.load_dataframe()
+                combined_df = self._writer.merge_concepts(df, concepts)
+                combined_df = self._writer.prepare_dataframe_for_save(combined_df)
+                self._writer.save_dataframe(combined_df)
+            invalidate_concepts_cache()
             self.logger.info(f"Saved {len(concepts)} concepts to CSV")
         finally:
             self._writer.release_lock()
 
+    def _can_append(self, concepts: List[Concept]) -> bool:
+        """Check whether concepts can be appended without a full rewrite."""
+        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
+            return False
+
+        links = [concept.link for concept in concepts]
+        if len(set(links)) != len(links):
+            return False
+
+        # Only brand-new links can skip the merge and deduplication
+        return not self._reader.get_existing_links(links)
+
     def get_concept_by_id(self, concept_id: str) -> Optional[Concept]:
         """Get concept by ID (link)."""
         return self._reader.get_concept_by_id(concept_id)
@@ -62,11 +93,53 @@ class CsvRepository(Repository):
         date_to: Optional[datetime] = None,
     ) -> List[Concept]:
         """Get concepts with filtering."""
-        df = self._reader.load_dataframe()
+        df = self._load_dataframe(theme)
         return self._query.get_concepts(
             df, limit, offset, theme, date_from, date_to
         )
 
+    def get_concepts_after(
+        self,
+        cursor: Optional[Tuple[str, str]],
+        limit: int = 10,
+        theme: Optional[str] = None,
+    ) -> List[Concept]:
+        """Get concepts older than a ``(date, link)`` cursor, newest first."""
+        if not self.csv_path.exists():
+            return []
+
+        try:
+            allowed = set(self._index.get_offsets(theme)) if theme else None
+            offsets = self._dates.page_offsets(cursor, limit, allowed)
+            df = self._index.load_rows(offsets)
+        except Exception as e:
+            self.logger.error(f"Error paging concepts: {e}")
+            raise RepositoryError(f"Failed to get concepts: {e}") from e
+        return self._query.dataframe_to_concepts(df)
+
+    def _load_dataframe(self, theme: Optional[str] = None) -> pd.DataFrame:
+        """Load all rows, or only the indexed rows of matching themes."""
+        if not theme or not self.csv_path.exists():
+            return self._reader.load_dataframe()
+
+        try:
+            return self._index.load_rows(self._index.get_offsets(theme))
+        except Exception as e:
+            self.logger.warning(f"Theme index unavailable: {e}")
+            return self._reader.load_dataframe()
+
+    def get_concepts_frame(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        theme: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get filtered concept rows as a dataframe for tabular display."""
+        df = self._load_dataframe(theme)
+        if df.empty:
+            return df
+        return self._query.filter_concepts(df, limit, offset, theme)
+
     def search_concepts(
         self, request: ConceptSearchRequest
     ) -> ConceptSearchResponse:
@@ -80,27 +153,52 @@ class CsvRepository(Repository):
 
     def get_themes(self) -> List[str]:
         """Get list of unique themes."""
-        return self._reader.get_themes()
+        try:
+            return self._index.get_themes()
+        except Exception as e:
+            self.logger.warning(f"Theme index unavailable: {e}")
+            return self._reader.get_themes()
 
     def get_latest_concepts(self, limit: int = 10) -> List[Concept]:
         """Get latest concepts by date."""
-        df = self._reader.load_dataframe()
-        return self._query.get_latest_concepts(df, limit)
+        try:
+            records = self._tail.get_latest(limit)
+        except Exception as e:
+            self.logger.warning(f"Latest tail unavailable: {e}")
+            records = None
+
+        if records is None:
+            df = self._reader.load_dataframe()
+            return self._query.get_latest_concepts(df, limit)
+        return self._query.records_to_concepts(records)
 
     def concept_exists(self, concept_id: str) -> bool:
         """Check if concept exists."""
         return self._reader.concept_exists(concept_id)
 
+    def get_existing_links(self, links: Iterable[str]) -> Set[str]:
+        """Return the subset of links that are already stored."""
+        return self._reader.get_existing_links(links)
+
+    def iter_links(self) -> Iterator[str]:
+        """Yield every stored link without loading full concepts."""
+        return self._reader.iter_links()
+
+    def get_version(self) -> Tuple[str, Optional[datetime]]:
+        """Return a data version tag and the last modification time."""
+        return file_version(self.csv_path)
+
     def delete_concept(self, concept_id: str) -> bool:
         """Delete a concept."""
         self._writer.acquire_lock()
         try:
-            df = self._reader.load_dataframe()
-            if df.empty or concept_id not in df["link"].values:
+            if concept_id not in self._reader.link_set():
                 return False
 
+            df = self._reader.load_dataframe()
             df_filtered = df[df["link"] != concept_id]
             self._writer.save_dataframe(df_filtered)
+            invalidate_concepts_cache()
             self.logger.info(f"Deleted concept: {concept_id}")
             return True
 
@@ -116,6 +214,7 @@ class CsvRepository(Repository):
         try:
             empty_df = pd.DataFrame(columns=self._reader.get_columns())
             self._writer.save_dataframe(empty_df)
+            invalidate_concepts_cache()
             self.logger.info("Cleared all concepts")
         except Exception as e:
             self.logger.error(f"Error clearing concepts: {e}")
@@ -130,3 +229,4 @@ class CsvRepository(Repository):
     def restore(self, backup_path: str) -> None:
         """Restore from backup."""
         self._writer.restore(backup_path)
+        invalidate_concepts_cache()
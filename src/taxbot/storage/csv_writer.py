@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import csv
+import io
 import shutil
 import tempfile
 from datetime import datetime
@@ -12,6 +14,7 @@ import pandas as pd
 
 from ..core.logging import get_scraper_logger
 from ..models.concept import Concept
+from .csv_reader import forget_dataframe
 from .repository import RepositoryError
 
 
@@ -34,8 +37,7 @@ class CsvWriter:
 
     def release_lock(self) -> None:
         """Release file lock."""
-        if self.lock_path.exists():
-            self.lock_path.unlink()
+        self.lock_path.unlink(missing_ok=True)
 
     def save_dataframe(self, df: pd.DataFrame) -> None:
         """Save dataframe to CSV with atomic write."""
@@ -48,6 +50,7 @@ class CsvWriter:
             ) as temp_file:
                 df.to_csv(temp_file.name, index=False)
                 shutil.move(temp_file.name, self.csv_path)
+            forget_dataframe(self.csv_path)
 
         except Exception as e:
             self.logger.error(f"Error saving CSV file: {e}")
@@ -57,7 +60,8 @@ class CsvWriter:
         """Prepare dataframe for saving (format dates, fill NaN)."""
         df = df.copy()
         if "date" in df.columns:
-            df["date"] = df["date"].dt.strftime("%Y-%m-%d")
+            dates = pd.to_datetime(df["date"], errors="coerce")
+            df["date"] = dates.dt.strftime("%Y-%m-%d")
         df = df.fillna("")
         return df
 
@@ -69,6 +73,7 @@ class CsvWriter:
         """Merge new concepts with existing data."""
         new_records = [concept.to_record() for concept in concepts]
         new_df = pd.DataFrame(new_records)
+        new_df["date"] = pd.to_datetime(new_df["date"], errors="coerce")
 
         if existing_df.empty:
             return new_df
@@ -83,6 +88,40 @@ class CsvWriter:
 
         return combined_df
 
+    def append_concepts(self, concepts: List[Concept]) -> List[int]:
+        """Append concepts with one write and return each row's byte offset."""
+        try:
+            with open(self.csv_path, newline="", encoding="utf-8") as handle:
+                fieldnames = next(csv.reader(handle))
+
+            buffer = io.StringIO()
+            writer = csv.DictWriter(
+                buffer,
+                fieldnames=fieldnames,
+                extrasaction="ignore",
+                lineterminator="\n",
+            )
+            offset = self.csv_path.stat().st_size
+            offsets, chunks = [], []
+            for concept in concepts:
+                writer.writerow(concept.to_record())
+                chunk = buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                offsets.append(offset)
+                chunks.append(chunk)
+                offset += len(chunk)
+
+            with open(self.csv_path, "ab") as handle:
+                handle.write(b"".join(chunks))
+                handle.flush()
+            forget_dataframe(self.csv_path)
+            return offsets
+
+        except Exception as e:
+            self.logger.error(f"Error appending to CSV file: {e}")
+            raise RepositoryError(f"Failed to append data: {e}") from e
+
     def backup(self) -> str:
         """Create backup and return backup path."""
         try:
@@ -108,6 +147,7 @@ class CsvWriter:
 
             current_backup = self.backup()
             shutil.copy2(backup_file, self.csv_path)
+            forget_dataframe(self.csv_path)
 
             self.logger.info(f"Restored from backup: {backup_path}")
 
@@ -0,0 +1,15 @@
+"""Repository selection based on the configured storage backend."""
+
+from __future__ import annotations
+
+from ..core.config import get_settings
+from .csv_repository import CsvRepository
+from .repository import Repository
+from .sqlite_repository import SqliteRepository
+
+
+def create_repository() -> Repository:
+    """Create the repository for ``settings.storage_backend``."""
+    if get_settings().storage_backend == "sqlite":
+        return SqliteRepository()
+    return CsvRepository()
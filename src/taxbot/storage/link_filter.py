@@ -0,0 +1,111 @@
+"""Compact Bloom filter over stored concept links."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from pathlib import Path
+from typing import Iterable
+
+from ..core.logging import get_scraper_logger
+from .repository import Repository
+
+# Header layout: capacity, bit count, hash count, number of links added,
+# repository data version the filter was built against
+_HEADER = struct.Struct("<QQIQ16s")
+
+# Smallest filter built, so fresh data directories still have headroom
+MIN_CAPACITY = 1024
+
+
+class LinkBloomFilter:
+    """Probabilistic set of links with no false negatives.
+
+    A miss means the link is definitely new; a hit must be confirmed
+    against the repository because of the configured error rate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Size the bit array for ``capacity`` links at ``error_rate``."""
+        self.capacity = max(capacity, 1)
+        num_bits = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(round(self.num_bits / self.capacity * math.log(2)), 1)
+        self.count = 0
+        self.version = ""
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def add(self, link: str) -> None:
+        """Add a link to the filter."""
+        for position in self._positions(link):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, links: Iterable[str]) -> None:
+        """Add several links to the filter."""
+        for link in links:
+            self.add(link)
+
+    def __contains__(self, link: str) -> bool:
+        """Return False only if the link was never added."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(link)
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the filter to ``path``."""
+        header = _HEADER.pack(
+            self.capacity,
+            self.num_bits,
+            self.num_hashes,
+            self.count,
+            self.version.encode("ascii"),
+        )
+        path.write_bytes(header + bytes(self._bits))
+
+    @classmethod
+    def load(cls, path: Path) -> LinkBloomFilter:
+        """Read a filter previously written with :meth:`save`."""
+        data = path.read_bytes()
+        capacity, num_bits, num_hashes, count, version = _HEADER.unpack_from(data)
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.num_bits = capacity, num_bits
+        bloom.num_hashes, bloom.count = num_hashes, count
+        bloom.version = version.rstrip(b"\0").decode("ascii")
+        bloom._bits = bytearray(data[_HEADER.size:])
+        if len(bloom._bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Corrupt link filter: {path}")
+        return bloom
+
+    def _positions(self, link: str) -> Iterable[int]:
+        """Derive bit positions with double hashing over one digest."""
+        digest = hashlib.blake2b(link.encode("utf-8"), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        return (
+            (first + index * second) % self.num_bits
+            for index in range(self.num_hashes)
+        )
+
+
+def load_link_filter(repository: Repository, path: Path) -> LinkBloomFilter:
+    """Load the persisted filter, rebuilding it if stale or overfilled."""
+    logger = get_scraper_logger()
+    # Read before the links so a write during the rebuild leaves it stale
+    version = repository.get_version()[0]
+
+    if path.exists():
+        try:
+            bloom = LinkBloomFilter.load(path)
+            if bloom.version == version and bloom.count <= bloom.capacity:
+                return bloom
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Discarding link filter {path}: {e}")
+
+    stored_count = repository.get_concept_count()
+    bloom = LinkBloomFilter(capacity=max(stored_count * 2, MIN_CAPACITY))
+    bloom.version = version
+    bloom.update(repository.iter_links())
+    logger.info(f"Built link filter for {bloom.count} links")
+    return bloom
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..models.concept import Concept, ConceptSearchRequest, ConceptSearchResponse
 
@@ -51,6 +53,16 @@ class Repository(ABC):
         """Get concepts with filtering."""
         pass
 
+    @abstractmethod
+    def get_concepts_after(
+        self,
+        cursor: Optional[Tuple[str, str]],
+        limit: int = 10,
+        theme: Optional[str] = None,
+    ) -> List[Concept]:
+        """Get concepts older than a ``(date, link)`` cursor, newest first."""
+        pass
+
     @abstractmethod
     def search_concepts(self, request: ConceptSearchRequest) -> ConceptSearchResponse:
         """Search concepts with full-text search."""
@@ -76,6 +88,16 @@ class Repository(ABC):
         """Check if concept exists."""
         pass
 
+    @abstractmethod
+    def get_existing_links(self, links: Iterable[str]) -> Set[str]:
+        """Return the subset of links that are already stored."""
+        pass
+
+    @abstractmethod
+    def iter_links(self) -> Iterator[str]:
+        """Yield every stored link without loading full concepts."""
+        pass
+
     @abstractmethod
     def delete_concept(self, concept_id: str) -> bool:
         """Delete a concept."""
@@ -95,3 +117,21 @@ class Repository(ABC):
     def restore(self, backup_path: str) -> None:
         """Restore from backup."""
         pass
+
+    @abstractmethod
+    def get_version(self) -> Tuple[str, Optional[datetime]]:
+        """Return a data version tag and the last modification time."""
+        pass
+
+
+def file_version(path: Path) -> Tuple[str, Optional[datetime]]:
+    """Derive a version tag and modification time from a file's stat."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return "empty", None
+
+    # mtime and size change on every write; no need to read the data
+    tag = hashlib.sha256(f"{stat.st_mtime_ns}-{stat.st_size}".encode())
+    modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+    return tag.hexdigest()[:16], modified
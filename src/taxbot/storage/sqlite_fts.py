@@ -0,0 +1,52 @@
+"""Trigram full-text index for the SQLite repository."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from .sqlite_query import SEARCH_COLUMNS
+
+_FTS_COLUMNS = ", ".join(SEARCH_COLUMNS)
+
+# Trigram full-text index over the search columns, kept in sync by triggers
+_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS concepts_fts USING fts5(
+    {_FTS_COLUMNS}, content='concepts', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS concepts_fts_insert AFTER INSERT ON concepts BEGIN
+    INSERT INTO concepts_fts(rowid, {_FTS_COLUMNS})
+    VALUES (new.rowid, new.title, new.theme, new.descriptor, new.summary,
+            new.analysis);
+END;
+CREATE TRIGGER IF NOT EXISTS concepts_fts_delete AFTER DELETE ON concepts BEGIN
+    INSERT INTO concepts_fts(concepts_fts, rowid, {_FTS_COLUMNS})
+    VALUES ('delete', old.rowid, old.title, old.theme, old.descriptor,
+            old.summary, old.analysis);
+END;
+CREATE TRIGGER IF NOT EXISTS concepts_fts_update AFTER UPDATE ON concepts BEGIN
+    INSERT INTO concepts_fts(concepts_fts, rowid, {_FTS_COLUMNS})
+    VALUES ('delete', old.rowid, old.title, old.theme, old.descriptor,
+            old.summary, old.analysis);
+    INSERT INTO concepts_fts(rowid, {_FTS_COLUMNS})
+    VALUES (new.rowid, new.title, new.theme, new.descriptor, new.summary,
+            new.analysis);
+END;
+"""
+
+
+def create_fts_index(connection: sqlite3.Connection) -> None:
+    """Create the index and its triggers, filling it on first creation.
+
+    Raises ``sqlite3.OperationalError`` if SQLite was built without FTS5
+    or predates the trigram tokenizer (3.34).
+    """
+    exists = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'concepts_fts'"
+    ).fetchone()
+    connection.executescript(_FTS_SCHEMA)
+    if not exists:
+        # Index rows stored before the table was created
+        with connection:
+            connection.execute(
+                "INSERT INTO concepts_fts(concepts_fts) VALUES ('rebuild')"
+            )
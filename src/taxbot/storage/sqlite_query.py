@@ -0,0 +1,58 @@
+"""SQL filter building for the SQLite repository."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+SEARCH_COLUMNS = ("title", "theme", "descriptor", "summary", "analysis")
+
+# The trigram index cannot answer substrings shorter than one trigram
+FTS_MIN_QUERY_LENGTH = 3
+
+
+def build_filters(
+    theme: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    query: Optional[str] = None,
+    cursor: Optional[Tuple[str, str]] = None,
+    fts: bool = False,
+) -> Tuple[str, Tuple]:
+    """Build the WHERE clause and parameters for the given filters."""
+    clauses: List[str] = []
+    params: List = []
+    if theme:
+        clauses.append("theme LIKE ?")
+        params.append(f"%{theme}%")
+    if date_from:
+        clauses.append("date >= ?")
+        params.append(date_from.strftime("%Y-%m-%d"))
+    if date_to:
+        clauses.append("date <= ?")
+        params.append(date_to.strftime("%Y-%m-%d"))
+    if query:
+        clause, query_params = _search_clause(query, fts)
+        clauses.append(clause)
+        params.extend(query_params)
+    if cursor is not None:
+        # Row-value comparison walks the (date, link) index
+        clauses.append("(date, link) < (?, ?)")
+        params.extend(cursor)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, tuple(params)
+
+
+def _search_clause(query: str, fts: bool) -> Tuple[str, List[str]]:
+    """Match ``query`` as a substring via the FTS index, or a LIKE scan."""
+    if fts and len(query) >= FTS_MIN_QUERY_LENGTH:
+        # A quoted phrase is a plain case-insensitive substring to trigram
+        phrase = '"' + query.replace('"', '""') + '"'
+        return (
+            "rowid IN (SELECT rowid FROM concepts_fts WHERE concepts_fts MATCH ?)",
+            [phrase],
+        )
+
+    clause = "(" + " OR ".join(f"{col} LIKE ?" for col in SEARCH_COLUMNS) + ")"
+    return clause, [f"%{query}%"] * len(SEARCH_COLUMNS)
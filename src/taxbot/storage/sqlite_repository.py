@@ -0,0 +1,283 @@
+"""SQLite-based repository implementation with indexed link lookups."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from ..core.cache import invalidate_concepts_cache
+from ..core.config import get_settings
+from ..core.logging import get_scraper_logger
+from ..models.concept import Concept, ConceptSearchRequest, ConceptSearchResponse
+from .repository import Repository, RepositoryError, file_version
+from .sqlite_fts import create_fts_index
+from .sqlite_query import build_filters
+
+COLUMNS = ("title", "date", "theme", "descriptor", "link", "summary", "analysis")
+
+# SQLite caps the number of bound parameters per statement
+IN_CLAUSE_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS concepts (
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    descriptor TEXT NOT NULL DEFAULT '',
+    link TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    analysis TEXT NOT NULL DEFAULT ''
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_link ON concepts(link);
+CREATE INDEX IF NOT EXISTS idx_theme ON concepts(theme);
+CREATE INDEX IF NOT EXISTS idx_date_link ON concepts(date, link);
+"""
+
+_UPSERT = (
+    f"INSERT INTO concepts ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in COLUMNS)}) "
+    "ON CONFLICT(link) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in COLUMNS)
+)
+
+_ORDER_BY = "ORDER BY theme ASC, date DESC"
+
+
+class SqliteRepository(Repository):
+    """SQLite repository with a unique index on the concept link."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize SQLite repository."""
+        self.settings = get_settings()
+        self.logger = get_scraper_logger()
+        self.db_path = db_path or self.settings.data_dir / "conceptos_dian.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+        self._fts = self._ensure_fts()
+
+    def save_concept(self, concept: Concept) -> None:
+        """Save a single concept."""
+        self.save_concepts([concept])
+
+    def save_concepts(self, concepts: List[Concept]) -> None:
+        """Upsert multiple concepts in one transaction."""
+        if not concepts:
+            return
+
+        self._write(_UPSERT, [concept.to_record() for concept in concepts])
+        self.logger.info(f"Saved {len(concepts)} concepts to SQLite")
+
+    def get_concept_by_id(self, concept_id: str) -> Optional[Concept]:
+        """Get concept by ID (link)."""
+        rows = self._fetch("SELECT * FROM concepts WHERE link = ?", (concept_id,))
+        return Concept.from_record(dict(rows[0])) if rows else None
+
+    def get_concepts(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        theme: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[Concept]:
+        """Get concepts with filtering."""
+        where, params = build_filters(theme, date_from, date_to)
+        rows = self._fetch(
+            f"SELECT * FROM concepts {where} {_ORDER_BY} LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+        return self._rows_to_concepts(rows)
+
+    def get_concepts_after(
+        self,
+        cursor: Optional[Tuple[str, str]],
+        limit: int = 10,
+        theme: Optional[str] = None,
+    ) -> List[Concept]:
+        """Get concepts older than a ``(date, link)`` cursor, newest first."""
+        where, params = build_filters(theme, cursor=cursor)
+        rows = self._fetch(
+            f"SELECT * FROM concepts {where} ORDER BY date DESC, link DESC LIMIT ?",
+            (*params, limit),
+        )
+        return self._rows_to_concepts(rows)
+
+    def get_concepts_frame(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        theme: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get filtered concept rows as a dataframe for tabular display."""
+        where, params = build_filters(theme)
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT * FROM concepts {where} {_ORDER_BY} LIMIT ? OFFSET ?",
+                self._connection,
+                params=(*params, limit, offset),
+                parse_dates=["date"],
+            )
+
+    def search_concepts(
+        self, request: ConceptSearchRequest
+    ) -> ConceptSearchResponse:
+        """Search concepts with a substring match across text columns."""
+        where, params = build_filters(
+            request.theme, request.date_from, request.date_to, request.query,
+            fts=self._fts,
+        )
+        total = self._fetch(f"SELECT COUNT(*) FROM concepts {where}", params)[0][0]
+        rows = self._fetch(
+            f"SELECT * FROM concepts {where} {_ORDER_BY} LIMIT ? OFFSET ?",
+            (*params, request.limit, request.offset),
+        )
+        concepts = self._rows_to_concepts(rows)
+
+        return ConceptSearchResponse(
+            concepts=concepts,
+            total=total,
+            limit=request.limit,
+            offset=request.offset,
+            has_more=request.offset + len(concepts) < total,
+        )
+
+    def get_concept_count(self) -> int:
+        """Get total number of concepts."""
+        return self._fetch("SELECT COUNT(*) FROM concepts")[0][0]
+
+    def get_themes(self) -> List[str]:
+        """Get list of unique themes."""
+        rows = self._fetch("SELECT DISTINCT theme FROM concepts ORDER BY theme")
+        return [row[0] for row in rows]
+
+    def get_latest_concepts(self, limit: int = 10) -> List[Concept]:
+        """Get latest concepts by date."""
+        rows = self._fetch(
+            "SELECT * FROM concepts ORDER BY date DESC LIMIT ?", (limit,)
+        )
+        return self._rows_to_concepts(rows)
+
+    def concept_exists(self, concept_id: str) -> bool:
+        """Check if concept exists."""
+        rows = self._fetch(
+            "SELECT 1 FROM concepts WHERE link = ? LIMIT 1", (concept_id,)
+        )
+        return bool(rows)
+
+    def get_existing_links(self, links: Iterable[str]) -> Set[str]:
+        """Return the subset of links that are already stored."""
+        links = list(links)
+        existing: Set[str] = set()
+        for start in range(0, len(links), IN_CLAUSE_CHUNK_SIZE):
+            chunk = links[start:start + IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._fetch(
+                f"SELECT link FROM concepts WHERE link IN ({placeholders})", chunk
+            )
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def iter_links(self) -> Iterator[str]:
+        """Yield every stored link without loading full concepts."""
+        for row in self._fetch("SELECT link FROM concepts"):
+            yield row[0]
+
+    def get_version(self) -> Tuple[str, Optional[datetime]]:
+        """Return a data version tag and the last modification time."""
+        return file_version(self.db_path)
+
+    def delete_concept(self, concept_id: str) -> bool:
+        """Delete a concept."""
+        deleted = self._write("DELETE FROM concepts WHERE link = ?", [(concept_id,)])
+        if deleted:
+            self.logger.info(f"Deleted concept: {concept_id}")
+        return deleted > 0
+
+    def clear_all(self) -> None:
+        """Clear all concepts."""
+        self._write("DELETE FROM concepts", [()])
+        self.logger.info("Cleared all concepts")
+
+    def backup(self) -> str:
+        """Create backup and return backup path."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_path = self.db_path.parent / f"conceptos_dian_backup_{timestamp}.db"
+        try:
+            with self._lock, sqlite3.connect(backup_path) as target:
+                self._connection.backup(target)
+            target.close()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error creating backup: {e}")
+            raise RepositoryError(f"Failed to create backup: {e}") from e
+
+        self.logger.info(f"Created backup: {backup_path}")
+        return str(backup_path)
+
+    def restore(self, backup_path: str) -> None:
+        """Restore from backup."""
+        if not Path(backup_path).exists():
+            raise RepositoryError(f"Backup file not found: {backup_path}")
+
+        self.backup()
+        try:
+            with self._lock, sqlite3.connect(backup_path) as source:
+                source.backup(self._connection)
+            source.close()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error restoring from backup: {e}")
+            raise RepositoryError(f"Failed to restore: {e}") from e
+
+        # Backups taken before the index existed restore without it
+        self._fts = self._ensure_fts()
+        invalidate_concepts_cache()
+        self.logger.info(f"Restored from backup: {backup_path}")
+
+    def _ensure_fts(self) -> bool:
+        """Create the full-text index if missing; False if SQLite lacks FTS5."""
+        try:
+            with self._lock:
+                create_fts_index(self._connection)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Full-text index unavailable, using LIKE: {e}")
+            return False
+        return True
+
+    def _fetch(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        """Run a read query and return all rows."""
+        try:
+            with self._lock:
+                return self._connection.execute(sql, tuple(params)).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error querying SQLite: {e}")
+            raise RepositoryError(f"Failed to query data: {e}") from e
+
+    def _write(self, sql: str, params_seq: List) -> int:
+        """Run a write statement in one transaction and return changed rows."""
+        try:
+            with self._lock, self._connection:
+                cursor = self._connection.executemany(sql, params_seq)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing to SQLite: {e}")
+            raise RepositoryError(f"Failed to save data: {e}") from e
+
+        invalidate_concepts_cache()
+        return cursor.rowcount
+
+    def _rows_to_concepts(self, rows: List[sqlite3.Row]) -> List[Concept]:
+        """Convert result rows to Concept objects."""
+        concepts = []
+        for row in rows:
+            try:
+                concepts.append(Concept.from_record(dict(row)))
+            except Exception as e:
+                self.logger.warning(f"Error parsing concept row: {e}")
+        return concepts
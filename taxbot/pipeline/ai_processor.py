@@ -2,79 +2,293 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Iterable, List
+import weakref
+from typing import Callable, Iterable, List, Optional
 
-from .config import OLLAMA_MODEL
+from aiolimiter import AsyncLimiter
+
+from .config import (
+    OLLAMA_BATCH_SIZE,
+    OLLAMA_ANALYSIS_MODEL,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_NUM_PARALLEL,
+    OLLAMA_NUM_PREDICT,
+    OLLAMA_RPS,
+    OLLAMA_SUMMARY_MODEL,
+)
+from .llm_cache import get_cached_response, store_response
 from .models import Concept
+from .prompts import (
+    analysis_prompt,
+    batch_prompt,
+    combined_prompt,
+    is_fused_answer,
+    parse_batch_reply,
+    parse_fused_reply,
+    summary_prompt,
+)
 from .scraper import clean_text
+from .tokenizer import truncate_to_tokens
 
 try:
     import ollama  # type: ignore
 except ImportError:
     ollama = None
 
+# One token bucket per event loop, shared by every request on that loop.
+_limiters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 def summarize_text(text: str) -> str:
     """Summarize text using Ollama."""
+    return asyncio.run(_run_single(summarize_text_async, text))
+
+
+def complementary_analysis(summary: str, concept: Concept) -> str:
+    """Generate complementary analysis using Ollama."""
+    return asyncio.run(
+        _run_single(complementary_analysis_async, summary, concept)
+    )
+
+
+def process_concepts(concepts: Iterable[Concept]) -> List[Concept]:
+    """Process concepts with AI summarization and analysis."""
+    return asyncio.run(process_concepts_async(list(concepts)))
+
+
+async def process_concepts_async(concepts: List[Concept]) -> List[Concept]:
+    """Process concepts in batches, bounded by OLLAMA_NUM_PARALLEL."""
+    client = _create_client()
+    semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+    await _preload_model(client)
+    batches = [
+        concepts[start:start + OLLAMA_BATCH_SIZE]
+        for start in range(0, len(concepts), OLLAMA_BATCH_SIZE)
+    ]
+    await asyncio.gather(
+        *(_process_batch(client, semaphore, batch) for batch in batches)
+    )
+    return concepts
+
+
+async def _process_batch(client, semaphore, batch: List[Concept]) -> None:
+    """Summarize and analyze a batch with one fused request."""
+    answers: List[Optional[dict]] = [None] * len(batch)
+    if client is not None and len(batch) > 1:
+        with_text = [
+            index for index, concept in enumerate(batch) if concept.full_text
+        ]
+        replies = await _batch_chat(
+            client, semaphore, [batch[index] for index in with_text]
+        )
+        for index, reply in zip(with_text, replies or []):
+            answers[index] = reply
+    await asyncio.gather(*(
+        _process_concept(client, semaphore, concept, answer)
+        for concept, answer in zip(batch, answers)
+    ))
+
+
+async def _process_concept(
+    client, semaphore, concept: Concept, answer: Optional[dict] = None
+) -> None:
+    """Fill summary and analysis from one fused reply, else in two steps."""
+    if answer is None and client is not None and concept.full_text:
+        answer = await _fused_chat(client, semaphore, concept)
+    if is_fused_answer(answer):
+        concept.summary = clean_text(str(answer["resumen"]))
+        concept.analysis = clean_text(str(answer["analisis"]))
+        return
+
+    concept.summary = await summarize_text_async(
+        client, semaphore, truncate_to_tokens(concept.full_text)
+    )
+    concept.analysis = await complementary_analysis_async(
+        client, semaphore, concept.summary, concept
+    )
+
+
+async def summarize_text_async(client, semaphore, text: str) -> str:
+    """Summarize text using a shared Ollama async client."""
     if not text:
         return "No hay contenido para resumir."
 
-    if ollama is None:
+    if client is None:
         logging.warning("Ollama no esta disponible.")
         return "Resumen no disponible: Ollama no configurado."
 
-    prompt = (
-        "Eres un abogado tributarista. Resume el siguiente concepto de la "
-        "DIAN en un maximo de 6 frases, destacando implicaciones practicas, "
-        "cambios normativos, obligaciones y recomendaciones para clientes. "
-        "Texto: " + text
-    )
-
     try:
-        response = ollama.chat(
-            model=OLLAMA_MODEL,
-            messages=[{"role": "user", "content": prompt}]
+        return await _chat(
+            client, semaphore, OLLAMA_SUMMARY_MODEL, summary_prompt(text)
         )
-        return clean_text(response["message"]["content"])
     except Exception as exc:
         logging.error("Error al resumir con Ollama: %s", exc)
         return "Resumen no disponible por error en Ollama."
 
 
-def complementary_analysis(summary: str, concept: Concept) -> str:
-    """Generate complementary analysis using Ollama."""
+async def complementary_analysis_async(
+    client, semaphore, summary: str, concept: Concept
+) -> str:
+    """Generate complementary analysis using a shared Ollama async client."""
     if not summary:
         return "Analisis no disponible."
 
-    if ollama is None:
+    if client is None:
         return "Analisis no disponible: Ollama no configurado."
 
-    prompt = (
-        "Actua como consultor tributario senior. Con base en el siguiente "
-        "resumen y la informacion del concepto, identifica riesgos, "
-        "oportunidades, acciones sugeridas y normas relacionadas. \n"
-        f"Resumen: {summary}\n"
-        f"Tema: {concept.theme}\n"
-        f"Descriptor: {concept.descriptor}"
-    )
-
     try:
-        response = ollama.chat(
-            model=OLLAMA_MODEL,
-            messages=[{"role": "user", "content": prompt}]
+        return await _chat(
+            client,
+            semaphore,
+            OLLAMA_ANALYSIS_MODEL,
+            analysis_prompt(summary, concept),
         )
-        return clean_text(response["message"]["content"])
     except Exception as exc:
         logging.error("Error en analisis complementario: %s", exc)
         return "Analisis no disponible por error en Ollama."
 
 
-def process_concepts(concepts: Iterable[Concept]) -> List[Concept]:
-    """Process concepts with AI summarization and analysis."""
-    processed: List[Concept] = []
-    for concept in concepts:
-        concept.summary = summarize_text(concept.full_text[:12000])
-        concept.analysis = complementary_analysis(concept.summary, concept)
-        processed.append(concept)
-    return processed
+async def _fused_chat(client, semaphore, concept: Concept) -> Optional[dict]:
+    """Ask for summary and analysis in a single JSON reply."""
+    prompt = combined_prompt(truncate_to_tokens(concept.full_text), concept)
+    try:
+        content = await _chat(
+            client,
+            semaphore,
+            OLLAMA_ANALYSIS_MODEL,
+            prompt,
+            response_format="json",
+            options={"num_predict": OLLAMA_NUM_PREDICT},
+            validate=lambda reply: parse_fused_reply(reply) is not None,
+        )
+    except Exception as exc:
+        logging.warning("Respuesta combinada fallida, se reintenta: %s", exc)
+        return None
+
+    answer = parse_fused_reply(content)
+    if answer is None:
+        logging.warning("Respuesta combinada invalida, se reintenta.")
+    return answer
+
+
+async def _batch_chat(
+    client, semaphore, concepts: List[Concept]
+) -> Optional[List[dict]]:
+    """Answer the fused prompts of several concepts with one request.
+
+    Returns None when the model reply cannot be split back into one answer
+    per concept, so callers can fall back to individual requests.
+    """
+    if not concepts:
+        return []
+
+    prompt = batch_prompt([
+        combined_prompt(truncate_to_tokens(concept.full_text), concept)
+        for concept in concepts
+    ])
+    try:
+        content = await _chat(
+            client,
+            semaphore,
+            OLLAMA_ANALYSIS_MODEL,
+            prompt,
+            response_format="json",
+            options={"num_predict": OLLAMA_NUM_PREDICT * len(concepts)},
+            validate=lambda reply: parse_batch_reply(reply, len(concepts)) is not None,
+        )
+    except Exception as exc:
+        logging.warning("Respuesta por lotes fallida, se reintenta: %s", exc)
+        return None
+
+    answers = parse_batch_reply(content, len(concepts))
+    if answers is None:
+        logging.warning("Respuesta por lotes invalida o incompleta, se reintenta.")
+    return answers
+
+
+async def _chat(
+    client,
+    semaphore,
+    model: str,
+    prompt: str,
+    response_format: str = "",
+    options: Optional[dict] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """Send a chat request unless a valid response is already cached.
+
+    Replies rejected by ``validate`` are returned but never stored, so a
+    truncated or malformed answer is asked for again on the next run.
+    """
+    cached = get_cached_response(model, prompt)
+    if cached is not None and (validate is None or validate(cached)):
+        return cached
+
+    content = await _stream_reply(
+        client, semaphore, model, prompt, response_format, options
+    )
+    if validate is None or validate(content):
+        store_response(model, prompt, content)
+    return content
+
+
+async def _stream_reply(
+    client, semaphore, model: str, prompt: str, response_format: str, options
+) -> str:
+    """Stream one chat reply under the concurrency and rate limits."""
+    # Streaming avoids the long stalls of non-streamed responses on
+    # larger models; the chunks are joined into a single reply.
+    chunks: List[str] = []
+    async with semaphore, _get_limiter():
+        stream = await client.chat(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            format=response_format,
+            options=options,
+            stream=True,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+        )
+        async for part in stream:
+            chunks.append(part["message"]["content"])
+    return clean_text("".join(chunks))
+
+
+async def _preload_model(client) -> None:
+    """Load the analysis model before the batch so no request pays the cold start.
+
+    Only the fused and batch requests run during a batch, and both use the
+    analysis model; warming the summary model too would pin a second model
+    in memory for the whole keep-alive.
+    """
+    if client is None:
+        return
+    try:
+        await client.generate(
+            model=OLLAMA_ANALYSIS_MODEL, prompt="", keep_alive=OLLAMA_KEEP_ALIVE
+        )
+    except Exception as exc:
+        logging.warning(
+            "No se pudo precargar el modelo %s: %s", OLLAMA_ANALYSIS_MODEL, exc
+        )
+
+
+def _get_limiter() -> AsyncLimiter:
+    """Return the OLLAMA_RPS token bucket for the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _limiters:
+        _limiters[loop] = AsyncLimiter(OLLAMA_RPS, 1)
+    return _limiters[loop]
+
+
+async def _run_single(func, *args) -> str:
+    """Run one async Ollama helper with its own client."""
+    return await func(_create_client(), asyncio.Semaphore(1), *args)
+
+
+def _create_client():
+    """Create an Ollama async client, or None if Ollama is missing."""
+    if ollama is None:
+        return None
+    return ollama.AsyncClient()
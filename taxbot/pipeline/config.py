@@ -15,8 +15,27 @@ DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 CSV_PATH = DATA_DIR / "conceptos_dian.csv"
 LOG_PATH = DATA_DIR / "dian_pipeline.log"
+LLM_CACHE_PATH = DATA_DIR / "llm_cache.sqlite"
 
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3")
+# Summaries are short and forgiving, so they use a fast Q4_K_M quant;
+# the analysis keeps the more accurate Q8_0 quant. An explicit OLLAMA_MODEL
+# still pins both, as it did before the split.
+OLLAMA_SUMMARY_MODEL = os.getenv(
+    "OLLAMA_SUMMARY_MODEL",
+    os.getenv("OLLAMA_MODEL", "llama3:8b-instruct-q4_K_M"),
+)
+OLLAMA_ANALYSIS_MODEL = os.getenv(
+    "OLLAMA_ANALYSIS_MODEL",
+    os.getenv("OLLAMA_MODEL", "llama3:8b-instruct-q8_0"),
+)
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+OLLAMA_RPS = int(os.getenv("OLLAMA_RPS", "4"))
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+OLLAMA_BATCH_SIZE = max(1, int(os.getenv("OLLAMA_BATCH_SIZE", "8")))
+OLLAMA_NUM_PREDICT = int(os.getenv("OLLAMA_NUM_PREDICT", "1200"))
+# Prompt budget in tokens (about the previous 12000-character cut).
+OLLAMA_PROMPT_TOKENS = int(os.getenv("OLLAMA_PROMPT_TOKENS", "3000"))
 EMAIL_SENDER = os.getenv("DIAN_EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("DIAN_EMAIL_PASSWORD")
 EMAIL_RECIPIENTS = [
@@ -22,7 +22,14 @@ def load_existing_records() -> pd.DataFrame:
         return pd.DataFrame(columns=columns)
 
     try:
-        return pd.read_csv(CSV_PATH)
+        # Read every column as plain strings: skips per-column type
+        # inference and NaN handling, which the merge step redoes anyway.
+        return pd.read_csv(
+            CSV_PATH,
+            usecols=lambda column: column in columns,
+            dtype=str,
+            keep_default_na=False,
+        )
     except Exception as exc:
         logging.error("No se pudo leer %s: %s", CSV_PATH, exc)
         return pd.DataFrame(columns=columns)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import smtplib
 from datetime import datetime
@@ -15,6 +16,8 @@ from typing import List
 from .config import EMAIL_PASSWORD, EMAIL_RECIPIENTS, EMAIL_SENDER
 from .models import Concept
 
+_CONCEPT_LINE = "- {date} | {theme} | {title}\n"
+
 
 def send_email(csv_path: Path, new_concepts: List[Concept]) -> None:
     """Send email notification with new concepts."""
@@ -48,21 +51,24 @@ def _build_email_message(concepts: List[Concept]) -> MIMEMultipart:
         f"{datetime.utcnow().strftime('%Y-%m-%d')}"
     )
 
-    body_lines = _build_email_body(concepts)
-    msg.attach(MIMEText("\n".join(body_lines), "plain"))
+    msg.attach(MIMEText(_build_email_body(concepts), "plain"))
 
     return msg
 
 
-def _build_email_body(concepts: List[Concept]) -> List[str]:
-    """Build email body lines."""
-    lines = ["Resumen de nuevos conceptos DIAN:"]
+def _build_email_body(concepts: List[Concept]) -> str:
+    """Build the email body in a single text buffer."""
+    buffer = io.StringIO()
+    write = buffer.write
+    write("Resumen de nuevos conceptos DIAN:\n")
     for concept in concepts:
-        date_str = concept.date.strftime("%Y-%m-%d")
-        lines.append(f"- {date_str} | {concept.theme} | {concept.title}")
-    lines.append("")
-    lines.append("Se adjunta archivo con detalles, resumenes y analisis.")
-    return lines
+        write(_CONCEPT_LINE.format_map({
+            "date": concept.date.strftime("%Y-%m-%d"),
+            "theme": concept.theme,
+            "title": concept.title,
+        }))
+    write("\nSe adjunta archivo con detalles, resumenes y analisis.")
+    return buffer.getvalue()
 
 
 def _attach_csv_file(msg: MIMEMultipart, csv_path: Path) -> None:
@@ -0,0 +1,46 @@
+"""Persistent SQLite cache for Ollama responses."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from typing import Optional
+
+from .config import LLM_CACHE_PATH
+
+_connection: Optional[sqlite3.Connection] = None
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Build the cache key for a model/prompt pair."""
+    return hashlib.sha256((model + prompt).encode("utf-8")).hexdigest()
+
+
+def get_cached_response(model: str, prompt: str) -> Optional[str]:
+    """Return the cached response for a prompt, if any."""
+    row = _get_connection().execute(
+        "SELECT v FROM cache WHERE k = ?", (cache_key(model, prompt),)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def store_response(model: str, prompt: str, response: str) -> None:
+    """Persist a model response for later runs."""
+    connection = _get_connection()
+    connection.execute(
+        "INSERT OR REPLACE INTO cache (k, v) VALUES (?, ?)",
+        (cache_key(model, prompt), response),
+    )
+    connection.commit()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database on first use."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT)"
+        )
+    return _connection
@@ -0,0 +1,87 @@
+"""Prompt templates for the Ollama processing steps."""
+
+from __future__ import annotations
+
+import json
+from typing import List, Optional
+
+from .models import Concept
+
+
+def summary_prompt(text: str) -> str:
+    """Build the summarization prompt."""
+    return (
+        "Eres un abogado tributarista. Resume el siguiente concepto de la "
+        "DIAN en un maximo de 6 frases, destacando implicaciones practicas, "
+        "cambios normativos, obligaciones y recomendaciones para clientes. "
+        "Texto: " + text
+    )
+
+
+def analysis_prompt(summary: str, concept: Concept) -> str:
+    """Build the complementary analysis prompt."""
+    return (
+        "Actua como consultor tributario senior. Con base en el siguiente "
+        "resumen y la informacion del concepto, identifica riesgos, "
+        "oportunidades, acciones sugeridas y normas relacionadas. \n"
+        f"Resumen: {summary}\n"
+        f"Tema: {concept.theme}\n"
+        f"Descriptor: {concept.descriptor}"
+    )
+
+
+def combined_prompt(text: str, concept: Concept) -> str:
+    """Build one prompt asking for both the summary and the analysis."""
+    return (
+        "Eres un abogado y consultor tributario senior. Devuelve un objeto "
+        "JSON con las claves \"resumen\" y \"analisis\". En \"resumen\" "
+        "resume el concepto de la DIAN en un maximo de 6 frases, destacando "
+        "implicaciones practicas, cambios normativos, obligaciones y "
+        "recomendaciones para clientes. En \"analisis\" identifica riesgos, "
+        "oportunidades, acciones sugeridas y normas relacionadas.\n"
+        f"Titulo: {concept.title}\n"
+        f"Tema: {concept.theme}\n"
+        f"Descriptor: {concept.descriptor}\n"
+        f"Texto: {text}"
+    )
+
+
+def batch_prompt(prompts: List[str]) -> str:
+    """Join several prompts into one request answered as a JSON list."""
+    blocks = "\n\n".join(
+        f"### CONCEPTO {index} ###\n{prompt}"
+        for index, prompt in enumerate(prompts, start=1)
+    )
+    return (
+        f"Responde por separado cada uno de los {len(prompts)} bloques "
+        "siguientes. Devuelve un objeto JSON con la clave \"respuestas\": "
+        "una lista de respuestas en el mismo orden de los bloques.\n\n"
+        + blocks
+    )
+
+
+def is_fused_answer(answer) -> bool:
+    """Check that a fused reply carries both expected keys."""
+    return (
+        isinstance(answer, dict) and "resumen" in answer and "analisis" in answer
+    )
+
+
+def parse_fused_reply(content: str) -> Optional[dict]:
+    """Decode a fused reply, or None unless it is JSON with both keys."""
+    try:
+        answer = json.loads(content)
+    except ValueError:
+        return None
+    return answer if is_fused_answer(answer) else None
+
+
+def parse_batch_reply(content: str, count: int) -> Optional[List[dict]]:
+    """Split a batch reply into ``count`` answers, or None if malformed."""
+    try:
+        answers = json.loads(content)["respuestas"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(answers, list) or len(answers) != count:
+        return None
+    return answers
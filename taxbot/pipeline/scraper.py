@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urljoin
@@ -12,6 +13,8 @@ from bs4 import BeautifulSoup
 from .config import BASE_URL, LIST_URL, session
 from .models import Concept
 
+_LABEL_PATTERN = re.compile(r"tema|descriptor", re.IGNORECASE)
+
 
 def clean_text(value: str) -> str:
     """Clean and normalize text."""
@@ -78,17 +81,18 @@ def extract_theme_descriptor(cell: BeautifulSoup) -> tuple[str, str]:
     descriptor_parts: List[str] = []
 
     for text in paragraphs:
-        lower = text.lower()
-        if "tema" in lower:
-            candidate = strip_label(text, "tema")
-            if candidate:
-                theme = candidate
-        elif "descriptor" in lower:
-            candidate = strip_label(text, "descriptor")
-            if candidate:
-                descriptor_parts.append(candidate)
-        else:
+        match = _LABEL_PATTERN.search(text)
+        if not match:
             descriptor_parts.append(text)
+            continue
+
+        candidate = clean_text(text[match.end():].lstrip(": "))
+        if not candidate:
+            continue
+        if match.group().lower() == "tema":
+            theme = candidate
+        else:
+            descriptor_parts.append(candidate)
 
     descriptor = " ".join(part for part in descriptor_parts if part).strip()
     return theme, descriptor
@@ -0,0 +1,40 @@
+"""Token-based truncation of prompt text."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
+from .config import OLLAMA_PROMPT_TOKENS
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:
+    tiktoken = None
+
+# Rough characters-per-token ratio used when tiktoken is unavailable.
+CHARS_PER_TOKEN = 4
+
+
+def truncate_to_tokens(text: str, budget: int = OLLAMA_PROMPT_TOKENS) -> str:
+    """Cut text to at most ``budget`` tokens."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[: budget * CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= budget:
+        return text
+    return encoding.decode(tokens[:budget])
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer once; cl100k_base is close enough for llama3."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:
+        logging.warning("No se pudo cargar tiktoken: %s", exc)
+        return None
@@ -11,6 +11,7 @@ from taxbot.api.app import create_app
 from taxbot.core.config import Settings
 from taxbot.models.concept import Concept
 from taxbot.storage.csv_repository import CsvRepository
+from taxbot.storage.sqlite_repository import SqliteRepository
 
 
 @pytest.fixture
@@ -60,6 +61,13 @@ def test_repository(temp_dir: Path) -> CsvRepository:
     return CsvRepository(csv_path)
 
 
+@pytest.fixture
+def sqlite_repository(temp_dir: Path) -> SqliteRepository:
+    """Create SQLite test repository."""
+    db_path = temp_dir / "test_concepts.db"
+    return SqliteRepository(db_path)
+
+
 @pytest.fixture
 def test_app(test_settings: Settings):
     """Create test FastAPI app."""
@@ -67,6 +75,10 @@ def test_app(test_settings: Settings):
     import taxbot.core.config
     taxbot.core.config.settings = test_settings
     
+    # Start from empty response caches so tests do not see stale data
+    from taxbot.core.cache import invalidate_concepts_cache
+    invalidate_concepts_cache()
+    
     app = create_app()
     return app
 
@@ -77,6 +89,13 @@ def test_client(test_app):
     return TestClient(test_app)
 
 
+@pytest.fixture
+def live_client(test_app) -> Generator[TestClient, None, None]:
+    """Create test client with the app lifespan (repository, workers) running."""
+    with TestClient(test_app) as client:
+        yield client
+
+
 @pytest.fixture
 def sample_concepts() -> list[Concept]:
     """Create sample concepts for testing."""
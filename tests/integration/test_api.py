@@ -101,6 +101,20 @@ def test_admin_scrape_authorized(test_client: TestClient):
     assert response.status_code in [200, 409]  # 409 if already running
 
 
+def test_admin_scrape_wrong_api_key(live_client: TestClient):
+    """Test admin scrape endpoint rejects a wrong API key."""
+    headers = {"X-API-Key": "wrong_key"}
+    response = live_client.post("/api/v1/admin/scrape", headers=headers)
+    assert response.status_code == 401
+
+
+def test_admin_scrape_non_ascii_api_key(live_client: TestClient):
+    """Test a non-ASCII API key is rejected instead of erroring."""
+    headers = {"X-API-Key": "cl\xc3\xa9".encode("latin-1")}
+    response = live_client.post("/api/v1/admin/scrape", headers=headers)
+    assert response.status_code == 401
+
+
 def test_admin_reprocess_unauthorized(test_client: TestClient):
     """Test admin reprocess endpoint without API key."""
     response = test_client.post("/api/v1/admin/reprocess")
@@ -129,3 +143,84 @@ def test_admin_backup_authorized(test_client: TestClient):
     data = response.json()
     assert "message" in data
     assert "backup_path" in data
+
+
+def _write_from_other_process(csv_path, link: str) -> None:
+    """Append a row the way another process would, without clearing caches."""
+    with open(csv_path, "a", encoding="utf-8") as handle:
+        handle.write(f"Concept 3,2025-01-03,IVA,,{link},,\n")
+
+
+def test_latest_concepts_see_writes_from_other_processes(
+    live_client: TestClient, test_settings, sample_concepts
+):
+    """Test cached reads follow the data version, not only in-process saves."""
+    repo = live_client.app.state.repository
+    repo.save_concepts(sample_concepts)
+
+    first = live_client.get("/api/v1/concepts/latest")
+    assert len(first.json()) == 2
+
+    _write_from_other_process(repo.csv_path, "https://example.com/concept3")
+
+    second = live_client.get("/api/v1/concepts/latest")
+    assert len(second.json()) == 3
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+    listing = live_client.get("/api/v1/concepts", params={"limit": 10})
+    assert len(listing.json()) == 3
+
+
+def test_conditional_get_etag(live_client: TestClient, sample_concepts):
+    """Test If-None-Match returns 304 until the data changes."""
+    repo = live_client.app.state.repository
+    repo.save_concepts(sample_concepts)
+
+    response = live_client.get("/api/v1/concepts/latest")
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert "Last-Modified" in response.headers
+
+    not_modified = live_client.get(
+        "/api/v1/concepts/latest", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    _write_from_other_process(repo.csv_path, "https://example.com/concept3")
+
+    changed = live_client.get(
+        "/api/v1/concepts/latest", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert len(changed.json()) == 3
+    assert changed.headers["ETag"] != etag
+
+
+def test_conditional_get_wildcard_missing_concept(live_client: TestClient, sample_concepts):
+    """Test If-None-Match: * still reports a missing concept as 404."""
+    live_client.app.state.repository.save_concepts(sample_concepts)
+
+    response = live_client.get(
+        "/api/v1/concepts/missing-id", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 404
+
+
+def test_conditional_get_if_modified_since(live_client: TestClient, sample_concepts):
+    """Test If-Modified-Since is honoured when no ETag is sent."""
+    live_client.app.state.repository.save_concepts(sample_concepts)
+
+    response = live_client.get("/api/v1/concepts/themes")
+    since = response.headers["Last-Modified"]
+
+    cached = live_client.get(
+        "/api/v1/concepts/themes", headers={"If-Modified-Since": since}
+    )
+    assert cached.status_code == 304
+
+    stale = live_client.get(
+        "/api/v1/concepts/themes",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+    assert stale.status_code == 200
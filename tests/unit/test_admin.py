@@ -0,0 +1,28 @@
+"""Unit tests for the admin scrape trigger."""
+
+from fastapi.testclient import TestClient
+
+HEADERS = {"X-API-Key": "test_api_key"}
+
+
+def test_scrape_conflict_while_running(live_client: TestClient):
+    """Test a second trigger gets 409 and queues nothing while a scrape runs."""
+    state = live_client.app.state
+    state.scrape_status.is_running = True
+    state.scrape_status.errors = ["from the running scrape"]
+
+    response = live_client.post("/api/v1/admin/scrape", headers=HEADERS)
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Scraping is already running"
+    assert state.scrape_queue.empty()
+    assert state.scrape_status.errors == ["from the running scrape"]
+
+
+def test_scrape_conflict_checked_after_api_key(live_client: TestClient):
+    """Test an unauthenticated caller cannot probe the running state."""
+    live_client.app.state.scrape_status.is_running = True
+
+    response = live_client.post("/api/v1/admin/scrape")
+
+    assert response.status_code == 401
@@ -0,0 +1,92 @@
+"""Unit tests for the AI result cache and its use by the processor."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from taxbot.models.concept import Concept
+from taxbot.processors.ai_cache import AiResultCache
+from taxbot.processors.ollama_processor import (
+    ANALYSIS_ERROR,
+    SUMMARY_ERROR,
+    OllamaProcessor,
+)
+
+TAX_TEXT = "Concepto DIAN sobre el impuesto sobre las ventas IVA y la factura electronica."
+
+
+@pytest.fixture
+def tax_concept(test_concept: Concept) -> Concept:
+    """Create a concept whose text passes the tax relevance gate."""
+    return test_concept.copy(update={"full_text": TAX_TEXT, "summary": None, "analysis": None})
+
+
+@pytest.fixture
+def processor(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> OllamaProcessor:
+    """Create a processor with a temporary cache and a reachable server."""
+    processor = OllamaProcessor()
+    processor._cache = AiResultCache(temp_dir / "ai_cache.sqlite")
+    monkeypatch.setattr(processor, "is_available", lambda: True)
+    return processor
+
+
+def test_cache_round_trip_ignores_whitespace(temp_dir: Path, tax_concept: Concept):
+    """Test a stored result is reused for the same text reformatted."""
+    cache = AiResultCache(temp_dir / "ai_cache.sqlite")
+    tax_concept.summary, tax_concept.analysis = "Resumen", "Analisis"
+    cache.store(tax_concept)
+
+    repost = tax_concept.copy(update={
+        "link": "https://example.com/repost",
+        "full_text": "  " + TAX_TEXT.replace(" ", "\n "),
+        "summary": None,
+        "analysis": None,
+    })
+    assert cache.apply(repost) is True
+    assert (repost.summary, repost.analysis) == ("Resumen", "Analisis")
+
+    other = tax_concept.copy(update={"full_text": TAX_TEXT + " Renta.", "summary": None})
+    assert cache.apply(other) is False
+    assert other.summary is None
+
+
+def test_cache_hit_skips_model(processor: OllamaProcessor, tax_concept: Concept, monkeypatch: pytest.MonkeyPatch):
+    """Test a cached concept is filled in without calling the model."""
+    replies = iter(['{"summary": "Resumen", "analysis": "Analisis"}'])
+    monkeypatch.setattr(processor, "_chat", lambda *args: next(replies))
+    processor._process_concept(tax_concept)
+
+    again = tax_concept.copy(update={"summary": None, "analysis": None})
+    processor._process_concept(again)  # A second model call would raise
+
+    assert (again.summary, again.analysis) == ("Resumen", "Analisis")
+
+
+def test_failure_fallbacks_are_not_cached(processor: OllamaProcessor, tax_concept: Concept, monkeypatch: pytest.MonkeyPatch):
+    """Test error texts are returned but never stored as results."""
+    def fail(*args):
+        raise RuntimeError("Ollama down")
+
+    monkeypatch.setattr(processor, "_chat", fail)
+    processor._process_concept(tax_concept)
+
+    assert (tax_concept.summary, tax_concept.analysis) == (SUMMARY_ERROR, ANALYSIS_ERROR)
+    retry = tax_concept.copy(update={"summary": None, "analysis": None})
+    assert processor._cache.apply(retry) is False
+
+
+def test_batch_scales_output_budget(processor: OllamaProcessor, tax_concept: Concept, monkeypatch: pytest.MonkeyPatch):
+    """Test a batch request raises num_predict by the number of concepts."""
+    sent = []
+
+    async def fake_generate(client, prompt, options, fallback, response_format=""):
+        sent.append(options)
+        return fallback
+
+    monkeypatch.setattr(processor, "_agenerate", fake_generate)
+    group = [tax_concept, tax_concept.copy(update={"link": "https://example.com/2"})]
+    asyncio.run(processor._aprocess_group(None, asyncio.Semaphore(1), group))
+
+    assert sent[0]["num_predict"] == 2 * OllamaProcessor.COMBINED_OPTIONS["num_predict"]
+    assert OllamaProcessor.COMBINED_OPTIONS["num_predict"] == 1300
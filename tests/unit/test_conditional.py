@@ -0,0 +1,150 @@
+"""Unit tests for conditional GET handling."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from taxbot.api.conditional import _parse_http_date, conditional_get
+
+MODIFIED = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+
+class _VersionedRepository:
+    """Repository stand-in exposing only a fixed data version."""
+
+    def __init__(self, tag: str, modified):
+        """Initialize with the version to report."""
+        self.version = (tag, modified)
+        self.reads = 0
+
+    def get_version(self):
+        """Return the configured version."""
+        return self.version
+
+
+@pytest.fixture
+def conditional_app():
+    """Create an app with the conditional middleware over one counted route."""
+    app = FastAPI()
+    app.state.repository = _VersionedRepository("abc123", MODIFIED)
+    app.middleware("http")(conditional_get)
+
+    @app.get("/api/v1/concepts")
+    def list_concepts():
+        app.state.repository.reads += 1
+        return {"concepts": []}
+
+    @app.get("/api/v1/concepts/{concept_id}")
+    def get_concept(concept_id: str, limit: int = 10):
+        app.state.repository.reads += 1
+        if concept_id != "known":
+            raise HTTPException(status_code=404, detail="Concept not found")
+        return {"link": concept_id}
+
+    @app.get("/api/v1/health")
+    def health():
+        return {"status": "ok"}
+
+    return app
+
+
+def test_first_get_sets_validators(conditional_app: FastAPI):
+    """Test a plain GET returns 200 with ETag and Last-Modified."""
+    response = TestClient(conditional_app).get("/api/v1/concepts")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == 'W/"abc123"'
+    assert response.headers["last-modified"] == "Thu, 02 Jan 2025 03:04:05 GMT"
+
+
+@pytest.mark.parametrize("if_none_match", ['W/"abc123"', '"x", W/"abc123"'])
+def test_matching_etag_returns_304_without_reading(conditional_app: FastAPI, if_none_match: str):
+    """Test a matching If-None-Match skips the route entirely."""
+    response = TestClient(conditional_app).get(
+        "/api/v1/concepts", headers={"If-None-Match": if_none_match}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"abc123"'
+    assert conditional_app.state.repository.reads == 0
+
+
+@pytest.mark.parametrize(
+    "path, status",
+    [
+        ("/api/v1/concepts/known", 304),
+        ("/api/v1/concepts/missing", 404),
+        ("/api/v1/concepts/known?limit=many", 422),
+    ],
+)
+def test_wildcard_etag_defers_to_route(conditional_app: FastAPI, path: str, status: int):
+    """Test If-None-Match: * answers 304 only when the resource exists."""
+    response = TestClient(conditional_app).get(path, headers={"If-None-Match": "*"})
+
+    assert response.status_code == status
+    assert ("etag" in response.headers) == (status == 304)
+
+
+def test_stale_etag_returns_200(conditional_app: FastAPI):
+    """Test an old ETag gets the fresh body, even with a recent date."""
+    response = TestClient(conditional_app).get(
+        "/api/v1/concepts",
+        headers={
+            "If-None-Match": 'W/"old"',
+            "If-Modified-Since": format_datetime(
+                MODIFIED + timedelta(days=1), usegmt=True
+            ),
+        },
+    )
+
+    assert response.status_code == 200
+    assert conditional_app.state.repository.reads == 1
+
+
+@pytest.mark.parametrize(
+    "delta, status",
+    [(timedelta(0), 304), (timedelta(days=1), 304), (timedelta(seconds=-1), 200)],
+)
+def test_if_modified_since(conditional_app: FastAPI, delta: timedelta, status: int):
+    """Test If-Modified-Since compares at whole-second resolution."""
+    since = format_datetime(MODIFIED.replace(microsecond=0) + delta, usegmt=True)
+    response = TestClient(conditional_app).get(
+        "/api/v1/concepts", headers={"If-Modified-Since": since}
+    )
+
+    assert response.status_code == status
+
+
+def test_empty_repository_ignores_if_modified_since(conditional_app: FastAPI):
+    """Test a repository without data never answers 304 by date."""
+    conditional_app.state.repository.version = ("empty", None)
+    response = TestClient(conditional_app).get(
+        "/api/v1/concepts",
+        headers={"If-Modified-Since": "Thu, 02 Jan 2025 03:04:05 GMT"},
+    )
+
+    assert response.status_code == 200
+    assert "last-modified" not in response.headers
+
+
+def test_other_paths_are_not_conditional(conditional_app: FastAPI):
+    """Test endpoints outside the concept reads get no validators."""
+    response = TestClient(conditional_app).get(
+        "/api/v1/health", headers={"If-None-Match": "*"}
+    )
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_parse_http_date():
+    """Test HTTP dates parse as UTC and malformed values are ignored."""
+    expected = MODIFIED.replace(microsecond=0)
+    assert _parse_http_date("Thu, 02 Jan 2025 03:04:05 GMT") == expected
+    assert _parse_http_date("Thu, 02 Jan 2025 03:04:05 -0000").tzinfo is not None
+    assert _parse_http_date("yesterday") is None
+    assert _parse_http_date("") is None
+    assert _parse_http_date(None) is None
@@ -0,0 +1,43 @@
+"""Unit tests for settings parsing."""
+
+import pytest
+from pydantic import ValidationError
+
+from taxbot.core.config import Settings
+
+
+def _settings(**kwargs) -> Settings:
+    """Build settings with the required secrets filled in."""
+    return Settings(jwt_secret_key="test_secret_key", api_key="test_api_key", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "a@example.com,b@example.com",
+        " a@example.com , b@example.com ,",
+        "Ana <a@example.com>, \"Perez, Bruno\" <b@example.com>",
+        ["a@example.com", "Bruno <b@example.com>"],
+    ],
+)
+def test_email_recipients_parsing(value):
+    """Test comma-separated and display-name recipients reduce to addresses."""
+    settings = _settings(email_recipients=value)
+    assert settings.email_recipients == ("a@example.com", "b@example.com")
+
+
+def test_email_recipients_from_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test the environment variable is parsed as text, not JSON."""
+    monkeypatch.setenv("DIAN_EMAIL_RECIPIENTS", "Ana <a@example.com>, b@example.com")
+    assert _settings().email_recipients == ("a@example.com", "b@example.com")
+
+
+def test_email_recipients_empty():
+    """Test an empty value gives no recipients."""
+    assert _settings(email_recipients="").email_recipients == ()
+
+
+def test_email_recipients_invalid():
+    """Test an entry without an address is rejected."""
+    with pytest.raises(ValidationError):
+        _settings(email_recipients="a@example.com, not-an-address")
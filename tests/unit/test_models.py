@@ -89,6 +89,22 @@ def test_concept_from_record():
     assert concept.analysis == "Test analysis"
 
 
+@pytest.mark.parametrize("missing", [None, "", float("nan")])
+def test_concept_from_record_missing_date(missing):
+    """Test records without a usable date get the placeholder date."""
+    record = {"title": "Test", "date": missing, "link": "https://example.com/test"}
+
+    assert Concept.from_record(record).date == datetime(1900, 1, 1)
+
+
+def test_concept_from_record_nat_date():
+    """Test a NaT date from a dataframe row counts as missing."""
+    pd = pytest.importorskip("pandas")
+    record = {"title": "Test", "date": pd.NaT, "link": "https://example.com/test"}
+
+    assert Concept.from_record(record).date == datetime(1900, 1, 1)
+
+
 def test_concept_has_ai_content():
     """Test AI content detection."""
     concept_with_ai = Concept(
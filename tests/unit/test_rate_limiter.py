@@ -0,0 +1,76 @@
+"""Unit tests for the adaptive scrape rate limiter."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from taxbot.scrapers.rate_limiter import AdaptiveLimiter, retry_after_seconds
+
+
+def test_throttled_halves_limit_once_per_round():
+    """Test throttles from requests begun before a cut do not cut again."""
+    limiter = AdaptiveLimiter(max_limit=8)
+    started = time.monotonic()
+
+    limiter.throttled(started)
+    limiter.throttled(started)
+    assert limiter.limit == 4
+
+    limiter.throttled(time.monotonic())
+    assert limiter.limit == 2
+
+
+def test_throttled_never_drops_below_one():
+    """Test repeated throttles keep at least one request slot."""
+    limiter = AdaptiveLimiter(max_limit=2)
+    for _ in range(5):
+        limiter.throttled(time.monotonic())
+
+    assert limiter.limit == 1
+
+
+def test_success_grows_additively_up_to_max():
+    """Test each success adds 1 / limit and the limit stays capped."""
+    limiter = AdaptiveLimiter(max_limit=4)
+    limiter.throttled(time.monotonic())
+    assert limiter.limit == 2
+
+    limiter.success()
+    assert limiter.limit == pytest.approx(2.5)
+
+    for _ in range(20):
+        limiter.success()
+    assert limiter.limit == 4
+
+
+def test_throttled_retry_after_delays_next_slot():
+    """Test a Retry-After pause is recorded for requests not yet started."""
+    limiter = AdaptiveLimiter(max_limit=4)
+    before = time.monotonic()
+    limiter.throttled(before, retry_after=30)
+
+    assert limiter._resume_at >= before + 30
+
+
+@pytest.mark.parametrize("value, expected", [("120", 120.0), (" 5 ", 5.0), ("0", 0.0)])
+def test_retry_after_seconds_delta(value: str, expected: float):
+    """Test Retry-After given as a number of seconds."""
+    assert retry_after_seconds({"Retry-After": value}) == expected
+
+
+def test_retry_after_seconds_http_date():
+    """Test Retry-After given as an HTTP date, clamped at zero when past."""
+    future = datetime.now(timezone.utc) + timedelta(seconds=90)
+    past = datetime.now(timezone.utc) - timedelta(seconds=90)
+
+    delay = retry_after_seconds({"Retry-After": format_datetime(future, usegmt=True)})
+    assert 80 < delay <= 90
+    assert retry_after_seconds({"Retry-After": format_datetime(past, usegmt=True)}) == 0
+
+
+@pytest.mark.parametrize("headers", [{}, {"Retry-After": ""}, {"Retry-After": "soon"}])
+def test_retry_after_seconds_missing_or_invalid(headers: dict):
+    """Test a missing or unparseable Retry-After yields None."""
+    assert retry_after_seconds(headers) is None
@@ -1,10 +1,15 @@
 """Unit tests for storage components."""
 
+from pathlib import Path
+
+import pandas as pd
 import pytest
 from datetime import datetime
 
-from taxbot.models.concept import Concept
+from taxbot.models.concept import Concept, ConceptSearchRequest
 from taxbot.storage.csv_repository import CsvRepository
+from taxbot.storage.link_filter import LinkBloomFilter, load_link_filter
+from taxbot.storage.sqlite_repository import SqliteRepository
 
 
 def test_csv_repository_creation(test_repository: CsvRepository):
@@ -41,6 +46,20 @@ def test_save_multiple_concepts(test_repository: CsvRepository, sample_concepts:
     assert len(concepts) == 2
 
 
+def test_save_appends_and_updates(test_repository: CsvRepository, sample_concepts: list[Concept]):
+    """Test that new concepts are appended and existing ones replaced."""
+    test_repository.save_concepts(sample_concepts[:1])
+    test_repository.save_concepts(sample_concepts[1:])
+    assert test_repository.get_concept_count() == len(sample_concepts)
+    
+    updated = sample_concepts[0].copy(update={"summary": "Updated summary"})
+    test_repository.save_concept(updated)
+    
+    assert test_repository.get_concept_count() == len(sample_concepts)
+    stored = pd.read_csv(test_repository.csv_path)
+    assert stored.loc[stored["link"] == updated.link, "summary"].tolist() == ["Updated summary"]
+
+
 def test_concept_exists(test_repository: CsvRepository, test_concept: Concept):
     """Test concept existence check."""
     # Concept should not exist initially
@@ -53,6 +72,16 @@ def test_concept_exists(test_repository: CsvRepository, test_concept: Concept):
     assert test_repository.concept_exists(test_concept.link) is True
 
 
+def test_get_existing_links(test_repository: CsvRepository, test_concept: Concept):
+    """Test batch lookup of already stored links."""
+    candidates = [test_concept.link, "https://example.com/new"]
+    assert test_repository.get_existing_links(candidates) == set()
+    
+    test_repository.save_concept(test_concept)
+    
+    assert test_repository.get_existing_links(candidates) == {test_concept.link}
+
+
 def test_get_concepts_with_filtering(test_repository: CsvRepository, sample_concepts: list[Concept]):
     """Test getting concepts with filtering."""
     # Save concepts
@@ -133,3 +162,224 @@ def test_backup_and_restore(test_repository: CsvRepository, test_concept: Concep
     restored = test_repository.get_concept_by_id(test_concept.link)
     assert restored is not None
     assert restored.title == test_concept.title
+
+
+def test_sqlite_save_and_get_concept(sqlite_repository: SqliteRepository, test_concept: Concept):
+    """Test saving and retrieving a concept with the SQLite repository."""
+    sqlite_repository.save_concept(test_concept)
+    sqlite_repository.save_concept(test_concept)
+
+    assert sqlite_repository.get_concept_count() == 1
+
+    retrieved = sqlite_repository.get_concept_by_id(test_concept.link)
+    assert retrieved is not None
+    assert retrieved.title == test_concept.title
+    assert retrieved.date == test_concept.date
+
+
+def test_sqlite_get_existing_links(sqlite_repository: SqliteRepository, sample_concepts: list[Concept]):
+    """Test indexed link lookups with the SQLite repository."""
+    sqlite_repository.save_concepts(sample_concepts)
+
+    links = [concept.link for concept in sample_concepts]
+    existing = sqlite_repository.get_existing_links(links + ["https://example.com/missing"])
+    assert existing == set(links)
+
+
+def test_sqlite_search_and_themes(sqlite_repository: SqliteRepository, sample_concepts: list[Concept]):
+    """Test searching and theme listing with the SQLite repository."""
+    sqlite_repository.save_concepts(sample_concepts)
+
+    request = ConceptSearchRequest(query="Test", limit=10, offset=0)
+    response = sqlite_repository.search_concepts(request)
+    assert response.total == 2
+    assert sqlite_repository.get_themes() == sorted({c.theme for c in sample_concepts})
+
+
+@pytest.mark.parametrize("query", ["Test", "descriptor 2", "ncep", "iva", "te", "no match", 'say "hi"'])
+def test_sqlite_fts_matches_like_search(sqlite_repository: SqliteRepository, sample_concepts: list[Concept], query: str):
+    """Test the full-text index returns what the LIKE scan returns."""
+    if not sqlite_repository._fts:
+        pytest.skip("SQLite built without FTS5 trigram support")
+    quoted = sample_concepts[0].copy(update={"link": "https://example.com/q", "summary": 'They say "hi"'})
+    sqlite_repository.save_concepts([*sample_concepts, quoted])
+    request = ConceptSearchRequest(query=query, limit=10, offset=0)
+
+    fts = sqlite_repository.search_concepts(request)
+    sqlite_repository._fts = False
+    like = sqlite_repository.search_concepts(request)
+
+    assert fts.total == like.total
+    assert [c.link for c in fts.concepts] == [c.link for c in like.concepts]
+
+
+def test_link_bloom_filter_round_trip(temp_dir: Path):
+    """Test Bloom filter membership survives save and load."""
+    bloom = LinkBloomFilter(capacity=100)
+    bloom.update(f"https://example.com/{i}" for i in range(50))
+
+    path = temp_dir / "links.bloom"
+    bloom.save(path)
+    loaded = LinkBloomFilter.load(path)
+
+    assert loaded.count == 50
+    assert all(f"https://example.com/{i}" in loaded for i in range(50))
+
+
+def test_load_link_filter_rebuilds_when_stale(test_repository: CsvRepository, sample_concepts: list[Concept], temp_dir: Path):
+    """Test the persisted link filter is rebuilt after the data changes."""
+    path = temp_dir / "links.bloom"
+    LinkBloomFilter(capacity=10).save(path)
+
+    test_repository.save_concepts(sample_concepts)
+    bloom = load_link_filter(test_repository, path)
+
+    assert bloom.count == len(sample_concepts)
+    assert all(concept.link in bloom for concept in sample_concepts)
+
+
+def test_load_link_filter_rebuilds_when_count_matches(test_repository: CsvRepository, sample_concepts: list[Concept], temp_dir: Path):
+    """Test a filter with the right count but older data is rebuilt."""
+    path = temp_dir / "links.bloom"
+    test_repository.save_concepts(sample_concepts[:1])
+    load_link_filter(test_repository, path).save(path)
+
+    test_repository.delete_concept(sample_concepts[0].link)
+    test_repository.save_concepts(sample_concepts[1:])
+    bloom = load_link_filter(test_repository, path)
+
+    assert bloom.version == test_repository.get_version()[0]
+    assert sample_concepts[1].link in bloom
+
+
+def test_load_link_filter_reuses_current_filter(test_repository: CsvRepository, sample_concepts: list[Concept], temp_dir: Path):
+    """Test a filter stamped with the current data version is loaded as is."""
+    path = temp_dir / "links.bloom"
+    test_repository.save_concepts(sample_concepts)
+    bloom = load_link_filter(test_repository, path)
+    bloom.add("https://example.com/only-in-filter")
+    bloom.save(path)
+
+    assert "https://example.com/only-in-filter" in load_link_filter(test_repository, path)
+
+
+def test_theme_index_tracks_appends_and_rewrites(test_repository: CsvRepository, sample_concepts: list[Concept]):
+    """Test theme index stays in sync across append and rewrite saves."""
+    test_repository.save_concepts(sample_concepts[:1])
+    test_repository.save_concepts(sample_concepts[1:])
+    assert test_repository.get_themes() == ["IVA", "Renta"]
+
+    iva_rows = test_repository.get_concepts_frame(limit=10, theme="iva")
+    assert iva_rows["link"].tolist() == [sample_concepts[0].link]
+
+    sample_concepts[0].theme = "Renta"
+    test_repository.save_concepts(sample_concepts[:1])
+    assert test_repository.get_themes() == ["Renta"]
+
+
+def _append_during_scan(monkeypatch, csv_path: Path):
+    """Make scan_rows append a row once it finishes; returns the original."""
+    import taxbot.storage.csv_index as csv_index
+
+    original = csv_index.scan_rows
+
+    def scan_then_append(path):
+        yield from original(path)
+        with open(csv_path, "a", encoding="utf-8") as handle:
+            handle.write("Late,2025-02-01,Aduanas,,https://example.com/late,,\n")
+
+    monkeypatch.setattr(csv_index, "scan_rows", scan_then_append)
+    return original
+
+
+def test_theme_index_rebuild_ignores_writes_during_scan(test_repository: CsvRepository, sample_concepts: list[Concept], monkeypatch):
+    """Test a rebuild racing a write is stamped stale, not current."""
+    import taxbot.storage.csv_index as csv_index
+
+    test_repository.save_concepts(sample_concepts)
+    original = _append_during_scan(monkeypatch, test_repository.csv_path)
+    assert test_repository._index.rebuild()[0] == ["IVA", "Renta"]
+
+    monkeypatch.setattr(csv_index, "scan_rows", original)
+    assert test_repository.get_themes() == ["Aduanas", "IVA", "Renta"]
+    assert not list(test_repository._index.index_dir.glob("*.tmp"))
+
+
+def test_latest_concepts_from_tail(test_repository: CsvRepository, sample_concepts: list[Concept]):
+    """Test latest concepts are served newest first from the tail file."""
+    test_repository.save_concepts(sample_concepts[:1])
+    test_repository.save_concepts(sample_concepts[1:])
+
+    latest = test_repository.get_latest_concepts(limit=1)
+    assert [c.link for c in latest] == [sample_concepts[1].link]
+    assert (test_repository.csv_path.parent / "indexes" / "latest_tail.jsonl").exists()
+
+
+def test_latest_tail_rebuild_ignores_writes_during_scan(test_repository: CsvRepository, sample_concepts: list[Concept], monkeypatch):
+    """Test a tail rebuild racing a write is stamped stale, not current."""
+    test_repository.save_concepts(sample_concepts)
+    tail = test_repository._tail
+    original_newest = tail._newest
+
+    def newest_then_append(records):
+        newest = original_newest(records)
+        with open(test_repository.csv_path, "a", encoding="utf-8") as handle:
+            handle.write("Late,2025-02-01,IVA,,https://example.com/late,,\n")
+        return newest
+
+    monkeypatch.setattr(tail, "_newest", newest_then_append)
+    assert len(tail.rebuild()) == 2
+    monkeypatch.undo()
+
+    latest = test_repository.get_latest_concepts(limit=1)
+    assert [c.link for c in latest] == ["https://example.com/late"]
+
+
+def test_get_concepts_after_keyset(test_repository: CsvRepository, sample_concepts: list[Concept]):
+    """Test keyset pagination walks concepts newest first."""
+    test_repository.save_concepts(sample_concepts)
+
+    first_page = test_repository.get_concepts_after(None, limit=1)
+    assert [c.link for c in first_page] == [sample_concepts[1].link]
+
+    cursor = (first_page[0].date.strftime("%Y-%m-%d"), first_page[0].link)
+    second_page = test_repository.get_concepts_after(cursor, limit=1)
+    assert [c.link for c in second_page] == [sample_concepts[0].link]
+    assert test_repository.get_concepts_after(("2025-01-01", sample_concepts[0].link)) == []
+
+
+def test_date_index_rebuild_ignores_writes_during_scan(test_repository: CsvRepository, sample_concepts: list[Concept], monkeypatch):
+    """Test a date index rebuild racing a write is stamped stale, not current."""
+    import taxbot.storage.csv_index as csv_index
+    import taxbot.storage.csv_keyset as csv_keyset
+
+    test_repository.save_concepts(sample_concepts)
+    original = _append_during_scan(monkeypatch, test_repository.csv_path)
+    monkeypatch.setattr(csv_keyset, "scan_rows", csv_index.scan_rows)
+    assert len(test_repository._dates.rebuild()) == 2
+
+    monkeypatch.setattr(csv_keyset, "scan_rows", original)
+    first_page = test_repository.get_concepts_after(None, limit=1)
+    assert [c.link for c in first_page] == ["https://example.com/late"]
+
+
+def test_undated_row_is_listed_and_paged(test_repository: CsvRepository, sample_concepts: list[Concept]):
+    """Test a CSV row with an empty date does not break listings or cursors."""
+    test_repository.save_concepts(sample_concepts)
+    with open(test_repository.csv_path, "a", encoding="utf-8") as handle:
+        handle.write("Undated,,IVA,,https://example.com/undated,,\n")
+
+    concepts = test_repository.get_concepts(limit=10)
+    undated = next(c for c in concepts if c.link == "https://example.com/undated")
+    assert undated.date == datetime(1900, 1, 1)
+
+    pages, cursor = [], None
+    while True:
+        page = test_repository.get_concepts_after(cursor, limit=1)
+        if not page:
+            break
+        pages.append(page[0].link)
+        cursor = (page[0].date.strftime("%Y-%m-%d"), page[0].link)
+    assert pages == [
+        sample_concepts[1].link, sample_concepts[0].link, "https://example.com/undated"
+    ]